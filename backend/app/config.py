@@ -19,6 +19,8 @@ class Settings(BaseSettings):
 
     # ── Database ─────────────────────────────────────────────
     DATABASE_URL: str = "sqlite:///./data/onboarding.db"
+    DB_POOL_SIZE: int = 20  # Pooled connections per process (PostgreSQL only)
+    DB_MAX_OVERFLOW: int = 40  # Extra connections allowed under bursts (PostgreSQL only)
 
     # ── Authentication ───────────────────────────────────────
     SECRET_KEY: str = "change-me-in-production-use-a-real-secret-key"
@@ -32,10 +34,22 @@ class Settings(BaseSettings):
     GROQ_MODEL: str = "llama-3.3-70b-versatile"
     LLM_PROVIDER: str = "openai"  # "openai", "anthropic", or "groq"
     OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-small"  # For RAG embeddings (fallback)
+    LLM_MAX_CONCURRENCY: int = 8  # In-flight requests per provider, per worker process
+    LLM_MAX_RETRIES: int = 4  # SDK retries with exponential backoff on 429 / connection errors
+    LLM_PROMPT_CACHE_TTL: str = ""  # Anthropic prompt-cache TTL for system prompt / policy context ("" = default 5m, or "1h")
+    MOCK_STREAM_DELAY_MS: int = 0  # Per-chunk delay for mock streaming (e.g. 30 for a typing effect in demos)
 
     # ── Embeddings (Voyage AI) ───────────────────────────────
     VOYAGE_API_KEY: str = ""
     VOYAGE_EMBEDDING_MODEL: str = "voyage-2"
+    VOYAGE_OUTPUT_DTYPE: str = "float"  # "float" or "int8" (voyage-3 family only; re-embed policies after changing)
+
+    # ── Background workflows ─────────────────────────────────
+    WORKFLOW_PROCESS_WORKERS: int = 0  # >0 runs workflows in a process pool (use PostgreSQL); 0 = API event loop
+
+    # ── Caching ──────────────────────────────────────────────
+    REDIS_URL: str = ""  # e.g. redis://localhost:6379/0 — shared LLM response cache (optional)
+    POLICY_CONTEXT_REFRESH_SECONDS: int = 3600  # Rebuild cached RAG prompt contexts (picks up other workers' policy edits)
 
     # ── Google OAuth ─────────────────────────────────────────
     GOOGLE_CLIENT_ID: str = ""
@@ -1,7 +1,8 @@
 # app/database.py
 """SQLAlchemy database engine, session, and Base for ORM models."""
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.config import settings
@@ -10,16 +11,37 @@ from app.config import settings
 # connect_args needed for SQLite to allow multi-thread access;
 # not needed (and unsupported) for PostgreSQL.
 _connect_args = {}
+_pool_args = {}
 if settings.DATABASE_URL.startswith("sqlite"):
     _connect_args["check_same_thread"] = False
+else:
+    # Sized so request sessions and background workflow runs (resumes
+    # after approval, SSE streams) reuse pooled connections under bursts.
+    _pool_args.update(pool_size=settings.DB_POOL_SIZE, max_overflow=settings.DB_MAX_OVERFLOW)
 
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args=_connect_args,
     echo=settings.DEBUG,
     pool_pre_ping=True,
+    # JSON columns (step results) round-trip through orjson
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+    **_pool_args,
 )
 
+# SQLite: WAL + synchronous=NORMAL — a commit appends to the write-ahead
+# log instead of fsyncing the database file (still safe against app
+# crashes), and readers no longer block the writer or vice versa.
+if settings.DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def _sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
 # ── Session factory ──────────────────────────────────────────
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -29,8 +51,15 @@ Base = declarative_base()
 
 # ── Dependency ───────────────────────────────────────────────
 def get_db():
-    """FastAPI dependency that yields a DB session and closes it after use."""
-    db = SessionLocal()
+    """FastAPI dependency that yields a DB session and closes it after use.
+
+    Request sessions keep attribute state across commit (all column defaults
+    are client-side), so returning a just-written object doesn't cost a
+    reload SELECT. Workflow run/stream sessions do the same (they commit
+    after every step) and refresh explicitly where they wait on other
+    sessions' writes.
+    """
+    db = SessionLocal(expire_on_commit=False)
     try:
         yield db
     finally:
@@ -1,6 +1,8 @@
 # app/main.py
 """FastAPI application entry point."""
 
+import asyncio
+import gc
 import os
 from contextlib import asynccontextmanager
 
@@ -17,9 +19,27 @@ from app.routers import jurisdictions, documents, approvals, chat, compliance
 
 
 # ── Lifespan (startup / shutdown) ───────────────────────────
+async def _refresh_policy_contexts() -> None:
+    """Warm the cached RAG prompt contexts, then rebuild them periodically."""
+    from app.services.orchestrator import warm_policy_contexts
+
+    refresh = False
+    while True:
+        try:
+            await asyncio.to_thread(warm_policy_contexts, refresh)
+        except Exception as e:
+            print(f"⚠️  Policy context warm-up failed: {e}")
+        refresh = True
+        await asyncio.sleep(settings.POLICY_CONTEXT_REFRESH_SECONDS)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Run on startup: create DB tables, ensure directories exist."""
+    # Let sync code paths schedule background work onto this loop
+    from app.services.approval import set_main_loop
+    set_main_loop(asyncio.get_running_loop())
+
     # Ensure data directories exist
     os.makedirs("data", exist_ok=True)
     os.makedirs("data/policies", exist_ok=True)
@@ -54,6 +74,14 @@ async def lifespan(app: FastAPI):
     else:
         print(f"🤖 LLM: Using {provider.upper()}")
 
+    # Build the shared policy contexts off the event loop so the first
+    # workflow doesn't wait on RAG queries
+    context_task = asyncio.create_task(_refresh_policy_contexts())
+
+    # Startup objects (settings, routers, seed data) are long-lived; move them
+    # to the permanent generation so later GC cycles don't rescan them
+    gc.freeze()
+
     print(f"🚀 {settings.APP_NAME} is running")
     print("📄 Test page: http://localhost:8000/test")
     print("📚 API docs:  http://localhost:8000/docs")
@@ -61,6 +89,11 @@ async def lifespan(app: FastAPI):
     yield  # App runs here
 
     print("👋 Shutting down...")
+    context_task.cancel()
+    from app.services.llm import shutdown_clients
+    from app.services import workflow_runner
+    workflow_runner.shutdown()
+    await shutdown_clients()
 
 
 # ── Create FastAPI app ──────────────────────────────────────
@@ -83,6 +116,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Keyset pagination cursors on list endpoints
+    expose_headers=["X-Next-Cursor", "X-Next-Cursor-Id"],
 )
 
 # ── Include routers ─────────────────────────────────────────
@@ -11,11 +11,17 @@ from sqlalchemy import (
     DateTime,
     Boolean,
     ForeignKey,
+    Index,
+    JSON,
     Enum as SAEnum,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator
 import enum
 
+import orjson
+
 from app.database import Base
 
 
@@ -112,6 +118,10 @@ class Employee(Base):
     """Employees being onboarded — imported via CSV or created manually."""
 
     __tablename__ = "employees"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at DESC, id DESC
+        Index("ix_employee_created_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
@@ -147,6 +157,40 @@ class Policy(Base):
     uploaded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
 
+class StepResultJSON(TypeDecorator):
+    """Step result payload: JSONB on PostgreSQL, JSON text elsewhere.
+
+    Databases created before results were stored as JSON keep their TEXT
+    column (create_all doesn't alter tables), so legacy rows may hold plain
+    text. Outside PostgreSQL the column is handled as Text and parsed here
+    (the JSON type's deserializer would fail on such rows before this hook
+    ran); PostgreSQL hands a TEXT column back as a string, parsed the same
+    way. Values that aren't a JSON object come back as {"content": value}.
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        return orjson.dumps(value).decode()
+
+    def process_result_value(self, value, dialect):
+        if isinstance(value, str):
+            try:
+                parsed = orjson.loads(value)
+            except orjson.JSONDecodeError:
+                parsed = None
+            return parsed if isinstance(parsed, dict) else {"content": value}
+        return value
+
+
 class OnboardingWorkflow(Base):
     """A single onboarding workflow instance for an employee."""
 
@@ -176,7 +220,7 @@ class OnboardingStep(Base):
     step_type = Column(SAEnum(StepType), nullable=False)
     step_order = Column(Integer, nullable=False)
     status = Column(SAEnum(StepStatus), default=StepStatus.PENDING, nullable=False)
-    result = Column(Text, nullable=True)  # JSON string of step output
+    result = Column(StepResultJSON, nullable=True)  # Step output payload
     error_message = Column(Text, nullable=True)
     requires_approval = Column(Boolean, default=False, nullable=False)
     approval_status = Column(String(50), nullable=True)
@@ -243,6 +287,11 @@ class ApprovalRequest(Base):
     """Human approval requests for AI-generated documents."""
 
     __tablename__ = "approval_requests"
+    __table_args__ = (
+        # Pending-approval checks per employee, and status lists ordered by recency
+        Index("ix_approval_employee_status", "employee_id", "status"),
+        Index("ix_approval_status_created", "status", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False)
@@ -285,6 +334,10 @@ class ChatMessage(Base):
     """A single message in a chat conversation."""
 
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # Recent-history lookups: WHERE conversation_id = ? ORDER BY created_at DESC LIMIT n
+        Index("ix_chat_message_conversation_created", "conversation_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     conversation_id = Column(Integer, ForeignKey("chat_conversations.id"), nullable=False)
@@ -318,3 +371,22 @@ class ComplianceItem(Base):
 
     # Relationships
     employee = relationship("Employee", back_populates="compliance_items")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# LLM Response Cache
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class LLMCacheEntry(Base):
+    """Persisted LLM response, keyed by the hash of (model, system prompt, context, prompt)."""
+
+    __tablename__ = "llm_cache"
+
+    prompt_hash = Column(String(64), primary_key=True)
+    provider = Column(String(20), nullable=False)
+    model_name = Column(String(100), nullable=False)
+    response_text = Column(Text, nullable=False)
+    latency_ms = Column(Integer, nullable=True)  # Provider latency of the original call
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
@@ -1,8 +1,10 @@
 # app/prompts/__init__.py
 """Prompt templates for LLM-powered onboarding document generation."""
 
+import functools
 import json
 import os
+import string
 from typing import Optional
 
 from app.prompts.templates import (
@@ -22,6 +24,7 @@ __all__ = [
     "EQUIPMENT_REQUEST_PROMPT",
     "PARSE_DATA_PROMPT",
     "get_template",
+    "render_template",
     "set_template",
     "get_all_overrides",
     "set_all_overrides",
@@ -46,20 +49,39 @@ _DEFAULTS: dict[str, str] = {
 }
 
 
+# (file mtime, parsed overrides) — re-read only when the file changes,
+# so edits from other worker processes are still picked up
+_overrides_cache: tuple[Optional[int], dict[str, str]] = (None, {})
+
+
 def _load_overrides() -> dict[str, str]:
-    """Load template overrides from disk."""
+    """Load template overrides from disk (cached until the file changes)."""
+    global _overrides_cache
+
+    try:
+        mtime = os.stat(_OVERRIDES_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    if _overrides_cache[0] == mtime:
+        return _overrides_cache[1]
+
     try:
         with open(_OVERRIDES_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+            overrides = json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
-        return {}
+        overrides = {}
+    _overrides_cache = (mtime, overrides)
+    return overrides
 
 
 def _save_overrides(overrides: dict[str, str]) -> None:
     """Persist template overrides to disk."""
+    global _overrides_cache
+
     os.makedirs(os.path.dirname(_OVERRIDES_FILE), exist_ok=True)
     with open(_OVERRIDES_FILE, "w", encoding="utf-8") as f:
         json.dump(overrides, f, indent=2)
+    _overrides_cache = (os.stat(_OVERRIDES_FILE).st_mtime_ns, dict(overrides))
 
 
 def get_template(key: str) -> str:
@@ -68,16 +90,45 @@ def get_template(key: str) -> str:
     return overrides.get(key, _DEFAULTS.get(key, ""))
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_template(template: str) -> Optional[tuple[tuple[str, Optional[str]], ...]]:
+    """Split *template* into (literal, field name) pairs, once per template text.
+
+    Returns None for templates that need full str.format semantics
+    (format specs, conversions, positional or dotted fields).
+    """
+    segments = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        segments.append((literal, field))
+    return tuple(segments)
+
+
+def render_template(template: str, **fields) -> str:
+    """Same result as template.format(**fields), without re-parsing the template.
+
+    Works for overrides too: each distinct template text is parsed once.
+    """
+    segments = _parse_template(template)
+    if segments is None:
+        return template.format(**fields)
+    return "".join([
+        literal + format(fields[field]) if field is not None else literal
+        for literal, field in segments
+    ])
+
+
 def set_template(key: str, prompt: str) -> None:
     """Save a single template override."""
-    overrides = _load_overrides()
+    overrides = dict(_load_overrides())
     overrides[key] = prompt
     _save_overrides(overrides)
 
 
 def get_all_overrides() -> dict[str, str]:
     """Return the full override dict (only keys that differ from default)."""
-    return _load_overrides()
+    return dict(_load_overrides())
 
 
 def set_all_overrides(templates: dict[str, str]) -> None:
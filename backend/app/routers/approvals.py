@@ -1,7 +1,9 @@
 # app/routers/approvals.py
 """Approval workflow routes — review and approve AI-generated documents."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status as http_status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -10,7 +12,7 @@ from app.schemas import ApprovalRequestResponse, ApprovalActionRequest
 from app.services.auth import get_current_user
 from app.services.approval import (
     get_all_approvals,
-    get_pending_approvals,
+    count_pending_approvals,
     get_approval_by_id,
     get_approvals_by_employee,
     approve_document,
@@ -23,7 +25,7 @@ router = APIRouter(prefix="/api/approvals", tags=["Approvals"])
 
 def _enrich_approval(approval: ApprovalRequest, db: Session) -> dict:
     """Add nested employee and document info to an approval response."""
-    employee = db.query(Employee).filter(Employee.id == approval.employee_id).first()
+    employee = db.get(Employee, approval.employee_id)
     document = db.query(GeneratedDocument).filter(GeneratedDocument.id == approval.document_id).first()
 
     return {
@@ -44,12 +46,30 @@ def _enrich_approval(approval: ApprovalRequest, db: Session) -> dict:
 
 @router.get("/", response_model=list[ApprovalRequestResponse])
 async def list_approvals(
+    response: Response,
     status: str | None = Query(None, description="Filter by status: pending, approved, rejected, revision_requested"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of approvals to return"),
+    cursor: datetime | None = Query(None, description="created_at of the last approval seen"),
+    cursor_id: int | None = Query(None, description="ID of the last approval seen (with cursor)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List all approval requests, optionally filtered by status."""
-    approvals = get_all_approvals(db, status_filter=status)
+    """List a page of approval requests (newest first), optionally filtered by status.
+
+    When more rows may follow, the X-Next-Cursor / X-Next-Cursor-Id headers
+    carry the cursor for the next page.
+    """
+    if (cursor is None) != (cursor_id is None):
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail="cursor and cursor_id must be provided together",
+        )
+    page_cursor = (cursor, cursor_id) if cursor is not None else None
+    approvals = get_all_approvals(db, status_filter=status, limit=limit, cursor=page_cursor)
+    if len(approvals) == limit:
+        last = approvals[-1]
+        response.headers["X-Next-Cursor"] = last.created_at.isoformat()
+        response.headers["X-Next-Cursor-Id"] = str(last.id)
     return [_enrich_approval(a, db) for a in approvals]
 
 
@@ -59,8 +79,7 @@ async def get_pending_count(
     current_user: User = Depends(get_current_user),
 ):
     """Get the count of pending approvals (for sidebar badge)."""
-    pending = get_pending_approvals(db)
-    return {"count": len(pending)}
+    return {"count": count_pending_approvals(db)}
 
 
 @router.get("/{approval_id}", response_model=ApprovalRequestResponse)
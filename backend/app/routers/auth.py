@@ -10,12 +10,14 @@ from app.schemas import (
     UserProfileUpdate, PasswordChange, MessageResponse, NotificationItem,
 )
 from app.services.auth import (
-    hash_password,
-    verify_password,
+    ahash_password,
+    averify_password,
+    averify_and_update_password,
     create_access_token,
     get_user_by_email,
     create_user,
     get_current_user,
+    invalidate_user_cache,
 )
 from app.models import User, Employee, Policy, OnboardingWorkflow
 
@@ -36,7 +38,7 @@ async def signup(payload: UserCreate, db: Session = Depends(get_db)):
             detail="Email already registered",
         )
 
-    hashed_pw = hash_password(payload.password)
+    hashed_pw = await ahash_password(payload.password)
     user = create_user(db, email=payload.email, name=payload.name, hashed_password=hashed_pw)
     return user
 
@@ -55,11 +57,17 @@ async def login(payload: UserLogin, db: Session = Depends(get_db)):
             detail="Invalid email or password",
         )
 
-    if not verify_password(payload.password, user.hashed_password):
+    valid, new_hash = await averify_and_update_password(payload.password, user.hashed_password)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
+    if new_hash:
+        # Transparently upgrade legacy bcrypt hashes to argon2id
+        user.hashed_password = new_hash
+        db.commit()
+        invalidate_user_cache(user.id)
 
     token = create_access_token(data={"sub": str(user.id), "email": user.email})
     return Token(access_token=token)
@@ -100,7 +108,7 @@ async def google_auth(payload: GoogleAuth, db: Session = Depends(get_db)):
         # Link Google account to existing user
         user.google_id = google_id
         db.commit()
-        db.refresh(user)
+        invalidate_user_cache(user.id)
 
     token = create_access_token(data={"sub": str(user.id), "email": user.email})
     return Token(access_token=token)
@@ -138,7 +146,7 @@ async def update_profile(
     if payload.name:
         current_user.name = payload.name
     db.commit()
-    db.refresh(current_user)
+    invalidate_user_cache(current_user.id)
     return current_user
 
 
@@ -158,13 +166,14 @@ async def change_password(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Password change not available for OAuth accounts",
         )
-    if not verify_password(payload.current_password, current_user.hashed_password):
+    if not await averify_password(payload.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
         )
-    current_user.hashed_password = hash_password(payload.new_password)
+    current_user.hashed_password = await ahash_password(payload.new_password)
     db.commit()
+    invalidate_user_cache(current_user.id)
     return MessageResponse(message="Password changed successfully")
 
 
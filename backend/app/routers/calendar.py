@@ -25,11 +25,11 @@ async def create_event(
 ):
     """Schedule a single calendar event."""
     # Verify employee exists
-    employee = db.query(Employee).filter(Employee.id == payload.employee_id).first()
+    employee = db.get(Employee, payload.employee_id)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
 
-    result = schedule_event(
+    result = await schedule_event(
         title=payload.title,
         event_date=payload.date,
         duration_minutes=payload.duration_minutes,
@@ -56,11 +56,11 @@ async def schedule_all_events(
     current_user: User = Depends(get_current_user),
 ):
     """Schedule all standard onboarding events for an employee."""
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    employee = db.get(Employee, employee_id)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
 
-    events = schedule_onboarding_events(
+    events = await schedule_onboarding_events(
         employee_name=employee.name,
         employee_email=employee.email,
         start_date=employee.start_date,
@@ -139,7 +139,7 @@ async def stream_message(
                 question=payload.content,
                 user_id=current_user.id,
             ):
-                yield f"data: {event}\n\n"
+                yield b"data: " + event + b"\n\n"
         finally:
             stream_db.close()
 
@@ -85,7 +85,7 @@ async def add_compliance_item(
     """Create a new compliance tracking item."""
     from app.models import Employee
 
-    employee = db.query(Employee).filter(Employee.id == payload.employee_id).first()
+    employee = db.get(Employee, payload.employee_id)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
 
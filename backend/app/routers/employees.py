@@ -1,7 +1,9 @@
 # app/routers/employees.py
 """Employee management routes — CRUD + CSV bulk import."""
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, UploadFile, File, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -25,11 +27,30 @@ router = APIRouter(prefix="/api/employees", tags=["Employees"])
 
 @router.get("/", response_model=list[EmployeeResponse])
 async def list_employees(
+    response: Response,
+    limit: int = Query(500, ge=1, le=1000, description="Maximum number of employees to return"),
+    cursor: datetime | None = Query(None, description="created_at of the last employee seen"),
+    cursor_id: int | None = Query(None, description="ID of the last employee seen (with cursor)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Return all employees."""
-    return employee_service.get_all_employees(db)
+    """Return a page of employees (newest first).
+
+    When more rows may follow, the X-Next-Cursor / X-Next-Cursor-Id headers
+    carry the cursor for the next page.
+    """
+    if (cursor is None) != (cursor_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor and cursor_id must be provided together",
+        )
+    page_cursor = (cursor, cursor_id) if cursor is not None else None
+    employees = employee_service.get_all_employees(db, limit=limit, cursor=page_cursor)
+    if len(employees) == limit:
+        last = employees[-1]
+        response.headers["X-Next-Cursor"] = last.created_at.isoformat()
+        response.headers["X-Next-Cursor-Id"] = str(last.id)
+    return employees
 
 
 # ─────────────────────────────────────────────────────────────
@@ -1,7 +1,7 @@
 # app/routers/onboarding.py
 """Onboarding workflow routes — start, status, SSE stream."""
 
-import asyncio
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from fastapi.responses import StreamingResponse, Response
 from sqlalchemy.orm import Session
@@ -21,9 +21,10 @@ from app.services.orchestrator import (
     pause_workflow,
     resume_workflow,
     retry_workflow,
-    run_workflow,
     run_workflow_stream,
+    coalesce_frames,
 )
+from app.services.workflow_runner import enqueue_workflow
 
 router = APIRouter(prefix="/api/onboarding", tags=["Onboarding"])
 
@@ -40,7 +41,7 @@ async def start_onboarding(
 ):
     """Create and immediately run an onboarding workflow for an employee."""
     # Verify employee exists
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    employee = db.get(Employee, employee_id)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
 
@@ -56,7 +57,7 @@ async def start_onboarding(
     workflow = create_workflow(db, employee_id)
 
     # Run the workflow in the background (non-blocking)
-    asyncio.create_task(_run_workflow_background(workflow.id))
+    enqueue_workflow(workflow.id)
 
     return OnboardingStartResponse(
         workflow_id=workflow.id,
@@ -65,17 +66,6 @@ async def start_onboarding(
     )
 
 
-async def _run_workflow_background(workflow_id: int):
-    """Run the workflow asynchronously with its own DB session."""
-    db = SessionLocal()
-    try:
-        await run_workflow(db, workflow_id)
-    except Exception as e:
-        print(f"⚠️  Background workflow {workflow_id} error: {e}")
-    finally:
-        db.close()
-
-
 # ─────────────────────────────────────────────────────────────
 # GET /api/onboarding/{employee_id}/status
 # ─────────────────────────────────────────────────────────────
@@ -87,7 +77,7 @@ async def get_onboarding_status(
     current_user: User = Depends(get_current_user),
 ):
     """Get the current onboarding workflow status for an employee."""
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    employee = db.get(Employee, employee_id)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
 
@@ -119,7 +109,7 @@ async def stream_onboarding(
     if not user:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    employee = db.get(Employee, employee_id)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
 
@@ -131,11 +121,12 @@ async def stream_onboarding(
     workflow_id = workflow.id  # Capture ID before request session closes
 
     async def event_generator():
-        # Create a fresh DB session for the long-lived SSE stream
-        stream_db = SessionLocal()
+        # Create a fresh DB session for the long-lived SSE stream (not expired
+        # on commit, so per-step commits don't reload the workflow's steps)
+        stream_db = SessionLocal(expire_on_commit=False)
         try:
-            async for event_data in run_workflow_stream(stream_db, workflow_id):
-                yield f"data: {event_data}\n\n"
+            async for frame in coalesce_frames(run_workflow_stream(stream_db, workflow_id)):
+                yield frame
         finally:
             stream_db.close()
 
@@ -178,7 +169,7 @@ async def pause_onboarding(
     current_user: User = Depends(get_current_user),
 ):
     """Pause a running onboarding workflow."""
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    employee = db.get(Employee, employee_id)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     try:
@@ -199,7 +190,7 @@ async def resume_onboarding(
     current_user: User = Depends(get_current_user),
 ):
     """Resume a paused or approval-waiting workflow and continue remaining steps."""
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    employee = db.get(Employee, employee_id)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     try:
@@ -208,7 +199,7 @@ async def resume_onboarding(
         raise HTTPException(status_code=400, detail=str(e))
 
     # Re-run the workflow in background — it will skip completed steps
-    asyncio.create_task(_run_workflow_background(workflow.id))
+    enqueue_workflow(workflow.id)
 
     return OnboardingStartResponse(
         workflow_id=workflow.id,
@@ -228,7 +219,7 @@ async def retry_onboarding(
     current_user: User = Depends(get_current_user),
 ):
     """Retry a failed onboarding workflow — resets failed steps and re-runs."""
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    employee = db.get(Employee, employee_id)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     try:
@@ -237,7 +228,7 @@ async def retry_onboarding(
         raise HTTPException(status_code=400, detail=str(e))
 
     # Re-run the workflow in the background (picks up from failed steps)
-    asyncio.create_task(_run_workflow_background(workflow.id))
+    enqueue_workflow(workflow.id)
 
     return OnboardingStartResponse(
         workflow_id=workflow.id,
@@ -288,9 +279,7 @@ async def export_onboarding_report(
     current_user: User = Depends(get_current_user),
 ):
     """Export the onboarding workflow as a downloadable Markdown report."""
-    import json as _json
-
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    employee = db.get(Employee, employee_id)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
 
@@ -338,11 +327,8 @@ async def export_onboarding_report(
         lines.append("")
 
         if step.result:
-            try:
-                data = _json.loads(step.result)
-                content = data.get("content") or data.get("ai_summary") or _json.dumps(data, indent=2)
-            except (_json.JSONDecodeError, TypeError):
-                content = step.result
+            data = step.result
+            content = data.get("content") or data.get("ai_summary") or orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
             lines.append("### Output")
             lines.append("")
             lines.append(content)
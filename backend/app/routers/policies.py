@@ -1,6 +1,7 @@
 # app/routers/policies.py
 """Policy document routes — upload PDF, list, delete, download, re-embed."""
 
+import asyncio
 import os
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status
@@ -57,13 +58,13 @@ async def upload_policy(
 
     policy = policy_service.save_policy(db, title=title, filename=file.filename, file_content=content)
 
-    # Embed the policy into the RAG vector store
+    # Embed the policy into the RAG vector store (PDF parsing, embedding
+    # calls and vector writes block — keep them off the event loop)
     try:
-        num_chunks = embed_policy(policy.id, policy.file_path, policy.title)
+        num_chunks = await asyncio.to_thread(embed_policy, policy.id, policy.file_path, policy.title)
         if num_chunks > 0:
             policy.is_embedded = True
             db.commit()
-            db.refresh(policy)
     except Exception as e:
         print(f"⚠️  RAG embedding failed for policy {policy.id}: {e}")
 
@@ -131,16 +132,15 @@ async def reembed_policy(
         raise HTTPException(status_code=404, detail="Policy file not found on disk")
 
     # Delete existing embeddings first
-    delete_policy_embeddings(policy_id)
+    await asyncio.to_thread(delete_policy_embeddings, policy_id)
 
     try:
-        num_chunks = embed_policy(policy.id, policy.file_path, policy.title)
+        num_chunks = await asyncio.to_thread(embed_policy, policy.id, policy.file_path, policy.title)
         if num_chunks > 0:
             policy.is_embedded = True
         else:
             policy.is_embedded = False
         db.commit()
-        db.refresh(policy)
     except Exception as e:
         print(f"⚠️  Re-embed failed for policy {policy.id}: {e}")
         raise HTTPException(status_code=500, detail=f"Embedding failed: {str(e)}")
@@ -160,7 +160,7 @@ async def delete_policy(
 ):
     """Delete a policy document and its file."""
     # Remove RAG embeddings first
-    delete_policy_embeddings(policy_id)
+    await asyncio.to_thread(delete_policy_embeddings, policy_id)
 
     deleted = policy_service.delete_policy(db, policy_id)
     if not deleted:
@@ -209,16 +209,15 @@ async def reembed_policy(
         raise HTTPException(status_code=404, detail="File not found on disk")
 
     # Delete old embeddings first
-    delete_policy_embeddings(policy_id)
+    await asyncio.to_thread(delete_policy_embeddings, policy_id)
 
     try:
-        num_chunks = embed_policy(policy.id, policy.file_path, policy.title)
+        num_chunks = await asyncio.to_thread(embed_policy, policy.id, policy.file_path, policy.title)
         if num_chunks > 0:
             policy.is_embedded = True
         else:
             policy.is_embedded = False
         db.commit()
-        db.refresh(policy)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -275,7 +275,7 @@ class OnboardingStepResponse(BaseModel):
     step_type: str
     step_order: int
     status: str
-    result: Optional[str] = None
+    result: Optional[dict] = None
     error_message: Optional[str] = None
     requires_approval: bool = False
     approval_status: Optional[str] = None
@@ -1,21 +1,51 @@
 """Seed jurisdiction templates for multi-country onboarding support."""
 
-import json
+import functools
+from types import MappingProxyType
+from typing import Mapping
+
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.models import JurisdictionTemplate
+from app.services.document_generator import invalidate_template_cache
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Jurisdiction Data
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-JURISDICTIONS = {
-    "US": {
-        "name": "United States",
-        "templates": {
-            "employment_contract": {
-                "content": """EMPLOYMENT AGREEMENT
+# legal_requirements are kept as pre-serialized JSON arrays (the value
+# stored in JurisdictionTemplate.legal_requirements), so nothing is
+# encoded at import time.
+
+@functools.cache
+def _jurisdictions() -> Mapping[str, Mapping]:
+    """Return the jurisdiction template data, built and frozen on first use.
+
+    Each jurisdiction maps to a read-only ``{"name", "templates"}`` mapping
+    where ``templates`` is a tuple of
+    ``(document_type, content, legal_requirements)`` tuples.
+    """
+    return MappingProxyType({
+        code: MappingProxyType({
+            "name": jurisdiction["name"],
+            "templates": tuple(
+                (doc_type, template["content"], template["legal_requirements"])
+                for doc_type, template in jurisdiction["templates"].items()
+            ),
+        })
+        for code, jurisdiction in _jurisdiction_data().items()
+    })
+
+
+def _jurisdiction_data() -> dict:
+    """Return the raw jurisdiction data (only read by _jurisdictions())."""
+    return {
+        "US": {
+            "name": "United States",
+            "templates": {
+                "employment_contract": {
+                    "content": """EMPLOYMENT AGREEMENT
 
 This Employment Agreement ("Agreement") is entered into as of {start_date}, by and between the Company and {name} ("Employee").
 
@@ -47,17 +77,17 @@ IN WITNESS WHEREOF, the parties have executed this Agreement as of the date firs
 
 Company: ________________________     Date: ________
 Employee: {name}                       Date: ________""",
-                "legal_requirements": json.dumps([
-                    "At-will employment clause",
-                    "Equal opportunity statement",
-                    "FLSA compliance",
-                    "I-9 employment verification reference",
-                    "Workers' compensation notice",
-                    "COBRA benefits reference",
-                ]),
-            },
-            "nda": {
-                "content": """NON-DISCLOSURE AGREEMENT
+                    "legal_requirements": (
+                        '["At-will employment clause", '
+                        '"Equal opportunity statement", '
+                        '"FLSA compliance", '
+                        '"I-9 employment verification reference", '
+                        '"Workers\' compensation notice", '
+                        '"COBRA benefits reference"]'
+                    ),
+                },
+                "nda": {
+                    "content": """NON-DISCLOSURE AGREEMENT
 
 This Non-Disclosure Agreement ("NDA") is entered into as of {start_date}, by and between the Company ("Disclosing Party") and {name} ("Receiving Party").
 
@@ -89,16 +119,16 @@ This NDA is governed by the laws of the applicable U.S. state.
 Employee: {name}          Date: {start_date}
 Position: {role}
 Department: {department}""",
-                "legal_requirements": json.dumps([
-                    "Clear definition of confidential information",
-                    "Duration of obligations",
-                    "Permitted exceptions",
-                    "Remedies for breach",
-                    "DTSA compliance (Defend Trade Secrets Act)",
-                ]),
-            },
-            "offer_letter": {
-                "content": """OFFER OF EMPLOYMENT
+                    "legal_requirements": (
+                        '["Clear definition of confidential information", '
+                        '"Duration of obligations", '
+                        '"Permitted exceptions", '
+                        '"Remedies for breach", '
+                        '"DTSA compliance (Defend Trade Secrets Act)"]'
+                    ),
+                },
+                "offer_letter": {
+                    "content": """OFFER OF EMPLOYMENT
 
 Dear {name},
 
@@ -135,21 +165,21 @@ HR Team
 I, {name}, accept this offer of employment.
 
 Signature: ________________________     Date: ________""",
-                "legal_requirements": json.dumps([
-                    "At-will disclaimer",
-                    "Contingency on background check",
-                    "I-9 verification reference",
-                    "EEO statement",
-                    "Acceptance deadline",
-                ]),
+                    "legal_requirements": (
+                        '["At-will disclaimer", '
+                        '"Contingency on background check", '
+                        '"I-9 verification reference", '
+                        '"EEO statement", '
+                        '"Acceptance deadline"]'
+                    ),
+                },
             },
         },
-    },
-    "UK": {
-        "name": "United Kingdom",
-        "templates": {
-            "employment_contract": {
-                "content": """CONTRACT OF EMPLOYMENT
+        "UK": {
+            "name": "United Kingdom",
+            "templates": {
+                "employment_contract": {
+                    "content": """CONTRACT OF EMPLOYMENT
 
 This Contract of Employment is made between the Company and {name} ("Employee") in accordance with the Employment Rights Act 1996.
 
@@ -188,18 +218,18 @@ This contract is governed by the laws of England and Wales.
 
 Signed by the Company: ________________________     Date: ________
 Signed by the Employee: {name}                      Date: ________""",
-                "legal_requirements": json.dumps([
-                    "Written statement of employment under ERA 1996",
-                    "Working Time Regulations 1998 compliance",
-                    "National Minimum Wage compliance",
-                    "Auto-enrolment pension (Pensions Act 2008)",
-                    "GDPR data processing notice",
-                    "Right to work in the UK verification",
-                    "Statutory notice periods",
-                ]),
-            },
-            "nda": {
-                "content": """CONFIDENTIALITY AGREEMENT
+                    "legal_requirements": (
+                        '["Written statement of employment under ERA 1996", '
+                        '"Working Time Regulations 1998 compliance", '
+                        '"National Minimum Wage compliance", '
+                        '"Auto-enrolment pension (Pensions Act 2008)", '
+                        '"GDPR data processing notice", '
+                        '"Right to work in the UK verification", '
+                        '"Statutory notice periods"]'
+                    ),
+                },
+                "nda": {
+                    "content": """CONFIDENTIALITY AGREEMENT
 
 This Confidentiality Agreement is entered into on {start_date} between the Company and {name} ("Employee").
 
@@ -234,15 +264,15 @@ This Agreement is governed by the laws of England and Wales.
 Employee: {name}
 Position: {role} — {department}
 Date: {start_date}""",
-                "legal_requirements": json.dumps([
-                    "UK GDPR and Data Protection Act 2018 compliance",
-                    "Reasonable scope of restrictions",
-                    "Garden leave provisions",
-                    "Whistleblowing protection carve-out",
-                ]),
-            },
-            "offer_letter": {
-                "content": """OFFER OF EMPLOYMENT
+                    "legal_requirements": (
+                        '["UK GDPR and Data Protection Act 2018 compliance", '
+                        '"Reasonable scope of restrictions", '
+                        '"Garden leave provisions", '
+                        '"Whistleblowing protection carve-out"]'
+                    ),
+                },
+                "offer_letter": {
+                    "content": """OFFER OF EMPLOYMENT
 
 Dear {name},
 
@@ -280,21 +310,21 @@ People Team
 I, {name}, accept this offer of employment.
 
 Signature: ________________________     Date: ________""",
-                "legal_requirements": json.dumps([
-                    "Right to work in UK verification",
-                    "Statutory employment terms (ERA 1996 s.1)",
-                    "Pension auto-enrolment details",
-                    "Working hours and holiday entitlement",
-                    "Probationary period terms",
-                ]),
+                    "legal_requirements": (
+                        '["Right to work in UK verification", '
+                        '"Statutory employment terms (ERA 1996 s.1)", '
+                        '"Pension auto-enrolment details", '
+                        '"Working hours and holiday entitlement", '
+                        '"Probationary period terms"]'
+                    ),
+                },
             },
         },
-    },
-    "AE": {
-        "name": "United Arab Emirates",
-        "templates": {
-            "employment_contract": {
-                "content": """EMPLOYMENT CONTRACT
+        "AE": {
+            "name": "United Arab Emirates",
+            "templates": {
+                "employment_contract": {
+                    "content": """EMPLOYMENT CONTRACT
 (In accordance with UAE Federal Decree-Law No. 33 of 2021)
 
 This Employment Contract is entered into between the Company ("Employer") and {name} ("Employee").
@@ -340,19 +370,19 @@ This contract is governed by UAE Federal Decree-Law No. 33 of 2021 and its amend
 
 Employer: ________________________     Date: ________
 Employee: {name}                       Date: ________""",
-                "legal_requirements": json.dumps([
-                    "UAE Federal Decree-Law No. 33 of 2021 compliance",
-                    "MOHRE (Ministry of Human Resources) registration",
-                    "Wage Protection System (WPS) compliance",
-                    "Medical insurance as per emirate regulations",
-                    "End-of-service gratuity provisions",
-                    "Visa sponsorship terms",
-                    "Arabic language version required",
-                    "Ramadan working hours",
-                ]),
-            },
-            "nda": {
-                "content": """NON-DISCLOSURE AND CONFIDENTIALITY AGREEMENT
+                    "legal_requirements": (
+                        '["UAE Federal Decree-Law No. 33 of 2021 compliance", '
+                        '"MOHRE (Ministry of Human Resources) registration", '
+                        '"Wage Protection System (WPS) compliance", '
+                        '"Medical insurance as per emirate regulations", '
+                        '"End-of-service gratuity provisions", '
+                        '"Visa sponsorship terms", '
+                        '"Arabic language version required", '
+                        '"Ramadan working hours"]'
+                    ),
+                },
+                "nda": {
+                    "content": """NON-DISCLOSURE AND CONFIDENTIALITY AGREEMENT
 
 This Agreement is entered into on {start_date} between the Company and {name} ("Employee"), position: {role}, department: {department}.
 
@@ -378,15 +408,15 @@ This Agreement is governed by the laws of the United Arab Emirates.
 Employee: {name}
 Position: {role} — {department}
 Date: {start_date}""",
-                "legal_requirements": json.dumps([
-                    "UAE Federal Decree-Law No. 45 of 2021 (Data Protection)",
-                    "Reasonable scope under UAE Labour Law",
-                    "Arabic translation may be required",
-                    "DIFC/ADGM specific provisions if applicable",
-                ]),
-            },
-            "offer_letter": {
-                "content": """OFFER OF EMPLOYMENT
+                    "legal_requirements": (
+                        '["UAE Federal Decree-Law No. 45 of 2021 (Data Protection)", '
+                        '"Reasonable scope under UAE Labour Law", '
+                        '"Arabic translation may be required", '
+                        '"DIFC/ADGM specific provisions if applicable"]'
+                    ),
+                },
+                "offer_letter": {
+                    "content": """OFFER OF EMPLOYMENT
 
 Dear {name},
 
@@ -424,43 +454,44 @@ HR Department
 I, {name}, accept this offer of employment.
 
 Signature: ________________________     Date: ________""",
-                "legal_requirements": json.dumps([
-                    "MOHRE standard contract format",
-                    "Medical fitness test requirement",
-                    "Visa and work permit sponsorship",
-                    "WPS salary payment compliance",
-                    "End-of-service gratuity reference",
-                ]),
+                    "legal_requirements": (
+                        '["MOHRE standard contract format", '
+                        '"Medical fitness test requirement", '
+                        '"Visa and work permit sponsorship", '
+                        '"WPS salary payment compliance", '
+                        '"End-of-service gratuity reference"]'
+                    ),
+                },
             },
         },
-    },
-}
+    }
 
 
 def seed_jurisdictions(db: Session) -> int:
     """Seed jurisdiction template data. Returns count of templates created."""
-    count = 0
-
-    for code, jurisdiction in JURISDICTIONS.items():
-        # Check if templates already exist for this jurisdiction
-        existing = (
-            db.query(JurisdictionTemplate)
-            .filter(JurisdictionTemplate.jurisdiction_code == code)
-            .first()
-        )
-        if existing:
-            continue
-
-        for doc_type, template_data in jurisdiction["templates"].items():
-            template = JurisdictionTemplate(
-                jurisdiction_code=code,
-                jurisdiction_name=jurisdiction["name"],
-                document_type=doc_type,
-                template_content=template_data["content"],
-                legal_requirements=template_data["legal_requirements"],
-            )
-            db.add(template)
-            count += 1
-
+    # One SELECT DISTINCT instead of an existence check per jurisdiction;
+    # jurisdictions that already have templates are skipped entirely
+    existing_codes = {
+        code for (code,) in db.query(JurisdictionTemplate.jurisdiction_code).distinct()
+    }
+
+    rows = [
+        {
+            "jurisdiction_code": code,
+            "jurisdiction_name": jurisdiction["name"],
+            "document_type": doc_type,
+            "template_content": content,
+            "legal_requirements": legal_requirements,
+        }
+        for code, jurisdiction in _jurisdictions().items()
+        if code not in existing_codes
+        for doc_type, content, legal_requirements in jurisdiction["templates"]
+    ]
+
+    if rows:
+        # executemany-style insert → single multi-VALUES statement (insertmanyvalues)
+        db.execute(insert(JurisdictionTemplate), rows)
     db.commit()
-    return count
+    if rows:
+        invalidate_template_cache()
+    return len(rows)
@@ -1,9 +1,11 @@
 # app/services/approval.py
 """Approval workflow service — manages human review of AI-generated documents."""
 
+import asyncio
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import tuple_, update
 from sqlalchemy.orm import Session
 
 from app.models import (
@@ -15,6 +17,18 @@ from app.models import (
     WorkflowStatus,
 )
 
+# Application event loop, registered at startup. Workflow resumes are
+# scheduled onto it so they run even when approvals are processed from a
+# worker thread (where asyncio.get_event_loop() would hand back a fresh,
+# never-running loop).
+_main_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def set_main_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Register the application's event loop for background workflow resumes."""
+    global _main_loop
+    _main_loop = loop
+
 
 def create_approval_request(db: Session, employee_id: int, document_id: int) -> ApprovalRequest:
     """Create a new approval request for a generated document."""
@@ -26,9 +40,11 @@ def create_approval_request(db: Session, employee_id: int, document_id: int) ->
     db.add(approval)
 
     # Update document status
-    doc = db.query(GeneratedDocument).filter(GeneratedDocument.id == document_id).first()
-    if doc:
-        doc.status = DocumentStatus.PENDING_APPROVAL
+    db.execute(
+        update(GeneratedDocument)
+        .where(GeneratedDocument.id == document_id)
+        .values(status=DocumentStatus.PENDING_APPROVAL)
+    )
 
     db.commit()
     db.refresh(approval)
@@ -37,45 +53,59 @@ def create_approval_request(db: Session, employee_id: int, document_id: int) ->
 
 def approve_document(db: Session, approval_id: int, reviewer_id: int, comments: Optional[str] = None) -> ApprovalRequest:
     """Approve a document — marks both approval and document as approved."""
-    approval = db.query(ApprovalRequest).filter(ApprovalRequest.id == approval_id).first()
+    approval = db.get(ApprovalRequest, approval_id)
     if not approval:
         raise ValueError("Approval request not found")
 
+    now = datetime.utcnow()
+
     approval.status = ApprovalStatus.APPROVED
     approval.reviewer_id = reviewer_id
     approval.comments = comments
-    approval.reviewed_at = datetime.utcnow()
+    approval.reviewed_at = now
 
     # Update document status
-    doc = db.query(GeneratedDocument).filter(GeneratedDocument.id == approval.document_id).first()
-    if doc:
-        doc.status = DocumentStatus.APPROVED
-        doc.approved_at = datetime.utcnow()
-        doc.approved_by = reviewer_id
+    db.execute(
+        update(GeneratedDocument)
+        .where(GeneratedDocument.id == approval.document_id)
+        .values(
+            status=DocumentStatus.APPROVED,
+            approved_at=now,
+            approved_by=reviewer_id,
+        )
+    )
 
     # Check if all approvals for this employee are approved → resume workflow
-    _check_all_approvals_complete(db, approval.employee_id)
+    resume_workflow_id = _check_all_approvals_complete(db, approval.employee_id)
 
     db.commit()
     db.refresh(approval)
+
+    # Spawn the resume only after the RUNNING transition is committed
+    if resume_workflow_id is not None:
+        _resume_workflow_in_background(resume_workflow_id)
     return approval
 
 
 def reject_document(db: Session, approval_id: int, reviewer_id: int, comments: Optional[str] = None) -> ApprovalRequest:
     """Reject a document."""
-    approval = db.query(ApprovalRequest).filter(ApprovalRequest.id == approval_id).first()
+    approval = db.get(ApprovalRequest, approval_id)
     if not approval:
         raise ValueError("Approval request not found")
 
+    now = datetime.utcnow()
+
     approval.status = ApprovalStatus.REJECTED
     approval.reviewer_id = reviewer_id
     approval.comments = comments
-    approval.reviewed_at = datetime.utcnow()
+    approval.reviewed_at = now
 
     # Update document status back to draft
-    doc = db.query(GeneratedDocument).filter(GeneratedDocument.id == approval.document_id).first()
-    if doc:
-        doc.status = DocumentStatus.DRAFT
+    db.execute(
+        update(GeneratedDocument)
+        .where(GeneratedDocument.id == approval.document_id)
+        .values(status=DocumentStatus.DRAFT)
+    )
 
     db.commit()
     db.refresh(approval)
@@ -84,46 +114,83 @@ def reject_document(db: Session, approval_id: int, reviewer_id: int, comments: O
 
 def request_revision(db: Session, approval_id: int, reviewer_id: int, comments: Optional[str] = None) -> ApprovalRequest:
     """Request revision of a document."""
-    approval = db.query(ApprovalRequest).filter(ApprovalRequest.id == approval_id).first()
+    approval = db.get(ApprovalRequest, approval_id)
     if not approval:
         raise ValueError("Approval request not found")
 
+    now = datetime.utcnow()
+
     approval.status = ApprovalStatus.REVISION_REQUESTED
     approval.reviewer_id = reviewer_id
     approval.comments = comments
-    approval.reviewed_at = datetime.utcnow()
+    approval.reviewed_at = now
 
     # Update document status back to draft
-    doc = db.query(GeneratedDocument).filter(GeneratedDocument.id == approval.document_id).first()
-    if doc:
-        doc.status = DocumentStatus.DRAFT
+    db.execute(
+        update(GeneratedDocument)
+        .where(GeneratedDocument.id == approval.document_id)
+        .values(status=DocumentStatus.DRAFT)
+    )
 
     db.commit()
     db.refresh(approval)
     return approval
 
 
-def get_pending_approvals(db: Session) -> list[ApprovalRequest]:
-    """Get all pending approval requests."""
+def _newest_first(query, limit: int, cursor: Optional[tuple[datetime, int]]):
+    """Keyset page of *query* ordered by (created_at, id) descending."""
+    if cursor is not None:
+        query = query.filter(tuple_(ApprovalRequest.created_at, ApprovalRequest.id) < cursor)
+    return (
+        query.order_by(ApprovalRequest.created_at.desc(), ApprovalRequest.id.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+def get_pending_approvals(
+    db: Session,
+    limit: int = 50,
+    cursor: Optional[tuple[datetime, int]] = None,
+) -> list[ApprovalRequest]:
+    """Get a page of pending approval requests, newest first.
+
+    Pass the ``(created_at, id)`` of the last row seen as *cursor* to fetch
+    the next page; the ID breaks ties between approvals created together.
+    """
+    query = db.query(ApprovalRequest).filter(ApprovalRequest.status == ApprovalStatus.PENDING)
+    return _newest_first(query, limit, cursor)
+
+
+def count_pending_approvals(db: Session) -> int:
+    """Count pending approval requests."""
     return (
         db.query(ApprovalRequest)
         .filter(ApprovalRequest.status == ApprovalStatus.PENDING)
-        .order_by(ApprovalRequest.created_at.desc())
-        .all()
+        .count()
     )
 
 
-def get_all_approvals(db: Session, status_filter: Optional[str] = None) -> list[ApprovalRequest]:
-    """Get all approval requests, optionally filtered by status."""
+def get_all_approvals(
+    db: Session,
+    status_filter: Optional[str] = None,
+    limit: int = 100,
+    cursor: Optional[tuple[datetime, int]] = None,
+) -> list[ApprovalRequest]:
+    """Get a page of approval requests, optionally filtered by status, newest first.
+
+    Pass the ``(created_at, id)`` of the last row seen as *cursor* to fetch
+    the next page.
+    """
     query = db.query(ApprovalRequest)
     if status_filter:
         query = query.filter(ApprovalRequest.status == status_filter)
-    return query.order_by(ApprovalRequest.created_at.desc()).all()
+    return _newest_first(query, limit, cursor)
 
 
 def get_approval_by_id(db: Session, approval_id: int) -> Optional[ApprovalRequest]:
     """Get a single approval request by ID."""
-    return db.query(ApprovalRequest).filter(ApprovalRequest.id == approval_id).first()
+    return db.get(ApprovalRequest, approval_id)
 
 
 def get_approvals_by_employee(db: Session, employee_id: int) -> list[ApprovalRequest]:
@@ -136,18 +203,24 @@ def get_approvals_by_employee(db: Session, employee_id: int) -> list[ApprovalReq
     )
 
 
-def _check_all_approvals_complete(db: Session, employee_id: int):
-    """Check if all pending approvals for an employee are complete. If so, resume the workflow."""
-    pending = (
-        db.query(ApprovalRequest)
+def _check_all_approvals_complete(db: Session, employee_id: int) -> Optional[int]:
+    """Check if all pending approvals for an employee are complete.
+
+    If so, flip the awaiting workflow back to RUNNING (left for the caller to
+    commit) and return its ID so the caller can resume it once committed.
+    """
+    # The session doesn't autoflush — push the caller's status change first
+    db.flush()
+    has_pending = db.query(
+        db.query(ApprovalRequest.id)
         .filter(
             ApprovalRequest.employee_id == employee_id,
             ApprovalRequest.status == ApprovalStatus.PENDING,
         )
-        .count()
-    )
+        .exists()
+    ).scalar()
 
-    if pending == 0:
+    if not has_pending:
         # All documents approved — resume the workflow if it was awaiting approval
         workflow = (
             db.query(OnboardingWorkflow)
@@ -159,23 +232,14 @@ def _check_all_approvals_complete(db: Session, employee_id: int):
         )
         if workflow:
             workflow.status = WorkflowStatus.RUNNING
-            db.commit()
-            # Kick off background execution of remaining steps
-            import asyncio
-            from app.database import SessionLocal
-
-            async def _continue_workflow(wf_id: int):
-                from app.services.orchestrator import run_workflow
-                bg_db = SessionLocal()
-                try:
-                    await run_workflow(bg_db, wf_id)
-                except Exception as e:
-                    print(f"⚠️  Background workflow {wf_id} resume error: {e}")
-                finally:
-                    bg_db.close()
-
-            try:
-                loop = asyncio.get_event_loop()
-                loop.create_task(_continue_workflow(workflow.id))
-            except RuntimeError:
-                pass  # No event loop — SSE stream will handle it
+            return workflow.id
+    return None
+
+
+def _resume_workflow_in_background(workflow_id: int) -> None:
+    """Kick off background execution of a workflow's remaining steps."""
+    from app.services.workflow_runner import enqueue_workflow
+
+    if _main_loop is None or _main_loop.is_closed():
+        return  # No application loop — SSE stream will handle it
+    enqueue_workflow(workflow_id, loop=_main_loop)
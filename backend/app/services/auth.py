@@ -1,24 +1,54 @@
 # app/services/auth.py
 """Authentication service — password hashing, JWT, Google token validation."""
 
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+import jwt
+from jwt import ExpiredSignatureError, PyJWTError
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.config import settings
 from app.database import get_db
 from app.models import User
 
 # ── Password hashing ────────────────────────────────────────
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# argon2id for new hashes; existing bcrypt hashes still verify and are
+# upgraded on the next successful login (see verify_and_update_password).
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
 
 # ── Bearer token scheme ─────────────────────────────────────
-http_bearer = HTTPBearer(auto_error=False)
+def _bearer_token(request: Request) -> Optional[str]:
+    """Return the raw bearer token from the Authorization header, if any.
+
+    Parses the header directly instead of going through HTTPBearer, which
+    allocates an HTTPAuthorizationCredentials object on every request.
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return token
+
+# ── Authenticated-user cache ────────────────────────────────
+# user_id -> (expires_at, column snapshot). Saves the per-request SELECT
+# in get_current_user; entries are dropped on any user mutation.
+_USER_CACHE_TTL = 5.0  # seconds
+_user_cache: dict[int, tuple[float, dict]] = {}
+_user_cache_lock = threading.Lock()
 
 
 # ─────────────────────────────────────────────────────────────
@@ -26,15 +56,42 @@ http_bearer = HTTPBearer(auto_error=False)
 # ─────────────────────────────────────────────────────────────
 
 def hash_password(password: str) -> str:
-    """Hash a plain-text password with bcrypt."""
+    """Hash a plain-text password with argon2id."""
     return pwd_context.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain-text password against a bcrypt hash."""
+    """Verify a plain-text password against an argon2id or legacy bcrypt hash."""
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """Verify a password and return a replacement hash if the stored one is outdated.
+
+    Returns ``(valid, new_hash)`` where ``new_hash`` is None unless the
+    password was valid and the stored hash uses a deprecated scheme.
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+# Async wrappers — the KDF is CPU-bound, so run it in the threadpool
+# rather than blocking the event loop inside async route handlers.
+
+async def ahash_password(password: str) -> str:
+    """Async variant of hash_password."""
+    return await run_in_threadpool(hash_password, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Async variant of verify_password."""
+    return await run_in_threadpool(verify_password, plain_password, hashed_password)
+
+
+async def averify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """Async variant of verify_and_update_password."""
+    return await run_in_threadpool(verify_and_update_password, plain_password, hashed_password)
+
+
 # ─────────────────────────────────────────────────────────────
 # JWT utilities
 # ─────────────────────────────────────────────────────────────
@@ -42,17 +99,32 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
+    expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
+@lru_cache(maxsize=4096)
+def _decode_cached(token: str, secret_key: str, algorithm: str) -> dict:
+    """Verify a JWT signature and decode its claims (memoized per token + key)."""
+    return jwt.decode(token, secret_key, algorithms=[algorithm])
+
+
+def _decode_token(token: str) -> dict:
+    """Decode a JWT via the signature cache, re-checking expiry on every call."""
+    payload = _decode_cached(token, settings.SECRET_KEY, settings.ALGORITHM)
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        raise ExpiredSignatureError("Signature has expired.")
+    return payload
+
+
 def decode_access_token(token: str) -> dict:
     """Decode and validate a JWT access token. Raises on failure."""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = _decode_token(token)
         return payload
-    except JWTError as e:
+    except PyJWTError as e:
         print(f"⚠️  JWT decode failed: {e}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -72,7 +144,35 @@ def get_user_by_email(db: Session, email: str) -> Optional[User]:
 
 def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
     """Fetch a user by primary key."""
-    return db.query(User).filter(User.id == user_id).first()
+    return db.get(User, user_id)
+
+
+def get_cached_user(db: Session, user_id: int) -> Optional[User]:
+    """Fetch an active user by primary key, served from a short-lived cache when possible.
+
+    Cache hits are re-attached to *db* with ``merge(load=False)``, so the
+    returned instance can be modified and committed like a queried one.
+    """
+    now = time.monotonic()
+    with _user_cache_lock:
+        entry = _user_cache.get(user_id)
+    if entry is not None and entry[0] > now:
+        user = User(**entry[1])
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    user = get_user_by_id(db, user_id)
+    if user is not None and user.is_active:
+        snapshot = {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+        with _user_cache_lock:
+            _user_cache[user_id] = (now + _USER_CACHE_TTL, snapshot)
+    return user
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    """Drop a user's cached snapshot (call after changing the user row)."""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
 
 
 def create_user(db: Session, email: str, name: str, hashed_password: Optional[str] = None,
@@ -86,7 +186,7 @@ def create_user(db: Session, email: str, name: str, hashed_password: Optional[st
     )
     db.add(user)
     db.commit()
-    db.refresh(user)
+    invalidate_user_cache(user.id)
     return user
 
 
@@ -95,17 +195,16 @@ def create_user(db: Session, email: str, name: str, hashed_password: Optional[st
 # ─────────────────────────────────────────────────────────────
 
 async def get_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer),
+    token: Optional[str] = Depends(_bearer_token),
     db: Session = Depends(get_db),
 ) -> User:
     """FastAPI dependency that extracts and returns the authenticated user."""
-    if credentials is None:
+    if token is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    token = credentials.credentials
 
     payload = decode_access_token(token)
     try:
@@ -118,7 +217,7 @@ async def get_current_user(
             detail="Invalid token payload",
         )
 
-    user = get_user_by_id(db, user_id)
+    user = get_cached_user(db, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -138,11 +237,11 @@ def verify_token_string(token: str, db: Session) -> Optional[User]:
     Used for SSE endpoints where Authorization headers aren't available.
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = _decode_token(token)
         user_id = int(payload.get("sub"))
-        user = get_user_by_id(db, user_id)
+        user = get_cached_user(db, user_id)
         if user and user.is_active:
             return user
-    except (JWTError, TypeError, ValueError):
+    except (PyJWTError, TypeError, ValueError):
         pass
     return None
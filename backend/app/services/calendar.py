@@ -1,14 +1,19 @@
 # app/services/calendar.py
 """Google Calendar integration — OAuth + event scheduling with mock fallback."""
 
-import uuid
+import asyncio
+import importlib.util
+import secrets
 from datetime import date, timedelta
 from typing import Optional
 
 from app.config import settings
 
+# Checked once at import; the client libraries themselves are only loaded when used
+_GOOGLE_AVAILABLE = importlib.util.find_spec("googleapiclient") is not None
 
-def schedule_event(
+
+async def schedule_event(
     title: str,
     event_date: date,
     duration_minutes: int = 60,
@@ -22,12 +27,15 @@ def schedule_event(
     Returns a dict with event details.
     """
     if settings.GOOGLE_CLIENT_ID and settings.GOOGLE_CLIENT_SECRET:
-        return _schedule_google_event(title, event_date, duration_minutes, description, attendees)
+        # The Google client is blocking — run it off the event loop
+        return await asyncio.to_thread(
+            _schedule_google_event, title, event_date, duration_minutes, description, attendees
+        )
     else:
         return _mock_schedule_event(title, event_date, duration_minutes, description, attendees)
 
 
-def schedule_onboarding_events(
+async def schedule_onboarding_events(
     employee_name: str,
     employee_email: str,
     start_date: date,
@@ -42,36 +50,35 @@ def schedule_onboarding_events(
       2. Manager 1:1 — day 2
       3. Buddy Meetup — day 3
     """
-    events = []
-
-    # 1. Orientation on start date
-    events.append(schedule_event(
-        title=f"Orientation - {employee_name}",
-        event_date=start_date,
-        duration_minutes=120,
-        description=f"Welcome orientation for {employee_name}",
-        attendees=[employee_email] + ([manager_email] if manager_email else []),
-    ))
-
-    # 2. Manager 1:1 on day 2
-    events.append(schedule_event(
-        title=f"Manager 1:1 - {employee_name}",
-        event_date=start_date + timedelta(days=1),
-        duration_minutes=60,
-        description=f"Initial 1:1 meeting between {employee_name} and manager",
-        attendees=[employee_email] + ([manager_email] if manager_email else []),
-    ))
-
-    # 3. Buddy meetup on day 3
-    events.append(schedule_event(
-        title=f"Buddy Meetup - {employee_name}",
-        event_date=start_date + timedelta(days=2),
-        duration_minutes=45,
-        description=f"Casual meetup between {employee_name} and onboarding buddy",
-        attendees=[employee_email] + ([buddy_email] if buddy_email else []),
-    ))
-
-    return events
+    # The three events are independent, so submit them concurrently
+    events = await asyncio.gather(
+        # 1. Orientation on start date
+        schedule_event(
+            title=f"Orientation - {employee_name}",
+            event_date=start_date,
+            duration_minutes=120,
+            description=f"Welcome orientation for {employee_name}",
+            attendees=[employee_email] + ([manager_email] if manager_email else []),
+        ),
+        # 2. Manager 1:1 on day 2
+        schedule_event(
+            title=f"Manager 1:1 - {employee_name}",
+            event_date=start_date + timedelta(days=1),
+            duration_minutes=60,
+            description=f"Initial 1:1 meeting between {employee_name} and manager",
+            attendees=[employee_email] + ([manager_email] if manager_email else []),
+        ),
+        # 3. Buddy meetup on day 3
+        schedule_event(
+            title=f"Buddy Meetup - {employee_name}",
+            event_date=start_date + timedelta(days=2),
+            duration_minutes=45,
+            description=f"Casual meetup between {employee_name} and onboarding buddy",
+            attendees=[employee_email] + ([buddy_email] if buddy_email else []),
+        ),
+    )
+
+    return list(events)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -91,8 +98,8 @@ def _schedule_google_event(
     Requires valid Google OAuth credentials.
     """
     try:
-        from googleapiclient.discovery import build
-        from google.oauth2.credentials import Credentials
+        if not _GOOGLE_AVAILABLE:
+            raise ImportError("google-api-python-client not installed")
 
         # NOTE: In a production app, you would store and retrieve
         # user-specific OAuth tokens from the database.
@@ -117,7 +124,7 @@ def _mock_schedule_event(
 ) -> dict:
     """Return a mock calendar event for demo/testing."""
     return {
-        "id": f"mock_{uuid.uuid4().hex[:12]}",
+        "id": f"mock_{secrets.token_hex(6)}",
         "title": title,
         "date": event_date.isoformat(),
         "duration_minutes": duration_minutes,
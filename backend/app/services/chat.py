@@ -1,14 +1,16 @@
 # app/services/chat.py
 """Policy chatbot service — answers HR questions using RAG + LLM."""
 
-import json
+import asyncio
 from datetime import datetime
 from typing import Optional, AsyncGenerator
 
+import orjson
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
 
 from app.models import ChatConversation, ChatMessage
-from app.services import llm, rag
+from app.services import llm, llm_cache, rag_cache
 
 
 CHAT_SYSTEM_PROMPT = """You are an AI HR Policy Assistant for the company. Your role is to answer employee questions about company policies, benefits, procedures, and guidelines.
@@ -22,13 +24,17 @@ Rules:
 - Never make up policies or benefits that aren't in the context
 - If asked about something clearly outside HR policies (e.g., technical questions), politely redirect"""
 
+# Constant pieces of the streamed SSE JSON frames
+_TOKEN_PREFIX = b'{"type":"token","content":'
+_FRAME_SUFFIX = b"}"
+_DONE_FRAME = b'{"type":"done","content":""}'
+
 
 def create_conversation(db: Session, user_id: Optional[int] = None, title: str = "New Conversation") -> ChatConversation:
     """Create a new chat conversation."""
     conversation = ChatConversation(user_id=user_id, title=title)
     db.add(conversation)
     db.commit()
-    db.refresh(conversation)
     return conversation
 
 
@@ -49,7 +55,6 @@ def get_user_conversations(db: Session, user_id: int) -> list[ChatConversation]:
 
 def get_all_conversations(db: Session, user_id: int) -> list[ChatConversation]:
     """Get conversations for a user + any shared/seeded ones (user_id is None)."""
-    from sqlalchemy import or_
     return (
         db.query(ChatConversation)
         .filter(or_(ChatConversation.user_id == user_id, ChatConversation.user_id.is_(None)))
@@ -81,20 +86,61 @@ def delete_conversation(db: Session, conversation_id: int) -> bool:
 
 def delete_all_conversations(db: Session, user_id: int) -> int:
     """Delete all conversations for a user (including shared/seeded ones). Returns count deleted."""
-    from sqlalchemy import or_
-    convos = (
-        db.query(ChatConversation)
-        .filter(or_(ChatConversation.user_id == user_id, ChatConversation.user_id.is_(None)))
-        .all()
+    owned = or_(ChatConversation.user_id == user_id, ChatConversation.user_id.is_(None))
+    # Two set-based DELETEs instead of a round-trip per conversation
+    conv_ids = select(ChatConversation.id).where(owned).scalar_subquery()
+    db.query(ChatMessage).filter(ChatMessage.conversation_id.in_(conv_ids)).delete(
+        synchronize_session=False
     )
-    count = len(convos)
-    for conv in convos:
-        db.query(ChatMessage).filter(ChatMessage.conversation_id == conv.id).delete()
-        db.delete(conv)
+    count = db.query(ChatConversation).filter(owned).delete(synchronize_session=False)
     db.commit()
     return count
 
 
+def get_recent_messages(db: Session, conversation_id: int, n: int = 6) -> list[ChatMessage]:
+    """Get the last *n* messages in a conversation, oldest first."""
+    recent = (
+        db.query(ChatMessage)
+        .filter(ChatMessage.conversation_id == conversation_id)
+        .order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc())
+        .limit(n)
+        .all()
+    )
+    return recent[::-1]
+
+
+def _build_history_text(messages: list[ChatMessage]) -> str:
+    """Format recent messages as a "User: ... / Assistant: ..." transcript."""
+    return "".join(
+        f"{'User' if msg.role == 'user' else 'Assistant'}: {msg.content}\n\n"
+        for msg in messages
+    )
+
+
+def _build_sources_json(context_results: list[dict]) -> str:
+    """Serialize the source snippets (first 200 chars of each chunk) shown with an answer."""
+    return orjson.dumps([
+        {"text": r["text"][:200], "source": r.get("source", "Policy Document")}
+        for r in context_results
+    ]).decode()
+
+
+def _build_rag_prompt(context: str, history_text: str, question: str) -> str:
+    """Build the policy Q&A prompt shared by the streaming and non-streaming paths."""
+    return f"""Based on the following company policy documents, answer the user's question.
+
+**Policy Context:**
+{context if context else "No relevant policies found in the knowledge base."}
+
+**Conversation History:**
+{history_text}
+
+**Current Question:**
+{question}
+
+Provide a helpful, accurate answer based on the policy context above."""
+
+
 async def answer_question(
     db: Session,
     conversation_id: int,
@@ -106,6 +152,9 @@ async def answer_question(
     if not conversation:
         raise ValueError("Conversation not found")
 
+    # Query RAG for relevant policy chunks (top 5) off-loop while the user message is saved
+    rag_task = asyncio.create_task(asyncio.to_thread(rag_cache.get_or_compute, question, 5))
+
     # Save user message
     user_msg = ChatMessage(
         conversation_id=conversation_id,
@@ -115,40 +164,20 @@ async def answer_question(
     db.add(user_msg)
     db.commit()
 
-    # Query RAG for relevant policy chunks (top 5)
-    context_results = rag.query_policies(question, n_results=5)
+    context_results = await rag_task
     context = "\n\n---\n\n".join([r["text"] for r in context_results])
-    sources_json = json.dumps([
-        {"text": r["text"][:200], "source": r.get("source", "Policy Document")}
-        for r in context_results
-    ])
-
-    # Build conversation history for context (last 6 messages)
-    history = get_conversation_messages(db, conversation_id)
-    history_text = ""
-    for msg in history[-6:]:
-        role_label = "User" if msg.role == "user" else "Assistant"
-        history_text += f"{role_label}: {msg.content}\n\n"
-
-    # Build prompt
-    prompt = f"""Based on the following company policy documents, answer the user's question.
-
-**Policy Context:**
-{context if context else "No relevant policies found in the knowledge base."}
+    sources_json = _build_sources_json(context_results)
 
-**Conversation History:**
-{history_text}
-
-**Current Question:**
-{question}
-
-Provide a helpful, accurate answer based on the policy context above."""
+    # Build prompt with conversation history for context (last 6 messages)
+    history = get_recent_messages(db, conversation_id, n=6)
+    prompt = _build_rag_prompt(context, _build_history_text(history), question)
 
     # Generate response
-    response_content = await llm.generate_text(
+    response_content = await llm_cache.cached_generate(
         prompt=prompt,
         system_prompt=CHAT_SYSTEM_PROMPT,
         context="",  # Context already in prompt
+        temperature=0,  # Grounded policy answers; repeat questions hit the cache
     )
 
     # Save assistant message
@@ -166,7 +195,6 @@ Provide a helpful, accurate answer based on the policy context above."""
         conversation.title = question[:80] + ("…" if len(question) > 80 else "")
 
     db.commit()
-    db.refresh(assistant_msg)
     return assistant_msg
 
 
@@ -175,13 +203,16 @@ async def answer_question_stream(
     conversation_id: int,
     question: str,
     user_id: Optional[int] = None,
-) -> AsyncGenerator[str, None]:
-    """Stream the AI response token by token via SSE."""
+) -> AsyncGenerator[bytes, None]:
+    """Stream the AI response token by token via SSE (pre-serialized JSON frames)."""
     conversation = get_conversation(db, conversation_id)
     if not conversation:
-        yield json.dumps({"type": "error", "content": "Conversation not found"})
+        yield orjson.dumps({"type": "error", "content": "Conversation not found"})
         return
 
+    # Query RAG off-loop while the user message is saved
+    rag_task = asyncio.create_task(asyncio.to_thread(rag_cache.get_or_compute, question, 5))
+
     # Save user message
     user_msg = ChatMessage(
         conversation_id=conversation_id,
@@ -191,46 +222,29 @@ async def answer_question_stream(
     db.add(user_msg)
     db.commit()
 
-    # Query RAG
-    context_results = rag.query_policies(question, n_results=5)
+    context_results = await rag_task
     context = "\n\n---\n\n".join([r["text"] for r in context_results])
-    sources_json = json.dumps([
-        {"text": r["text"][:200], "source": r.get("source", "Policy Document")}
-        for r in context_results
-    ])
+    sources_json = _build_sources_json(context_results)
 
     # Emit sources first
-    yield json.dumps({"type": "sources", "content": sources_json})
-
-    # Build conversation history
-    history = get_conversation_messages(db, conversation_id)
-    history_text = ""
-    for msg in history[-6:]:
-        role_label = "User" if msg.role == "user" else "Assistant"
-        history_text += f"{role_label}: {msg.content}\n\n"
-
-    prompt = f"""Based on the following company policy documents, answer the user's question.
-
-**Policy Context:**
-{context if context else "No relevant policies found in the knowledge base."}
+    yield orjson.dumps({"type": "sources", "content": sources_json})
 
-**Conversation History:**
-{history_text}
-
-**Current Question:**
-{question}
-
-Provide a helpful, accurate answer based on the policy context above."""
+    # Build prompt with conversation history
+    history = get_recent_messages(db, conversation_id, n=6)
+    prompt = _build_rag_prompt(context, _build_history_text(history), question)
 
     # Stream LLM response
-    full_response = ""
+    parts: list[str] = []
     async for chunk in llm.generate_text_stream(
         prompt=prompt,
         system_prompt=CHAT_SYSTEM_PROMPT,
         context="",
+        temperature=0,  # Same answers as the non-streaming endpoint
     ):
-        full_response += chunk
-        yield json.dumps({"type": "token", "content": chunk})
+        parts.append(chunk)
+        # Splice the encoded token into a constant frame — no dict per token
+        yield _TOKEN_PREFIX + orjson.dumps(chunk) + _FRAME_SUFFIX
+    full_response = "".join(parts)
 
     # Save complete response
     assistant_msg = ChatMessage(
@@ -245,4 +259,4 @@ Provide a helpful, accurate answer based on the policy context above."""
         conversation.title = question[:80] + ("…" if len(question) > 80 else "")
     db.commit()
 
-    yield json.dumps({"type": "done", "content": ""})
+    yield _DONE_FRAME
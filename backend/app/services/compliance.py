@@ -3,6 +3,7 @@
 
 from datetime import date, timedelta
 
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
 
 from app.models import ComplianceItem, ComplianceStatus, Employee
@@ -33,17 +34,15 @@ def get_expiring_soon(db: Session, days: int = 60) -> list[dict]:
 
 def get_expired(db: Session) -> list[dict]:
     """Get all expired items."""
+    # Update status if needed
+    _mark_expired(db, date.today())
+    db.commit()
     items = (
         db.query(ComplianceItem)
         .filter(ComplianceItem.expiry_date < date.today())
         .order_by(ComplianceItem.expiry_date.desc())
         .all()
     )
-    # Update status if needed
-    for item in items:
-        if item.status != ComplianceStatus.EXPIRED:
-            item.status = ComplianceStatus.EXPIRED
-    db.commit()
     return _enrich_items(db, items)
 
 
@@ -80,33 +79,38 @@ def create_item(db: Session, data: ComplianceItemCreate) -> ComplianceItem:
     )
     db.add(item)
     db.commit()
-    db.refresh(item)
     return item
 
 
 def get_summary(db: Session) -> dict:
     """Get compliance summary counts."""
-    all_items = db.query(ComplianceItem).all()
-
-    # Refresh statuses based on current date
+    # Refresh statuses based on current date (server-side bulk UPDATEs)
     today = date.today()
-    for item in all_items:
-        if item.expiry_date < today and item.status != ComplianceStatus.EXPIRED:
-            item.status = ComplianceStatus.EXPIRED
-        elif item.expiry_date <= today + timedelta(days=60) and item.expiry_date >= today:
-            if item.status == ComplianceStatus.VALID:
-                item.status = ComplianceStatus.EXPIRING_SOON
+    _mark_expired(db, today)
+    db.execute(
+        update(ComplianceItem)
+        .where(
+            ComplianceItem.expiry_date.between(today, today + timedelta(days=60)),
+            ComplianceItem.status == ComplianceStatus.VALID,
+        )
+        .values(status=ComplianceStatus.EXPIRING_SOON)
+    )
     db.commit()
 
-    valid = sum(1 for i in all_items if i.status == ComplianceStatus.VALID)
-    expiring = sum(1 for i in all_items if i.status == ComplianceStatus.EXPIRING_SOON)
-    expired = sum(1 for i in all_items if i.status == ComplianceStatus.EXPIRED)
+    counts = dict(
+        db.query(ComplianceItem.status, func.count(ComplianceItem.id))
+        .group_by(ComplianceItem.status)
+        .all()
+    )
+    valid = counts.get(ComplianceStatus.VALID, 0)
+    expiring = counts.get(ComplianceStatus.EXPIRING_SOON, 0)
+    expired = counts.get(ComplianceStatus.EXPIRED, 0)
 
     return {
         "valid": valid,
         "expiring_soon": expiring,
         "expired": expired,
-        "total": len(all_items),
+        "total": sum(counts.values()),
     }
 
 
@@ -147,12 +151,28 @@ def generate_predictive_alert() -> list[dict]:
     ]
 
 
+def _mark_expired(db: Session, today: date) -> None:
+    """Flip every past-expiry item to EXPIRED in a single UPDATE."""
+    db.execute(
+        update(ComplianceItem)
+        .where(
+            ComplianceItem.expiry_date < today,
+            ComplianceItem.status != ComplianceStatus.EXPIRED,
+        )
+        .values(status=ComplianceStatus.EXPIRED)
+    )
+
+
 def _enrich_items(db: Session, items: list[ComplianceItem]) -> list[dict]:
     """Enrich compliance items with employee name and days remaining."""
     today = date.today()
+    employee_ids = {item.employee_id for item in items}
+    names = (
+        dict(db.query(Employee.id, Employee.name).filter(Employee.id.in_(employee_ids)).all())
+        if employee_ids else {}
+    )
     result = []
     for item in items:
-        employee = db.query(Employee).filter(Employee.id == item.employee_id).first()
         days_remaining = (item.expiry_date - today).days
 
         result.append({
@@ -164,7 +184,7 @@ def _enrich_items(db: Session, items: list[ComplianceItem]) -> list[dict]:
             "status": item.status.value if hasattr(item.status, "value") else item.status,
             "reminder_sent": item.reminder_sent,
             "created_at": item.created_at.isoformat() if item.created_at else None,
-            "employee_name": employee.name if employee else "Unknown",
+            "employee_name": names.get(item.employee_id, "Unknown"),
             "days_remaining": days_remaining,
         })
     return result
@@ -1,12 +1,17 @@
 # app/services/document_generator.py
 """Document generation service — creates jurisdiction-aware legal documents using LLM + RAG."""
 
+import asyncio
+import functools
+import threading
+import time
 from typing import Optional
 
 from sqlalchemy.orm import Session
 
 from app.models import Employee, GeneratedDocument, DocumentStatus, JurisdictionTemplate
 from app.services import llm, rag
+from app.prompts import render_template
 from app.prompts.documents import (
     EMPLOYMENT_CONTRACT_PROMPT,
     NDA_PROMPT,
@@ -15,43 +20,91 @@ from app.prompts.documents import (
 )
 
 
-def _get_jurisdiction_template(db: Session, jurisdiction: str, document_type: str) -> Optional[str]:
-    """Fetch the jurisdiction-specific template content."""
-    template = (
-        db.query(JurisdictionTemplate)
-        .filter(
-            JurisdictionTemplate.jurisdiction_code == jurisdiction.upper(),
-            JurisdictionTemplate.document_type == document_type,
-        )
-        .first()
-    )
-    return template.template_content if template else None
+# Templates are near-static seed data; cache (content, legal_requirements) briefly
+_TEMPLATE_CACHE_TTL = 300.0  # seconds
+_template_cache: dict[tuple[str, str], tuple[float, Optional[str], Optional[str]]] = {}
+_template_cache_lock = threading.Lock()
+
 
+def invalidate_template_cache() -> None:
+    """Drop cached jurisdiction templates (call after changing template rows)."""
+    with _template_cache_lock:
+        _template_cache.clear()
 
-def _get_legal_requirements(db: Session, jurisdiction: str, document_type: str) -> Optional[str]:
-    """Fetch legal requirements for a jurisdiction + document type."""
-    template = (
-        db.query(JurisdictionTemplate)
+
+def _get_jurisdiction_template(
+    db: Session, jurisdiction: str, document_type: str
+) -> tuple[Optional[str], Optional[str]]:
+    """Fetch the jurisdiction template content and legal requirements in one query."""
+    key = (jurisdiction.upper(), document_type)
+    now = time.monotonic()
+    with _template_cache_lock:
+        entry = _template_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1], entry[2]
+
+    row = (
+        db.query(JurisdictionTemplate.template_content, JurisdictionTemplate.legal_requirements)
         .filter(
-            JurisdictionTemplate.jurisdiction_code == jurisdiction.upper(),
+            JurisdictionTemplate.jurisdiction_code == key[0],
             JurisdictionTemplate.document_type == document_type,
         )
         .first()
     )
-    return template.legal_requirements if template else None
-
-
-async def generate_employment_contract(db: Session, employee: Employee) -> GeneratedDocument:
-    """Generate an employment contract using jurisdiction template + LLM + RAG."""
-    jurisdiction = employee.jurisdiction or "US"
-    template = _get_jurisdiction_template(db, jurisdiction, "employment_contract")
-    legal_reqs = _get_legal_requirements(db, jurisdiction, "employment_contract")
-
-    # Get policy context from RAG
-    context_results = rag.query_policies("employment contract terms conditions onboarding")
-    context = "\n".join([r["text"] for r in context_results])
-
-    prompt = EMPLOYMENT_CONTRACT_PROMPT.format(
+    content, legal_reqs = (row.template_content, row.legal_requirements) if row else (None, None)
+    with _template_cache_lock:
+        _template_cache[key] = (now + _TEMPLATE_CACHE_TTL, content, legal_reqs)
+    return content, legal_reqs
+
+
+# Canonical RAG query per document type — constant, so the context is memoized
+_POLICY_QUERIES = {
+    "employment_contract": "employment contract terms conditions onboarding",
+    "nda": "non-disclosure agreement confidentiality intellectual property",
+    "equity_agreement": "equity stock options vesting compensation",
+    "offer_letter": "offer letter employment terms compensation benefits",
+}
+
+
+async def _policy_context_for(document_type: str) -> str:
+    """Return the joined policy context for a document type.
+
+    The query strings are constant, so results are reused until the policy
+    index changes (embed/delete bump rag.index_version). Looked up in a
+    worker thread so a cache miss's vector search doesn't block the loop.
+    A failed lookup falls back to a single uncached query_policies call.
+    """
+    try:
+        contexts = await asyncio.to_thread(_policy_contexts, rag.index_version)
+    except Exception as e:
+        print(f"⚠️  RAG policy context lookup failed: {e}")
+        results = await asyncio.to_thread(rag.query_policies, _POLICY_QUERIES[document_type])
+        return "\n".join(r["text"] for r in results)
+    return contexts[document_type]
+
+
+def warm_policy_contexts(refresh: bool = False) -> None:
+    """Build the cached policy contexts now (after dropping them if *refresh*)."""
+    if refresh:
+        _policy_contexts.cache_clear()
+    _policy_contexts(rag.index_version)
+
+
+@functools.lru_cache(maxsize=4)
+def _policy_contexts(index_version: int) -> dict[str, str]:
+    # One batched embed + search for every document type; raises rather
+    # than caching mock context when the vector store is unavailable
+    batches = rag.query_policies_batch(list(_POLICY_QUERIES.values()), fallback=False)
+    return {
+        document_type: "\n".join(r["text"] for r in results)
+        for document_type, results in zip(_POLICY_QUERIES, batches)
+    }
+
+
+def _build_employment_contract_prompt(db: Session, employee: Employee, jurisdiction: str) -> str:
+    template, legal_reqs = _get_jurisdiction_template(db, jurisdiction, "employment_contract")
+    return render_template(
+        EMPLOYMENT_CONTRACT_PROMPT,
         name=employee.name,
         role=employee.role,
         department=employee.department,
@@ -62,31 +115,11 @@ async def generate_employment_contract(db: Session, employee: Employee) -> Gener
         legal_requirements=legal_reqs or "[]",
     )
 
-    content = await llm.generate_text(prompt=prompt, context=context)
-
-    doc = GeneratedDocument(
-        employee_id=employee.id,
-        document_type="employment_contract",
-        jurisdiction=jurisdiction,
-        content=content,
-        status=DocumentStatus.DRAFT,
-    )
-    db.add(doc)
-    db.commit()
-    db.refresh(doc)
-    return doc
-
 
-async def generate_nda(db: Session, employee: Employee) -> GeneratedDocument:
-    """Generate an NDA using jurisdiction template + LLM + RAG."""
-    jurisdiction = employee.jurisdiction or "US"
-    template = _get_jurisdiction_template(db, jurisdiction, "nda")
-    legal_reqs = _get_legal_requirements(db, jurisdiction, "nda")
-
-    context_results = rag.query_policies("non-disclosure agreement confidentiality intellectual property")
-    context = "\n".join([r["text"] for r in context_results])
-
-    prompt = NDA_PROMPT.format(
+def _build_nda_prompt(db: Session, employee: Employee, jurisdiction: str) -> str:
+    template, legal_reqs = _get_jurisdiction_template(db, jurisdiction, "nda")
+    return render_template(
+        NDA_PROMPT,
         name=employee.name,
         role=employee.role,
         department=employee.department,
@@ -96,29 +129,10 @@ async def generate_nda(db: Session, employee: Employee) -> GeneratedDocument:
         legal_requirements=legal_reqs or "[]",
     )
 
-    content = await llm.generate_text(prompt=prompt, context=context)
-
-    doc = GeneratedDocument(
-        employee_id=employee.id,
-        document_type="nda",
-        jurisdiction=jurisdiction,
-        content=content,
-        status=DocumentStatus.DRAFT,
-    )
-    db.add(doc)
-    db.commit()
-    db.refresh(doc)
-    return doc
-
-
-async def generate_equity_agreement(db: Session, employee: Employee) -> GeneratedDocument:
-    """Generate an equity/stock agreement using LLM + RAG."""
-    jurisdiction = employee.jurisdiction or "US"
-
-    context_results = rag.query_policies("equity stock options vesting compensation")
-    context = "\n".join([r["text"] for r in context_results])
 
-    prompt = EQUITY_AGREEMENT_PROMPT.format(
+def _build_equity_agreement_prompt(db: Session, employee: Employee, jurisdiction: str) -> str:
+    return render_template(
+        EQUITY_AGREEMENT_PROMPT,
         name=employee.name,
         role=employee.role,
         department=employee.department,
@@ -126,31 +140,11 @@ async def generate_equity_agreement(db: Session, employee: Employee) -> Generate
         jurisdiction=jurisdiction,
     )
 
-    content = await llm.generate_text(prompt=prompt, context=context)
 
-    doc = GeneratedDocument(
-        employee_id=employee.id,
-        document_type="equity_agreement",
-        jurisdiction=jurisdiction,
-        content=content,
-        status=DocumentStatus.DRAFT,
-    )
-    db.add(doc)
-    db.commit()
-    db.refresh(doc)
-    return doc
-
-
-async def generate_offer_letter_doc(db: Session, employee: Employee) -> GeneratedDocument:
-    """Generate a formal offer letter document using jurisdiction template + LLM + RAG."""
-    jurisdiction = employee.jurisdiction or "US"
-    template = _get_jurisdiction_template(db, jurisdiction, "offer_letter")
-    legal_reqs = _get_legal_requirements(db, jurisdiction, "offer_letter")
-
-    context_results = rag.query_policies("offer letter employment terms compensation benefits")
-    context = "\n".join([r["text"] for r in context_results])
-
-    prompt = OFFER_LETTER_DOCUMENT_PROMPT.format(
+def _build_offer_letter_prompt(db: Session, employee: Employee, jurisdiction: str) -> str:
+    template, legal_reqs = _get_jurisdiction_template(db, jurisdiction, "offer_letter")
+    return render_template(
+        OFFER_LETTER_DOCUMENT_PROMPT,
         name=employee.name,
         role=employee.role,
         department=employee.department,
@@ -161,21 +155,61 @@ async def generate_offer_letter_doc(db: Session, employee: Employee) -> Generate
         legal_requirements=legal_reqs or "[]",
     )
 
-    content = await llm.generate_text(prompt=prompt, context=context)
 
-    doc = GeneratedDocument(
+_PROMPT_BUILDERS = {
+    "employment_contract": _build_employment_contract_prompt,
+    "nda": _build_nda_prompt,
+    "equity_agreement": _build_equity_agreement_prompt,
+    "offer_letter": _build_offer_letter_prompt,
+}
+
+
+async def _render_document(db: Session, employee: Employee, document_type: str) -> str:
+    """Generate the LLM content for one document type (template + RAG context + prompt)."""
+    jurisdiction = employee.jurisdiction or "US"
+    prompt = _PROMPT_BUILDERS[document_type](db, employee, jurisdiction)
+    context = await _policy_context_for(document_type)
+    return await llm.generate_text(prompt=prompt, context=context)
+
+
+def _new_document(employee: Employee, document_type: str, content: str) -> GeneratedDocument:
+    return GeneratedDocument(
         employee_id=employee.id,
-        document_type="offer_letter",
-        jurisdiction=jurisdiction,
+        document_type=document_type,
+        jurisdiction=employee.jurisdiction or "US",
         content=content,
         status=DocumentStatus.DRAFT,
     )
+
+
+async def _generate_document(db: Session, employee: Employee, document_type: str) -> GeneratedDocument:
+    content = await _render_document(db, employee, document_type)
+    doc = _new_document(employee, document_type, content)
     db.add(doc)
     db.commit()
-    db.refresh(doc)
     return doc
 
 
+async def generate_employment_contract(db: Session, employee: Employee) -> GeneratedDocument:
+    """Generate an employment contract using jurisdiction template + LLM + RAG."""
+    return await _generate_document(db, employee, "employment_contract")
+
+
+async def generate_nda(db: Session, employee: Employee) -> GeneratedDocument:
+    """Generate an NDA using jurisdiction template + LLM + RAG."""
+    return await _generate_document(db, employee, "nda")
+
+
+async def generate_equity_agreement(db: Session, employee: Employee) -> GeneratedDocument:
+    """Generate an equity/stock agreement using LLM + RAG."""
+    return await _generate_document(db, employee, "equity_agreement")
+
+
+async def generate_offer_letter_doc(db: Session, employee: Employee) -> GeneratedDocument:
+    """Generate a formal offer letter document using jurisdiction template + LLM + RAG."""
+    return await _generate_document(db, employee, "offer_letter")
+
+
 def get_documents_by_employee(db: Session, employee_id: int) -> list[GeneratedDocument]:
     """Get all generated documents for an employee."""
     return (
@@ -199,5 +233,4 @@ def update_document_content(db: Session, document_id: int, content: str) -> Opti
     doc.content = content
     doc.version += 1
     db.commit()
-    db.refresh(doc)
     return doc
@@ -7,13 +7,85 @@ Used as the primary embedding function for the RAG pipeline.
 Docs: https://docs.voyageai.com/
 """
 
+import functools
 import os
+import queue
+import random
+import threading
 import time
-from typing import List
+from concurrent.futures import Future
+from typing import Callable, List
 
 from app.config import settings
 
 
+class _EmbedBatcher:
+    """Coalesces embed requests from concurrent callers into batched API calls.
+
+    Texts are queued individually; a background worker drains up to
+    *max_batch* of them (waiting at most *max_wait* seconds for more to
+    arrive) and embeds them in a single request.
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], List[List[float]]],
+        max_batch: int = 128,
+        max_wait: float = 0.01,
+    ):
+        self._embed_batch = embed_batch
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._queue: "queue.Queue[tuple[str, Future]]" = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+
+    def submit(self, texts: List[str]) -> List[Future]:
+        """Queue texts for embedding; returns one future per text."""
+        self._ensure_worker()
+        futures = []
+        for text in texts:
+            future: Future = Future()
+            self._queue.put((text, future))
+            futures.append(future)
+        return futures
+
+    def _ensure_worker(self) -> None:
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="voyage-embed-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                embeddings = self._embed_batch([text for text, _ in batch])
+                if len(embeddings) != len(batch):
+                    raise RuntimeError(
+                        f"Embedding provider returned {len(embeddings)} vectors for {len(batch)} texts"
+                    )
+            except Exception as e:
+                # Every caller must be resolved, or it would block forever
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), embedding in zip(batch, embeddings):
+                future.set_result(embedding)
+
+
 class VoyageEmbeddingFunction:
     """ChromaDB-compatible embedding function using Voyage AI.
 
@@ -22,12 +94,14 @@ class VoyageEmbeddingFunction:
         embeddings = ef(["Hello world", "Another sentence"])
     """
 
-    def __init__(self, api_key: str = "", model: str = ""):
+    def __init__(self, api_key: str = "", model: str = "", dtype: str = ""):
         """Initialize the Voyage AI client.
 
         Args:
             api_key: Voyage AI API key. Falls back to VOYAGE_API_KEY env var / settings.
             model:   Embedding model name. Falls back to settings.VOYAGE_EMBEDDING_MODEL.
+            dtype:   Output dtype ("float" or "int8"). Falls back to settings.VOYAGE_OUTPUT_DTYPE.
+                     int8 shrinks the API payload 4x; only the voyage-3 family supports it.
         """
         import voyageai
 
@@ -39,15 +113,22 @@ class VoyageEmbeddingFunction:
             )
 
         self.client = voyageai.Client(api_key=resolved_key)
+        self._non_retryable = _non_retryable_errors()
         self.model = model or settings.VOYAGE_EMBEDDING_MODEL or "voyage-2"
+        self.dtype = dtype or settings.VOYAGE_OUTPUT_DTYPE or "float"
+        if self.dtype not in ("float", "int8"):
+            raise ValueError(f"Unsupported Voyage output dtype: {self.dtype}")
+        if self.dtype != "float" and not self.model.startswith("voyage-3"):
+            raise ValueError(f"Voyage model {self.model} does not support output_dtype={self.dtype}")
         self._max_retries = 3
         self._retry_delay = 1.0  # seconds
+        self._batcher = _EmbedBatcher(self._embed_batch)
 
     def __call__(self, input: List[str]) -> List[List[float]]:
         """Generate embeddings for a list of texts.
 
-        Compatible with ChromaDB's EmbeddingFunction protocol.
-        Includes retry logic for transient API failures.
+        Compatible with ChromaDB's EmbeddingFunction protocol. Requests from
+        concurrent callers are coalesced into shared batched API calls.
 
         Args:
             input: List of text strings to embed.
@@ -55,17 +136,32 @@ class VoyageEmbeddingFunction:
         Returns:
             List of embedding vectors (list of floats).
         """
+        return [future.result() for future in self._batcher.submit(input)]
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed one batch with a single API call, retrying transient failures.
+
+        Runs on the batcher's worker thread, so backoff sleeps never block
+        the event loop.
+        """
         last_error = None
 
         for attempt in range(1, self._max_retries + 1):
             try:
-                result = self.client.embed(texts=input, model=self.model)
+                if self.dtype == "float":
+                    result = self.client.embed(texts=texts, model=self.model)
+                else:
+                    result = self.client.embed(texts=texts, model=self.model, output_dtype=self.dtype)
                 return result.embeddings
             except Exception as e:
+                if isinstance(e, self._non_retryable):
+                    raise
                 last_error = e
                 if attempt < self._max_retries:
-                    wait = self._retry_delay * attempt
-                    print(f"⚠️  Voyage AI embed attempt {attempt} failed: {e}. Retrying in {wait}s...")
+                    wait = _retry_after(e) or (
+                        self._retry_delay * 2 ** (attempt - 1) + random.uniform(0, 0.25)
+                    )
+                    print(f"⚠️  Voyage AI embed attempt {attempt} failed: {e}. Retrying in {wait:.2f}s...")
                     time.sleep(wait)
 
         raise RuntimeError(
@@ -73,6 +169,27 @@ class VoyageEmbeddingFunction:
         )
 
 
+def _non_retryable_errors() -> tuple[type[Exception], ...]:
+    """Voyage error types not worth retrying (bad key / bad request)."""
+    from voyageai import error as voyage_error
+
+    return tuple(
+        getattr(voyage_error, name)
+        for name in ("AuthenticationError", "InvalidRequestError", "MalformedRequestError")
+        if hasattr(voyage_error, name)
+    )
+
+
+def _retry_after(error: Exception) -> float | None:
+    """Seconds requested by a Retry-After header on the error, if present."""
+    headers = getattr(error, "headers", None) or {}
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
 def get_voyage_embedding_function() -> VoyageEmbeddingFunction:
     """Factory function to create a VoyageEmbeddingFunction.
 
@@ -85,10 +202,12 @@ def get_voyage_embedding_function() -> VoyageEmbeddingFunction:
     return VoyageEmbeddingFunction()
 
 
+@functools.cache
 def get_langchain_voyage_embeddings():
     """Get a LangChain-compatible Voyage AI embedding model.
 
-    Useful for LangChain pipelines and document loaders.
+    Useful for LangChain pipelines and document loaders. The instance is
+    created once and shared.
 
     Returns:
         VoyageAIEmbeddings instance for LangChain.
@@ -2,24 +2,45 @@
 """Employee CRUD operations and CSV bulk import."""
 
 import csv
+import functools
 import io
-from datetime import date
+import itertools
+import re
+from datetime import date, datetime
 from typing import Optional
 
+from sqlalchemy import insert, select, tuple_
 from sqlalchemy.orm import Session
 
 from app.models import Employee, EmployeeStatus
 from app.schemas import EmployeeCreate, EmployeeUpdate
 
+# Rows validated / inserted per batch during CSV import
+IMPORT_CHUNK_SIZE = 1000
 
-def get_all_employees(db: Session) -> list[Employee]:
-    """Return all employees ordered by creation date descending."""
-    return db.query(Employee).order_by(Employee.created_at.desc()).all()
+_US_DATE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$")
+
+
+def get_all_employees(
+    db: Session,
+    *,
+    limit: int = 100,
+    cursor: Optional[tuple[datetime, int]] = None,
+) -> list[Employee]:
+    """Return a page of employees ordered by creation date descending.
+
+    Pass the ``(created_at, id)`` of the last row seen as *cursor* to fetch
+    the next page; the ID breaks ties between rows from the same bulk import.
+    """
+    stmt = select(Employee).order_by(Employee.created_at.desc(), Employee.id.desc()).limit(limit)
+    if cursor is not None:
+        stmt = stmt.where(tuple_(Employee.created_at, Employee.id) < cursor)
+    return list(db.scalars(stmt))
 
 
 def get_employee_by_id(db: Session, employee_id: int) -> Optional[Employee]:
     """Fetch a single employee by ID."""
-    return db.query(Employee).filter(Employee.id == employee_id).first()
+    return db.get(Employee, employee_id)
 
 
 def get_employee_by_email(db: Session, email: str) -> Optional[Employee]:
@@ -27,17 +48,28 @@ def get_employee_by_email(db: Session, email: str) -> Optional[Employee]:
     return db.query(Employee).filter(Employee.email == email).first()
 
 
-def create_employee(db: Session, payload: EmployeeCreate) -> Employee:
-    """Create a new employee record."""
+def create_employee(db: Session, payload: EmployeeCreate, *, commit: bool = True) -> Employee:
+    """Create a new employee record.
+
+    Pass ``commit=False`` to batch several writes into the caller's
+    transaction; the row is flushed so its ID is still populated.
+    """
     employee = Employee(**payload.model_dump())
     db.add(employee)
-    db.commit()
-    db.refresh(employee)
+    if commit:
+        db.commit()
+    else:
+        db.flush()
     return employee
 
 
-def update_employee(db: Session, employee_id: int, payload: EmployeeUpdate) -> Optional[Employee]:
-    """Update an existing employee. Returns None if not found."""
+def update_employee(
+    db: Session, employee_id: int, payload: EmployeeUpdate, *, commit: bool = True
+) -> Optional[Employee]:
+    """Update an existing employee. Returns None if not found.
+
+    Pass ``commit=False`` to leave the change in the caller's transaction.
+    """
     employee = get_employee_by_id(db, employee_id)
     if not employee:
         return None
@@ -46,18 +78,26 @@ def update_employee(db: Session, employee_id: int, payload: EmployeeUpdate) -> O
     for key, value in update_data.items():
         setattr(employee, key, value)
 
-    db.commit()
-    db.refresh(employee)
+    if commit:
+        db.commit()
+    else:
+        db.flush()
     return employee
 
 
-def delete_employee(db: Session, employee_id: int) -> bool:
-    """Delete an employee. Returns True if deleted, False if not found."""
+def delete_employee(db: Session, employee_id: int, *, commit: bool = True) -> bool:
+    """Delete an employee. Returns True if deleted, False if not found.
+
+    Pass ``commit=False`` to leave the delete in the caller's transaction.
+    """
     employee = get_employee_by_id(db, employee_id)
     if not employee:
         return False
     db.delete(employee)
-    db.commit()
+    if commit:
+        db.commit()
+    else:
+        db.flush()
     return True
 
 
@@ -68,10 +108,16 @@ def bulk_import_csv(db: Session, file_content: bytes) -> dict:
     Expected CSV columns:
         name, email, role, department, start_date, manager_email, buddy_email
 
+    Rows are streamed from the reader in chunks of IMPORT_CHUNK_SIZE — each
+    chunk gets one duplicate-email query and one bulk INSERT — and the whole
+    import is committed once at the end.
+
     Returns dict with { total, created, errors }.
     """
     errors: list[str] = []
+    total = 0
     created = 0
+    seen_in_file: set[str] = set()
 
     try:
         text = file_content.decode("utf-8")
@@ -79,13 +125,48 @@ def bulk_import_csv(db: Session, file_content: bytes) -> dict:
         text = file_content.decode("latin-1")
 
     reader = csv.DictReader(io.StringIO(text))
-    rows = list(reader)
+    # Normalise column names once from the header (strip whitespace, lowercase)
+    key_map = {
+        k: k.strip().lower().replace(" ", "_") for k in (reader.fieldnames or []) if k
+    }
+    numbered = enumerate(reader, start=2)  # row 1 is header
+
+    while chunk := list(itertools.islice(numbered, IMPORT_CHUNK_SIZE)):
+        total += len(chunk)
+        to_insert = _validate_import_chunk(db, chunk, key_map, seen_in_file, errors)
+        if to_insert:
+            # One executemany-style INSERT (insertmanyvalues) instead of per-object ORM flushes
+            db.execute(insert(Employee), to_insert)
+            created += len(to_insert)
 
-    for i, row in enumerate(rows, start=2):  # row 1 is header
-        try:
-            # Normalise column names (strip whitespace, lowercase)
-            row = {k.strip().lower().replace(" ", "_"): v.strip() for k, v in row.items() if k}
+    if created > 0:
+        db.commit()
 
+    return {"total": total, "created": created, "errors": errors}
+
+
+def _validate_import_chunk(
+    db: Session,
+    chunk: list[tuple[int, dict]],
+    key_map: dict[str, str],
+    seen_in_file: set[str],
+    errors: list[str],
+) -> list[dict]:
+    """Validate a chunk of numbered CSV rows; returns insertable rows and appends errors."""
+    rows = [
+        (i, {key_map[k]: (v or "").strip() for k, v in row.items() if k in key_map})
+        for i, row in chunk
+    ]
+
+    # One query for every email already in the table instead of a SELECT per row
+    candidate_emails = {row["email"] for _, row in rows if row.get("email")}
+    existing_emails = set(
+        db.scalars(select(Employee.email).where(Employee.email.in_(candidate_emails))).all()
+    ) if candidate_emails else set()
+
+    to_insert: list[dict] = []
+    for i, row in rows:
+        try:
             name = row.get("name", "")
             email = row.get("email", "")
             role = row.get("role", "")
@@ -98,39 +179,49 @@ def bulk_import_csv(db: Session, file_content: bytes) -> dict:
                 errors.append(f"Row {i}: Missing required fields")
                 continue
 
-            # Parse date (supports YYYY-MM-DD and MM/DD/YYYY)
-            try:
-                start_date = date.fromisoformat(start_date_str)
-            except ValueError:
-                try:
-                    parts = start_date_str.split("/")
-                    start_date = date(int(parts[2]), int(parts[0]), int(parts[1]))
-                except (ValueError, IndexError):
-                    errors.append(f"Row {i}: Invalid date format '{start_date_str}'")
-                    continue
-
-            # Skip duplicates
-            existing = get_employee_by_email(db, email)
-            if existing:
-                errors.append(f"Row {i}: Email '{email}' already exists")
+            start_date = _parse_start_date(start_date_str)
+            if start_date is None:
+                errors.append(f"Row {i}: Invalid date format '{start_date_str}'")
                 continue
 
-            employee = Employee(
-                name=name,
-                email=email,
-                role=role,
-                department=department,
-                start_date=start_date,
-                manager_email=manager_email,
-                buddy_email=buddy_email,
-            )
-            db.add(employee)
-            created += 1
+            # Skip duplicates (already stored, or repeated earlier in this file)
+            if email in existing_emails or email in seen_in_file:
+                errors.append(f"Row {i}: Email '{email}' already exists")
+                continue
+            seen_in_file.add(email)
+
+            to_insert.append({
+                "name": name,
+                "email": email,
+                "role": role,
+                "department": department,
+                "start_date": start_date,
+                "manager_email": manager_email,
+                "buddy_email": buddy_email,
+            })
 
         except Exception as e:
             errors.append(f"Row {i}: {str(e)}")
 
-    if created > 0:
-        db.commit()
+    return to_insert
+
 
-    return {"total": len(rows), "created": created, "errors": errors}
+@functools.lru_cache(maxsize=4096)
+def _parse_start_date(value: str) -> Optional[date]:
+    """Parse YYYY-MM-DD or MM/DD/YYYY; None if invalid.
+
+    Cached because imports repeat a handful of cohort start dates.
+    """
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+
+    m = _US_DATE.match(value)
+    if m is None:
+        return None
+    month, day, year = map(int, m.groups())
+    try:
+        return date(year, month, day)
+    except ValueError:  # well-formed but out of range, e.g. 02/30/2025
+        return None
@@ -6,14 +6,29 @@ Falls back to mock responses when API keys are not configured.
 """
 
 import asyncio
+import contextlib
+import functools
+import hashlib
+import re
 from typing import AsyncGenerator
 
 from app.config import settings
 from app.prompts.templates import SYSTEM_PROMPT
 
 
+OPENAI_MODEL = "gpt-4"
+ANTHROPIC_MODEL = "claude-3-sonnet-20240229"
+
+# Sampling temperature for generated prose; deterministic call sites pass 0
+DEFAULT_TEMPERATURE = 0.7
+
+
+@functools.lru_cache(maxsize=1)
 def _get_provider() -> str:
-    """Determine which LLM provider to use based on config + available keys."""
+    """Determine which LLM provider to use based on config + available keys.
+
+    Settings are fixed for the process lifetime, so the result is memoized.
+    """
     provider = settings.LLM_PROVIDER.lower()
 
     # If the preferred provider has a key, use it
@@ -36,10 +51,26 @@ def _get_provider() -> str:
     return "mock"
 
 
+def get_model_id() -> str:
+    """Return "<provider>:<model>" for the provider generate_text would use."""
+    provider = _get_provider()
+    model = {
+        "groq": settings.GROQ_MODEL,
+        "openai": OPENAI_MODEL,
+        "anthropic": ANTHROPIC_MODEL,
+    }.get(provider, "mock")
+    return f"{provider}:{model}"
+
+
+# (provider, system_prompt, context, prompt, temperature) -> in-flight generation
+_inflight: dict[tuple[str, str, str, str, float], asyncio.Future] = {}
+
+
 async def generate_text(
     prompt: str,
     system_prompt: str = SYSTEM_PROMPT,
     context: str = "",
+    temperature: float = DEFAULT_TEMPERATURE,
 ) -> str:
     """
     Generate text using the configured LLM provider.
@@ -47,21 +78,42 @@ async def generate_text(
     Falls back to a mock response when no API keys are configured.
     """
     provider = _get_provider()
-
-    if provider == "groq":
-        return await _generate_groq(prompt, system_prompt, context)
-    elif provider == "openai":
-        return await _generate_openai(prompt, system_prompt, context)
-    elif provider == "anthropic":
-        return await _generate_anthropic(prompt, system_prompt, context)
-    else:
+    if provider == "mock":
         return _mock_generate(prompt)
 
+    # Identical requests already in flight share one provider call
+    key = (provider, system_prompt, context, prompt, temperature)
+    call = _inflight.get(key)
+    if call is None:
+        call = asyncio.ensure_future(_generate_limited(provider, prompt, system_prompt, context, temperature))
+        _inflight[key] = call
+        call.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so one caller's cancellation doesn't fail the others
+    return await asyncio.shield(call)
+
+
+async def _generate_limited(
+    provider: str,
+    prompt: str,
+    system_prompt: str,
+    context: str,
+    temperature: float,
+) -> str:
+    """Call the provider while holding one of its concurrency slots."""
+    async with _provider_semaphore(provider):
+        if provider == "groq":
+            return await _generate_groq(prompt, system_prompt, context, temperature)
+        elif provider == "openai":
+            return await _generate_openai(prompt, system_prompt, context, temperature)
+        else:
+            return await _generate_anthropic(prompt, system_prompt, context, temperature)
+
 
 async def generate_text_stream(
     prompt: str,
     system_prompt: str = SYSTEM_PROMPT,
     context: str = "",
+    temperature: float = DEFAULT_TEMPERATURE,
 ) -> AsyncGenerator[str, None]:
     """
     Stream text generation token-by-token for the Agent Thinking Panel.
@@ -71,27 +123,167 @@ async def generate_text_stream(
     provider = _get_provider()
 
     if provider == "groq":
-        async for chunk in _stream_groq(prompt, system_prompt, context):
-            yield chunk
+        source = _stream_groq(prompt, system_prompt, context, temperature)
     elif provider == "openai":
-        async for chunk in _stream_openai(prompt, system_prompt, context):
-            yield chunk
+        source = _stream_openai(prompt, system_prompt, context, temperature)
     elif provider == "anthropic":
-        async for chunk in _stream_anthropic(prompt, system_prompt, context):
-            yield chunk
+        source = _stream_anthropic(prompt, system_prompt, context, temperature)
     else:
-        async for chunk in _mock_stream(prompt):
+        source = _mock_stream(prompt)
+
+    if provider != "mock":
+        source = _with_limit(provider, source)
+
+    async for chunk in _coalesce(source):
+        yield chunk
+
+
+async def _with_limit(provider: str, source: AsyncGenerator[str, None]) -> AsyncGenerator[str, None]:
+    """Hold the provider's concurrency slot for the lifetime of a stream."""
+    async with _provider_semaphore(provider):
+        async for chunk in source:
             yield chunk
 
 
+_STREAM_END = object()
+
+
+async def _coalesce(
+    source: AsyncGenerator[str, None],
+    max_ms: float = 16,
+    max_chars: int = 64,
+) -> AsyncGenerator[str, None]:
+    """Group provider tokens into larger chunks.
+
+    A pump task drains *source* into a bounded queue; buffered tokens are
+    flushed once they reach *max_chars* or *max_ms* after the first one
+    arrived, so downstream SSE frames carry several tokens each without
+    visibly delaying output. Errors from *source* are re-raised here.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+
+    async def pump():
+        try:
+            async for chunk in source:
+                await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_STREAM_END)
+
+    pump_task = asyncio.create_task(pump())
+    loop = asyncio.get_running_loop()
+    buf: list[str] = []
+    size = 0
+    deadline = 0.0
+    try:
+        while True:
+            timeout = max(deadline - loop.time(), 0) if buf else None
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield "".join(buf)
+                buf, size = [], 0
+                continue
+
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                if buf:
+                    yield "".join(buf)
+                raise item
+
+            if not buf:
+                deadline = loop.time() + max_ms / 1000
+            buf.append(item)
+            size += len(item)
+            if size >= max_chars:
+                yield "".join(buf)
+                buf, size = [], 0
+
+        if buf:
+            yield "".join(buf)
+    finally:
+        # Close the source too: a pump blocked on a full queue leaves it
+        # suspended, still holding its provider concurrency slot
+        pump_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await pump_task
+        await source.aclose()
+
+
+# ─────────────────────────────────────────────────────────────
+# Shared provider clients — one per process so HTTP connections
+# (and TLS sessions) are pooled across calls
+# ─────────────────────────────────────────────────────────────
+
+@functools.cache
+def _groq_client():
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(
+        api_key=settings.GROQ_API_KEY,
+        base_url="https://api.groq.com/openai/v1",
+        max_retries=settings.LLM_MAX_RETRIES,
+    )
+
+
+@functools.cache
+def _openai_client():
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=settings.OPENAI_API_KEY, max_retries=settings.LLM_MAX_RETRIES)
+
+
+@functools.cache
+def _anthropic_client():
+    from anthropic import AsyncAnthropic
+
+    return AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY, max_retries=settings.LLM_MAX_RETRIES)
+
+
+@functools.cache
+def _provider_semaphore(provider: str) -> asyncio.Semaphore:
+    """Per-provider concurrency cap.
+
+    Bursts queue here instead of fanning out into 429s and the SDK's retry
+    backoff.
+    """
+    return asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+
+
+async def shutdown_clients() -> None:
+    """Close any provider clients that were created (call on app shutdown)."""
+    for factory in (_groq_client, _openai_client, _anthropic_client):
+        if factory.cache_info().currsize:
+            await factory().close()
+            factory.cache_clear()
+
+
+_CONTEXT_PREFIX = "Use the following company policy context to inform your response:\n\n"
+
+# Shared (never mutated) system message for the default prompt
+_DEFAULT_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+
+@functools.lru_cache(maxsize=256)
+def _prompt_cache_key(system_prompt: str, context: str) -> str:
+    """OpenAI prompt_cache_key: calls sharing a system prompt + policy context prefix hit the same cache."""
+    h = hashlib.blake2b(digest_size=8)
+    h.update(system_prompt.encode("utf-8"))
+    h.update(b"\x00")
+    h.update(context.encode("utf-8"))
+    return h.hexdigest()
+
+
 def _build_messages(prompt: str, system_prompt: str, context: str) -> list[dict]:
     """Build the messages array used by OpenAI-compatible APIs (OpenAI, Groq)."""
-    messages = [{"role": "system", "content": system_prompt}]
+    if system_prompt is SYSTEM_PROMPT:
+        messages = [_DEFAULT_SYSTEM_MESSAGE]
+    else:
+        messages = [{"role": "system", "content": system_prompt}]
     if context:
-        messages.append({
-            "role": "user",
-            "content": f"Use the following company policy context to inform your response:\n\n{context}",
-        })
+        messages.append({"role": "user", "content": f"{_CONTEXT_PREFIX}{context}"})
     messages.append({"role": "user", "content": prompt})
     return messages
 
@@ -100,41 +292,31 @@ def _build_messages(prompt: str, system_prompt: str, context: str) -> list[dict]
 # Groq implementation (OpenAI-compatible API)
 # ─────────────────────────────────────────────────────────────
 
-async def _generate_groq(prompt: str, system_prompt: str, context: str) -> str:
+async def _generate_groq(prompt: str, system_prompt: str, context: str, temperature: float) -> str:
     """Generate text using Groq (Llama 3.3, Mixtral, etc.)."""
-    from openai import AsyncOpenAI
-
-    client = AsyncOpenAI(
-        api_key=settings.GROQ_API_KEY,
-        base_url="https://api.groq.com/openai/v1",
-    )
+    client = _groq_client()
 
     messages = _build_messages(prompt, system_prompt, context)
 
     response = await client.chat.completions.create(
         model=settings.GROQ_MODEL,
         messages=messages,
-        temperature=0.7,
+        temperature=temperature,
         max_tokens=2000,
     )
     return response.choices[0].message.content or ""
 
 
-async def _stream_groq(prompt: str, system_prompt: str, context: str) -> AsyncGenerator[str, None]:
+async def _stream_groq(prompt: str, system_prompt: str, context: str, temperature: float) -> AsyncGenerator[str, None]:
     """Stream text from Groq."""
-    from openai import AsyncOpenAI
-
-    client = AsyncOpenAI(
-        api_key=settings.GROQ_API_KEY,
-        base_url="https://api.groq.com/openai/v1",
-    )
+    client = _groq_client()
 
     messages = _build_messages(prompt, system_prompt, context)
 
     stream = await client.chat.completions.create(
         model=settings.GROQ_MODEL,
         messages=messages,
-        temperature=0.7,
+        temperature=temperature,
         max_tokens=2000,
         stream=True,
     )
@@ -147,35 +329,35 @@ async def _stream_groq(prompt: str, system_prompt: str, context: str) -> AsyncGe
 # OpenAI implementation
 # ─────────────────────────────────────────────────────────────
 
-async def _generate_openai(prompt: str, system_prompt: str, context: str) -> str:
+async def _generate_openai(prompt: str, system_prompt: str, context: str, temperature: float) -> str:
     """Generate text using OpenAI GPT-4."""
-    from openai import AsyncOpenAI
-
-    client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    client = _openai_client()
 
     messages = _build_messages(prompt, system_prompt, context)
 
     response = await client.chat.completions.create(
-        model="gpt-4",
+        model=OPENAI_MODEL,
         messages=messages,
-        temperature=0.7,
+        # extra_body: prompt_cache_key isn't a keyword on older openai SDKs
+        extra_body={"prompt_cache_key": _prompt_cache_key(system_prompt, context)},
+        temperature=temperature,
         max_tokens=2000,
     )
     return response.choices[0].message.content or ""
 
 
-async def _stream_openai(prompt: str, system_prompt: str, context: str) -> AsyncGenerator[str, None]:
+async def _stream_openai(prompt: str, system_prompt: str, context: str, temperature: float) -> AsyncGenerator[str, None]:
     """Stream text from OpenAI."""
-    from openai import AsyncOpenAI
-
-    client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    client = _openai_client()
 
     messages = _build_messages(prompt, system_prompt, context)
 
     stream = await client.chat.completions.create(
-        model="gpt-4",
+        model=OPENAI_MODEL,
         messages=messages,
-        temperature=0.7,
+        # extra_body: prompt_cache_key isn't a keyword on older openai SDKs
+        extra_body={"prompt_cache_key": _prompt_cache_key(system_prompt, context)},
+        temperature=temperature,
         max_tokens=2000,
         stream=True,
     )
@@ -188,46 +370,57 @@ async def _stream_openai(prompt: str, system_prompt: str, context: str) -> Async
 # Anthropic implementation
 # ─────────────────────────────────────────────────────────────
 
-async def _generate_anthropic(prompt: str, system_prompt: str, context: str) -> str:
-    """Generate text using Anthropic Claude."""
-    from anthropic import AsyncAnthropic
+# Prompt-cache marker for the system prompt and policy context blocks.
+# Setting LLM_PROMPT_CACHE_TTL (e.g. "1h") keeps them warm between workflows
+# rather than only within the default 5-minute window; it is opt-in because
+# the extended TTL needs a model and account that support it.
+_CACHE_CONTROL = {"type": "ephemeral"}
+if settings.LLM_PROMPT_CACHE_TTL:
+    _CACHE_CONTROL["ttl"] = settings.LLM_PROMPT_CACHE_TTL
 
-    client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
 
-    user_content = prompt
+def _anthropic_system(system_prompt: str) -> list[dict]:
+    """System prompt as a cacheable block — it's identical across nearly every call."""
+    return [{"type": "text", "text": system_prompt, "cache_control": _CACHE_CONTROL}]
+
+
+def _anthropic_user_content(prompt: str, context: str) -> list[dict]:
+    """User turn with the (reused) policy context as its own cached prefix block."""
+    blocks = []
     if context:
-        user_content = (
-            f"Use the following company policy context to inform your response:\n\n"
-            f"{context}\n\n---\n\n{prompt}"
-        )
+        blocks.append({
+            "type": "text",
+            "text": f"{_CONTEXT_PREFIX}{context}\n\n---\n\n",
+            "cache_control": _CACHE_CONTROL,
+        })
+    blocks.append({"type": "text", "text": prompt})
+    return blocks
+
+
+async def _generate_anthropic(prompt: str, system_prompt: str, context: str, temperature: float) -> str:
+    """Generate text using Anthropic Claude."""
+    client = _anthropic_client()
 
     message = await client.messages.create(
-        model="claude-3-sonnet-20240229",
+        model=ANTHROPIC_MODEL,
         max_tokens=2000,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_content}],
+        temperature=temperature,
+        system=_anthropic_system(system_prompt),
+        messages=[{"role": "user", "content": _anthropic_user_content(prompt, context)}],
     )
     return message.content[0].text
 
 
-async def _stream_anthropic(prompt: str, system_prompt: str, context: str) -> AsyncGenerator[str, None]:
+async def _stream_anthropic(prompt: str, system_prompt: str, context: str, temperature: float) -> AsyncGenerator[str, None]:
     """Stream text from Anthropic Claude."""
-    from anthropic import AsyncAnthropic
-
-    client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
-
-    user_content = prompt
-    if context:
-        user_content = (
-            f"Use the following company policy context to inform your response:\n\n"
-            f"{context}\n\n---\n\n{prompt}"
-        )
+    client = _anthropic_client()
 
     async with client.messages.stream(
-        model="claude-3-sonnet-20240229",
+        model=ANTHROPIC_MODEL,
         max_tokens=2000,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_content}],
+        temperature=temperature,
+        system=_anthropic_system(system_prompt),
+        messages=[{"role": "user", "content": _anthropic_user_content(prompt, context)}],
     ) as stream:
         async for text in stream.text_stream:
             yield text
@@ -237,127 +430,143 @@ async def _stream_anthropic(prompt: str, system_prompt: str, context: str) -> As
 # Mock implementation (for demos / no API keys)
 # ─────────────────────────────────────────────────────────────
 
+_MOCK_WELCOME_EMAIL = (
+    "**Subject: Welcome to the Team! 🎉**\n\n"
+    "Dear New Team Member,\n\n"
+    "We're thrilled to welcome you! Your start date is approaching, "
+    "and we want to make sure you have everything you need for a smooth onboarding.\n\n"
+    "**Here's what to expect on your first day:**\n"
+    "- ☀️ Orientation session at 9:00 AM\n"
+    "- 🤝 Meet your buddy and manager\n"
+    "- 💻 IT setup and equipment collection\n"
+    "- 🍽️ Team lunch\n\n"
+    "**First Week Overview:**\n"
+    "- Day 1: Orientation & setup\n"
+    "- Day 2: Manager 1:1 & tool walkthroughs\n"
+    "- Day 3: Buddy meetup & department deep-dive\n"
+    "- Day 4-5: Self-paced training & first project introduction\n\n"
+    "Please don't hesitate to reach out if you have any questions.\n\n"
+    "Best regards,\nHR Team\n\n"
+    "---\n*[Mock response — connect an OpenAI or Anthropic API key for real AI generation]*"
+)
+
+_MOCK_OFFER_LETTER = (
+    "# OFFER OF EMPLOYMENT\n\n"
+    "**CONFIDENTIAL**\n\n"
+    "Dear Candidate,\n\n"
+    "We are pleased to offer you a position with our company. "
+    "Your compensation package includes a competitive salary and comprehensive benefits.\n\n"
+    "**Position Details:**\n"
+    "- Start Date: As specified\n"
+    "- Reporting To: Your assigned manager\n"
+    "- Employment Type: Full-time\n\n"
+    "**Benefits Include:**\n"
+    "- Health, dental, and vision insurance\n"
+    "- 401(k) with company match\n"
+    "- Unlimited PTO policy\n"
+    "- Professional development budget\n\n"
+    "This offer is contingent upon successful completion of background verification.\n\n"
+    "Please sign and return within 5 business days.\n\n"
+    "Sincerely,\nHR Department\n\n"
+    "---\n*[Mock response — connect an OpenAI or Anthropic API key for real AI generation]*"
+)
+
+_MOCK_PLAN_30_60_90 = (
+    "# 30-60-90 Day Onboarding Plan\n\n"
+    "## 📘 First 30 Days — Learn & Orient\n"
+    "- Complete all onboarding training modules\n"
+    "- Meet all team members and key stakeholders\n"
+    "- Understand team processes, tools, and workflows\n"
+    "- Shadow senior team members on active projects\n"
+    "- Weekly check-in with manager every Friday\n\n"
+    "## 📗 Days 31-60 — Contribute & Collaborate\n"
+    "- Take ownership of initial tasks and deliverables\n"
+    "- Attend cross-functional meetings independently\n"
+    "- Identify areas for improvement in current processes\n"
+    "- Complete first independent code review / deliverable\n"
+    "- Mid-point feedback session with manager\n\n"
+    "## 📕 Days 61-90 — Own & Deliver\n"
+    "- Drive independent projects end-to-end\n"
+    "- Present learnings and findings to the team\n"
+    "- Set goals for the next quarter with manager\n"
+    "- Mentor the next new hire (if applicable)\n"
+    "- 90-day performance review\n\n"
+    "---\n*[Mock response — connect an OpenAI or Anthropic API key for real AI generation]*"
+)
+
+_MOCK_EQUIPMENT_REQUEST = (
+    "# IT Equipment Provisioning Request\n\n"
+    "**Status:** 📋 Pending\n\n"
+    "## Hardware\n"
+    "- [x] Laptop (MacBook Pro 14\" or equivalent)\n"
+    "- [x] Monitor (27\" 4K)\n"
+    "- [x] Keyboard and mouse\n"
+    "- [x] Headset for meetings\n"
+    "- [x] Access badge\n\n"
+    "## Software Licenses\n"
+    "- [x] Email & collaboration suite\n"
+    "- [x] Chat & video conferencing\n"
+    "- [x] Department-specific tools\n"
+    "- [x] VPN client\n"
+    "- [x] Password manager\n\n"
+    "## Access & Accounts\n"
+    "- [x] Company email account\n"
+    "- [x] Internal wiki / documentation\n"
+    "- [x] Project management tool\n"
+    "- [x] Code repository access (if applicable)\n\n"
+    "**Estimated Provisioning Time:** 24-48 hours before start date\n\n"
+    "---\n*[Mock response — connect an OpenAI or Anthropic API key for real AI generation]*"
+)
+
+_MOCK_VALIDATION_SUMMARY = (
+    "# Employee Data Validation Summary\n\n"
+    "**Status:** ✅ Ready for onboarding\n\n"
+    "## Data Completeness Check\n"
+    "- ✅ Name: Provided\n"
+    "- ✅ Email: Valid format\n"
+    "- ✅ Role: Provided\n"
+    "- ✅ Department: Provided\n"
+    "- ✅ Start Date: Valid date\n"
+    "- ⚠️ Manager Email: Review needed\n"
+    "- ⚠️ Buddy Email: Review needed\n\n"
+    "## Readiness Assessment\n"
+    "All critical fields are present. Employee is ready to proceed with onboarding.\n\n"
+    "---\n*[Mock response — connect an OpenAI or Anthropic API key for real AI generation]*"
+)
+
+# Checked in priority order; first matching pattern wins
+_MOCK_DISPATCH: tuple[tuple[re.Pattern, str], ...] = (
+    (re.compile(r"welcome email", re.IGNORECASE), _MOCK_WELCOME_EMAIL),
+    (re.compile(r"offer letter", re.IGNORECASE), _MOCK_OFFER_LETTER),
+    (re.compile(r"30-60-90|plan", re.IGNORECASE), _MOCK_PLAN_30_60_90),
+    (re.compile(r"equipment|provisioning", re.IGNORECASE), _MOCK_EQUIPMENT_REQUEST),
+    (re.compile(r"validate|analyze|parse", re.IGNORECASE), _MOCK_VALIDATION_SUMMARY),
+)
+
+
+@functools.lru_cache(maxsize=64)
 def _mock_generate(prompt: str) -> str:
     """Return a mock response for demo/testing without real API keys."""
-    prompt_lower = prompt.lower()
-
-    if "welcome email" in prompt_lower:
-        return (
-            "**Subject: Welcome to the Team! 🎉**\n\n"
-            "Dear New Team Member,\n\n"
-            "We're thrilled to welcome you! Your start date is approaching, "
-            "and we want to make sure you have everything you need for a smooth onboarding.\n\n"
-            "**Here's what to expect on your first day:**\n"
-            "- ☀️ Orientation session at 9:00 AM\n"
-            "- 🤝 Meet your buddy and manager\n"
-            "- 💻 IT setup and equipment collection\n"
-            "- 🍽️ Team lunch\n\n"
-            "**First Week Overview:**\n"
-            "- Day 1: Orientation & setup\n"
-            "- Day 2: Manager 1:1 & tool walkthroughs\n"
-            "- Day 3: Buddy meetup & department deep-dive\n"
-            "- Day 4-5: Self-paced training & first project introduction\n\n"
-            "Please don't hesitate to reach out if you have any questions.\n\n"
-            "Best regards,\nHR Team\n\n"
-            "---\n*[Mock response — connect an OpenAI or Anthropic API key for real AI generation]*"
-        )
-    elif "offer letter" in prompt_lower:
-        return (
-            "# OFFER OF EMPLOYMENT\n\n"
-            "**CONFIDENTIAL**\n\n"
-            "Dear Candidate,\n\n"
-            "We are pleased to offer you a position with our company. "
-            "Your compensation package includes a competitive salary and comprehensive benefits.\n\n"
-            "**Position Details:**\n"
-            "- Start Date: As specified\n"
-            "- Reporting To: Your assigned manager\n"
-            "- Employment Type: Full-time\n\n"
-            "**Benefits Include:**\n"
-            "- Health, dental, and vision insurance\n"
-            "- 401(k) with company match\n"
-            "- Unlimited PTO policy\n"
-            "- Professional development budget\n\n"
-            "This offer is contingent upon successful completion of background verification.\n\n"
-            "Please sign and return within 5 business days.\n\n"
-            "Sincerely,\nHR Department\n\n"
-            "---\n*[Mock response — connect an OpenAI or Anthropic API key for real AI generation]*"
-        )
-    elif "30-60-90" in prompt_lower or "plan" in prompt_lower:
-        return (
-            "# 30-60-90 Day Onboarding Plan\n\n"
-            "## 📘 First 30 Days — Learn & Orient\n"
-            "- Complete all onboarding training modules\n"
-            "- Meet all team members and key stakeholders\n"
-            "- Understand team processes, tools, and workflows\n"
-            "- Shadow senior team members on active projects\n"
-            "- Weekly check-in with manager every Friday\n\n"
-            "## 📗 Days 31-60 — Contribute & Collaborate\n"
-            "- Take ownership of initial tasks and deliverables\n"
-            "- Attend cross-functional meetings independently\n"
-            "- Identify areas for improvement in current processes\n"
-            "- Complete first independent code review / deliverable\n"
-            "- Mid-point feedback session with manager\n\n"
-            "## 📕 Days 61-90 — Own & Deliver\n"
-            "- Drive independent projects end-to-end\n"
-            "- Present learnings and findings to the team\n"
-            "- Set goals for the next quarter with manager\n"
-            "- Mentor the next new hire (if applicable)\n"
-            "- 90-day performance review\n\n"
-            "---\n*[Mock response — connect an OpenAI or Anthropic API key for real AI generation]*"
-        )
-    elif "equipment" in prompt_lower or "provisioning" in prompt_lower:
-        return (
-            "# IT Equipment Provisioning Request\n\n"
-            "**Status:** 📋 Pending\n\n"
-            "## Hardware\n"
-            "- [x] Laptop (MacBook Pro 14\" or equivalent)\n"
-            "- [x] Monitor (27\" 4K)\n"
-            "- [x] Keyboard and mouse\n"
-            "- [x] Headset for meetings\n"
-            "- [x] Access badge\n\n"
-            "## Software Licenses\n"
-            "- [x] Email & collaboration suite\n"
-            "- [x] Chat & video conferencing\n"
-            "- [x] Department-specific tools\n"
-            "- [x] VPN client\n"
-            "- [x] Password manager\n\n"
-            "## Access & Accounts\n"
-            "- [x] Company email account\n"
-            "- [x] Internal wiki / documentation\n"
-            "- [x] Project management tool\n"
-            "- [x] Code repository access (if applicable)\n\n"
-            "**Estimated Provisioning Time:** 24-48 hours before start date\n\n"
-            "---\n*[Mock response — connect an OpenAI or Anthropic API key for real AI generation]*"
-        )
-    elif "validate" in prompt_lower or "analyze" in prompt_lower or "parse" in prompt_lower:
-        return (
-            "# Employee Data Validation Summary\n\n"
-            "**Status:** ✅ Ready for onboarding\n\n"
-            "## Data Completeness Check\n"
-            "- ✅ Name: Provided\n"
-            "- ✅ Email: Valid format\n"
-            "- ✅ Role: Provided\n"
-            "- ✅ Department: Provided\n"
-            "- ✅ Start Date: Valid date\n"
-            "- ⚠️ Manager Email: Review needed\n"
-            "- ⚠️ Buddy Email: Review needed\n\n"
-            "## Readiness Assessment\n"
-            "All critical fields are present. Employee is ready to proceed with onboarding.\n\n"
-            "---\n*[Mock response — connect an OpenAI or Anthropic API key for real AI generation]*"
-        )
-    else:
-        return (
-            f"# Generated Content\n\n"
-            f"Generated response for the requested task.\n\n"
-            f"*Prompt summary:* {prompt[:150]}...\n\n"
-            "---\n*[Mock response — connect an OpenAI or Anthropic API key for real AI generation]*"
-        )
+    for pattern, response in _MOCK_DISPATCH:
+        if pattern.search(prompt):
+            return response
+    return (
+        f"# Generated Content\n\n"
+        f"Generated response for the requested task.\n\n"
+        f"*Prompt summary:* {prompt[:150]}...\n\n"
+        "---\n*[Mock response — connect an OpenAI or Anthropic API key for real AI generation]*"
+    )
+
+
+_MOCK_STREAM_CHUNK_WORDS = 8
 
 
 async def _mock_stream(prompt: str):
-    """Yield mock content word-by-word for streaming simulation."""
+    """Yield mock content a few words at a time for streaming simulation."""
     response = _mock_generate(prompt)
     words = response.split(" ")
-    for word in words:
-        await asyncio.sleep(0.03)  # Simulate realistic token delay
-        yield word + " "
+    delay = settings.MOCK_STREAM_DELAY_MS / 1000.0
+    for i in range(0, len(words), _MOCK_STREAM_CHUNK_WORDS):
+        if delay:
+            await asyncio.sleep(delay)  # Optional typing effect for demos
+        yield " ".join(words[i:i + _MOCK_STREAM_CHUNK_WORDS]) + " "
@@ -0,0 +1,209 @@
+# app/services/llm_cache.py
+"""Two-tier response cache in front of llm.generate_text.
+
+Only deterministic (temperature 0) calls are cached; sampled output is
+always generated fresh. Identical (system prompt, context, prompt)
+triples — common for repeated HR FAQ questions — are answered from:
+  1. an in-process LRU (L1), then
+  2. a shared L2 — Redis when REDIS_URL is configured, otherwise the
+     ``llm_cache`` database table (survives restarts) —
+before falling through to the LLM provider.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import AsyncGenerator, Optional
+
+from app.config import settings
+from app.prompts.templates import SYSTEM_PROMPT
+from app.services import llm
+from app.services.llm_cache_store import LLMCacheStore
+
+L1_MAX_ENTRIES = 1024
+L1_TTL_SECONDS = 3600
+L2_TTL_SECONDS = 3600
+_KEY_PREFIX = "llm:"
+
+_l1: "OrderedDict[str, tuple[float, str]]" = OrderedDict()  # key -> (expires_at, response)
+_l1_lock = threading.Lock()
+
+_stats = {"l1_hits": 0, "l2_hits": 0, "misses": 0}
+
+# Lazy-loaded Redis client (False = unavailable, don't retry)
+_redis = None
+
+# Database-backed L2, used when Redis isn't available
+_store = LLMCacheStore(ttl_seconds=L2_TTL_SECONDS)
+
+
+def _cache_key(model_id: str, prompt: str, system_prompt: str, context: str) -> str:
+    """Content hash of everything that determines the LLM response.
+
+    Includes the active provider/model so switching LLM_PROVIDER (or a model
+    setting) never serves responses generated by a different model.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for part in (model_id, system_prompt, context, prompt):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _l1_get(key: str) -> Optional[str]:
+    """Read from the in-process LRU, refreshing recency on hit."""
+    with _l1_lock:
+        entry = _l1.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _l1[key]
+            return None
+        _l1.move_to_end(key)
+        return entry[1]
+
+
+def _l1_set(key: str, value: str) -> None:
+    """Write to the in-process LRU, evicting the least recently used entry."""
+    with _l1_lock:
+        _l1[key] = (time.monotonic() + L1_TTL_SECONDS, value)
+        _l1.move_to_end(key)
+        while len(_l1) > L1_MAX_ENTRIES:
+            _l1.popitem(last=False)
+
+
+def _get_redis():
+    """Return the shared async Redis client, or None if not configured/installed."""
+    global _redis
+
+    if _redis is None:
+        _redis = False
+        if settings.REDIS_URL:
+            try:
+                import redis.asyncio as redis_asyncio
+
+                _redis = redis_asyncio.from_url(settings.REDIS_URL, decode_responses=True)
+            except ImportError:
+                print("⚠️  redis package not installed. LLM cache will use the database for L2.")
+    return _redis or None
+
+
+async def _l2_get(key: str) -> Optional[str]:
+    """Read from Redis (or the database store); failures are treated as a miss."""
+    client = _get_redis()
+    try:
+        if client is None:
+            return await _store.get(key)
+        return await client.get(_KEY_PREFIX + key)
+    except Exception as e:
+        print(f"⚠️  LLM cache L2 read failed: {e}")
+        return None
+
+
+async def _l2_set(key: str, value: str, model_id: str, latency_ms: int) -> None:
+    """Write to Redis (or the database store) with a TTL; failures are logged and ignored."""
+    client = _get_redis()
+    try:
+        if client is None:
+            await _store.put(key, value, model_id, latency_ms)
+        else:
+            await client.setex(_KEY_PREFIX + key, L2_TTL_SECONDS, value)
+    except Exception as e:
+        print(f"⚠️  LLM cache L2 write failed: {e}")
+
+
+async def _lookup(key: str) -> Optional[str]:
+    """Check L1, then L2 (promoting hits into L1); counts hits and misses."""
+    cached = _l1_get(key)
+    if cached is not None:
+        _stats["l1_hits"] += 1
+        return cached
+
+    cached = await _l2_get(key)
+    if cached is not None:
+        _stats["l2_hits"] += 1
+        _l1_set(key, cached)
+        return cached
+
+    _stats["misses"] += 1
+    return None
+
+
+async def _remember(key: str, response: str, model_id: str, started: float) -> None:
+    """Store a fresh (non-empty) response in both tiers."""
+    if response:
+        _l1_set(key, response)
+        await _l2_set(key, response, model_id, int((time.perf_counter() - started) * 1000))
+
+
+async def cached_generate(
+    prompt: str,
+    system_prompt: str = SYSTEM_PROMPT,
+    context: str = "",
+    temperature: float = llm.DEFAULT_TEMPERATURE,
+) -> str:
+    """Drop-in replacement for llm.generate_text that consults the L1/L2 caches first.
+
+    Calls with a non-zero *temperature* bypass the caches.
+    """
+    if temperature != 0:
+        return await llm.generate_text(
+            prompt=prompt, system_prompt=system_prompt, context=context, temperature=temperature,
+        )
+
+    model_id = llm.get_model_id()
+    key = _cache_key(model_id, prompt, system_prompt, context)
+
+    cached = await _lookup(key)
+    if cached is not None:
+        return cached
+
+    started = time.perf_counter()
+    response = await llm.generate_text(prompt=prompt, system_prompt=system_prompt, context=context, temperature=0)
+    await _remember(key, response, model_id, started)
+    return response
+
+
+async def cached_generate_stream(
+    prompt: str,
+    system_prompt: str = SYSTEM_PROMPT,
+    context: str = "",
+    temperature: float = llm.DEFAULT_TEMPERATURE,
+) -> AsyncGenerator[str, None]:
+    """Drop-in replacement for llm.generate_text_stream backed by the same caches.
+
+    A hit is yielded as a single chunk; a miss streams from the provider and
+    is stored once the stream completes. Calls with a non-zero *temperature*
+    stream straight from the provider.
+    """
+    if temperature != 0:
+        async for chunk in llm.generate_text_stream(
+            prompt=prompt, system_prompt=system_prompt, context=context, temperature=temperature,
+        ):
+            yield chunk
+        return
+
+    model_id = llm.get_model_id()
+    key = _cache_key(model_id, prompt, system_prompt, context)
+
+    cached = await _lookup(key)
+    if cached is not None:
+        yield cached
+        return
+
+    started = time.perf_counter()
+    parts: list[str] = []
+    async for chunk in llm.generate_text_stream(
+        prompt=prompt, system_prompt=system_prompt, context=context, temperature=0,
+    ):
+        parts.append(chunk)
+        yield chunk
+    await _remember(key, "".join(parts), model_id, started)
+
+
+def cache_stats() -> dict:
+    """Hit/miss counters plus the current L1 size."""
+    with _l1_lock:
+        size = len(_l1)
+    return {**_stats, "l1_entries": size}
@@ -0,0 +1,65 @@
+# app/services/llm_cache_store.py
+"""Database-backed store for cached LLM responses.
+
+Used as the shared L2 tier of llm_cache when Redis isn't configured, so
+cached responses survive restarts and are shared by every worker pointed
+at the same database.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete
+
+from app.database import SessionLocal
+from app.models import LLMCacheEntry
+
+
+class LLMCacheStore:
+    """Read/write cached responses in the ``llm_cache`` table.
+
+    The engine is synchronous, so calls run in a worker thread with their
+    own short-lived session.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+
+    async def get(self, prompt_hash: str) -> Optional[str]:
+        """Return the cached response for *prompt_hash* if present and unexpired."""
+        return await asyncio.to_thread(self._get, prompt_hash)
+
+    async def put(
+        self,
+        prompt_hash: str,
+        response_text: str,
+        model_id: str,
+        latency_ms: Optional[int] = None,
+    ) -> None:
+        """Insert or replace the cached response for *prompt_hash*."""
+        await asyncio.to_thread(self._put, prompt_hash, response_text, model_id, latency_ms)
+
+    def _get(self, prompt_hash: str) -> Optional[str]:
+        with SessionLocal() as db:
+            entry = db.get(LLMCacheEntry, prompt_hash)
+            if entry is None or entry.expires_at <= datetime.utcnow():
+                return None
+            return entry.response_text
+
+    def _put(self, prompt_hash: str, response_text: str, model_id: str, latency_ms: Optional[int]) -> None:
+        provider, _, model_name = model_id.partition(":")
+        now = datetime.utcnow()
+        with SessionLocal() as db:
+            # Opportunistically drop expired rows so the table doesn't grow unbounded
+            db.execute(delete(LLMCacheEntry).where(LLMCacheEntry.expires_at <= now))
+            db.merge(LLMCacheEntry(
+                prompt_hash=prompt_hash,
+                provider=provider,
+                model_name=model_name,
+                response_text=response_text,
+                latency_ms=latency_ms,
+                created_at=now,
+                expires_at=now + timedelta(seconds=self.ttl_seconds),
+            ))
+            db.commit()
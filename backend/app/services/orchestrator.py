@@ -1,12 +1,16 @@
 # app/services/orchestrator.py
 """Workflow orchestration engine — manages the expanded onboarding pipeline."""
 
-import json
 import asyncio
-from datetime import datetime
-from typing import Optional, AsyncGenerator
+import contextlib
+import functools
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import AsyncIterator, Awaitable, Callable, Optional, AsyncGenerator
 
-from sqlalchemy.orm import Session
+import orjson
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.models import (
     Employee,
@@ -17,7 +21,8 @@ from app.models import (
     StepStatus,
     WorkflowStatus,
 )
-from app.services import llm, rag
+from app.services import llm, llm_cache, rag
+from app.services import document_generator
 from app.services.calendar import schedule_onboarding_events
 from app.services.document_generator import (
     generate_employment_contract,
@@ -26,7 +31,7 @@ from app.services.document_generator import (
     generate_offer_letter_doc,
 )
 from app.services.approval import create_approval_request
-from app.prompts import get_template
+from app.prompts import get_template, render_template
 from app.prompts.templates import PARSE_DATA_PROMPT
 
 
@@ -55,6 +60,45 @@ APPROVAL_STEPS = {
     StepType.OFFER_LETTER,
 }
 
+# Steps each step must wait for. Steps whose dependencies are all satisfied
+# run concurrently; everything after the approval gate depends on the
+# approval documents so it only runs once they've been generated (and approved).
+_AFTER_VALIDATION = (StepType.PARSE_DATA, StepType.DETECT_JURISDICTION)
+_AFTER_APPROVAL = tuple(t for t in STEP_ORDER if t in APPROVAL_STEPS)
+
+STEP_DEPS: dict[StepType, tuple[StepType, ...]] = {
+    StepType.PARSE_DATA: (),
+    StepType.DETECT_JURISDICTION: (),
+    StepType.EMPLOYMENT_CONTRACT: _AFTER_VALIDATION,
+    StepType.NDA: _AFTER_VALIDATION,
+    StepType.EQUITY_AGREEMENT: _AFTER_VALIDATION,
+    StepType.OFFER_LETTER: _AFTER_VALIDATION,
+    StepType.WELCOME_EMAIL: _AFTER_APPROVAL,
+    StepType.PLAN_30_60_90: _AFTER_APPROVAL,
+    StepType.SCHEDULE_EVENTS: _AFTER_APPROVAL,
+    StepType.EQUIPMENT_REQUEST: _AFTER_APPROVAL,
+}
+
+
+def _execution_levels(steps: list[OnboardingStep]) -> list[list[OnboardingStep]]:
+    """Group a workflow's outstanding steps into levels that can run concurrently.
+
+    Already-completed steps count as satisfied dependencies (resume/retry),
+    and each level keeps the steps in their original order.
+    """
+    done = {s.step_type for s in steps if s.status == StepStatus.COMPLETED}
+    pending = [s for s in steps if s.status != StepStatus.COMPLETED]
+
+    levels = []
+    while pending:
+        level = [s for s in pending if all(d in done for d in STEP_DEPS.get(s.step_type, ()))]
+        if not level:
+            level = pending[:1]  # Unsatisfiable dependency — fall back to step order
+        levels.append(level)
+        done.update(s.step_type for s in level)
+        pending = [s for s in pending if s not in level]
+    return levels
+
 
 # ─────────────────────────────────────────────────────────────
 # Workflow creation
@@ -66,31 +110,41 @@ def create_workflow(db: Session, employee_id: int) -> OnboardingWorkflow:
     db.add(workflow)
     db.flush()  # Get workflow.id
 
-    # Create all steps in order
-    for order, step_type in enumerate(STEP_ORDER, start=1):
-        step = OnboardingStep(
-            workflow_id=workflow.id,
-            step_type=step_type,
-            step_order=order,
-            status=StepStatus.PENDING,
-            requires_approval=step_type in APPROVAL_STEPS,
-        )
-        db.add(step)
-
+    # Create all steps in order with one multi-row INSERT
+    db.execute(insert(OnboardingStep), [
+        {
+            "workflow_id": workflow.id,
+            "step_type": step_type,
+            "step_order": order,
+            "status": StepStatus.PENDING,
+            "requires_approval": step_type in APPROVAL_STEPS,
+        }
+        for order, step_type in enumerate(STEP_ORDER, start=1)
+    ])
+
+    # No refresh: created_at/status defaults are client-side and already set
+    # at flush; the steps collection lazy-loads on first access
     db.commit()
-    db.refresh(workflow)
     return workflow
 
 
+def _workflow_query(db: Session):
+    """Workflow query that loads its steps (one extra SELECT) and employee (JOIN) up front."""
+    return db.query(OnboardingWorkflow).options(
+        selectinload(OnboardingWorkflow.steps),
+        joinedload(OnboardingWorkflow.employee),
+    )
+
+
 def get_workflow_by_id(db: Session, workflow_id: int) -> Optional[OnboardingWorkflow]:
-    """Fetch a workflow by ID."""
-    return db.query(OnboardingWorkflow).filter(OnboardingWorkflow.id == workflow_id).first()
+    """Fetch a workflow by ID, with its steps and employee loaded."""
+    return _workflow_query(db).filter(OnboardingWorkflow.id == workflow_id).first()
 
 
 def get_workflow_by_employee(db: Session, employee_id: int) -> Optional[OnboardingWorkflow]:
-    """Fetch the most recent workflow for an employee."""
+    """Fetch the most recent workflow for an employee, with its steps and employee loaded."""
     return (
-        db.query(OnboardingWorkflow)
+        _workflow_query(db)
         .filter(OnboardingWorkflow.employee_id == employee_id)
         .order_by(OnboardingWorkflow.created_at.desc())
         .first()
@@ -106,7 +160,6 @@ def pause_workflow(db: Session, employee_id: int) -> OnboardingWorkflow:
         raise ValueError(f"Cannot pause a workflow with status '{workflow.status.value}'")
     workflow.status = WorkflowStatus.PAUSED
     db.commit()
-    db.refresh(workflow)
     return workflow
 
 
@@ -119,7 +172,6 @@ def resume_workflow(db: Session, employee_id: int) -> OnboardingWorkflow:
         raise ValueError(f"Cannot resume a workflow with status '{workflow.status.value}'")
     workflow.status = WorkflowStatus.RUNNING
     db.commit()
-    db.refresh(workflow)
     return workflow
 
 
@@ -143,7 +195,6 @@ def retry_workflow(db: Session, employee_id: int) -> OnboardingWorkflow:
     workflow.error_message = None
     workflow.completed_at = None
     db.commit()
-    db.refresh(workflow)
     return workflow
 
 
@@ -151,67 +202,116 @@ def retry_workflow(db: Session, employee_id: int) -> OnboardingWorkflow:
 # Step execution logic
 # ─────────────────────────────────────────────────────────────
 
-async def execute_step(db: Session, step: OnboardingStep, employee: Employee) -> str:
-    """Execute a single workflow step and return the result."""
-    step_type = step.step_type
-
-    if step_type == StepType.PARSE_DATA:
-        return await _step_parse_data(employee)
-    elif step_type == StepType.DETECT_JURISDICTION:
-        return await _step_detect_jurisdiction(employee)
-    elif step_type == StepType.EMPLOYMENT_CONTRACT:
-        return await _step_employment_contract(db, employee)
-    elif step_type == StepType.NDA:
-        return await _step_nda(db, employee)
-    elif step_type == StepType.EQUITY_AGREEMENT:
-        return await _step_equity_agreement(db, employee)
-    elif step_type == StepType.WELCOME_EMAIL:
-        return await _step_welcome_email(employee)
-    elif step_type == StepType.OFFER_LETTER:
-        return await _step_offer_letter(db, employee)
-    elif step_type == StepType.PLAN_30_60_90:
-        return await _step_30_60_90_plan(employee)
-    elif step_type == StepType.SCHEDULE_EVENTS:
-        return await _step_schedule_events(employee)
-    elif step_type == StepType.EQUIPMENT_REQUEST:
-        return await _step_equipment_request(employee)
-    else:
-        return f"Unknown step type: {step_type}"
-
-
-async def _step_parse_data(employee: Employee) -> str:
+@dataclass(slots=True, frozen=True)
+class EmployeeView:
+    """Plain snapshot of the employee fields the step prompts read.
+
+    Built once per workflow run so steps don't go through ORM attribute
+    instrumentation (or reload expired attributes after a commit) for
+    every field. Document steps still take the ORM employee.
+    """
+
+    name: str
+    email: str
+    role: str
+    department: str
+    start_date: date
+    start_date_iso: str
+    manager_email: Optional[str]
+    buddy_email: Optional[str]
+    jurisdiction: str
+
+    @classmethod
+    def from_employee(cls, employee: Employee) -> "EmployeeView":
+        return cls(
+            name=employee.name,
+            email=employee.email,
+            role=employee.role,
+            department=employee.department,
+            start_date=employee.start_date,
+            start_date_iso=employee.start_date.isoformat(),
+            manager_email=employee.manager_email,
+            buddy_email=employee.buddy_email,
+            jurisdiction=employee.jurisdiction or "US",
+        )
+
+
+async def execute_step(
+    db: Session,
+    step: OnboardingStep,
+    employee: Employee,
+    on_token: Optional[Callable[[str], None]] = None,
+    emp: Optional[EmployeeView] = None,
+) -> dict:
+    """Execute a single workflow step and return its result payload.
+
+    When *on_token* is given, steps that generate free text stream it from
+    the LLM and pass each chunk to the callback as it arrives. *emp* is the
+    run's employee snapshot (built from *employee* when omitted).
+    """
+    handler = _STEP_HANDLERS.get(step.step_type)
+    if handler is None:
+        return {"content": f"Unknown step type: {step.step_type}"}
+    return await handler(db, employee, emp or EmployeeView.from_employee(employee), on_token)
+
+
+async def _generate(
+    prompt: str,
+    context: str = "",
+    on_token: Optional[Callable[[str], None]] = None,
+    temperature: float = llm.DEFAULT_TEMPERATURE,
+) -> str:
+    """Generate step text, streaming chunks to *on_token* when provided.
+
+    Deterministic (temperature 0) prompts go through the shared LLM response
+    cache, so a prompt another workflow already ran isn't regenerated.
+    """
+    if on_token is None:
+        return await llm_cache.cached_generate(prompt=prompt, context=context, temperature=temperature)
+
+    parts: list[str] = []
+    async for chunk in llm_cache.cached_generate_stream(prompt=prompt, context=context, temperature=temperature):
+        parts.append(chunk)
+        on_token(chunk)
+    return "".join(parts)
+
+
+async def _step_parse_data(emp: EmployeeView, on_token: Optional[Callable[[str], None]] = None) -> dict:
     """Step 1: Parse, validate, and summarize employee data using LLM."""
     data = {
-        "employee_name": employee.name,
-        "email": employee.email,
-        "role": employee.role,
-        "department": employee.department,
-        "start_date": employee.start_date.isoformat(),
-        "manager_email": employee.manager_email,
-        "buddy_email": employee.buddy_email,
+        "employee_name": emp.name,
+        "email": emp.email,
+        "role": emp.role,
+        "department": emp.department,
+        "start_date": emp.start_date_iso,
+        "manager_email": emp.manager_email,
+        "buddy_email": emp.buddy_email,
     }
 
-    prompt = PARSE_DATA_PROMPT.format(
-        name=employee.name,
-        email=employee.email,
-        role=employee.role,
-        department=employee.department,
-        start_date=employee.start_date.isoformat(),
-        manager_email=employee.manager_email or "Not assigned",
-        buddy_email=employee.buddy_email or "Not assigned",
+    # Run at temperature 0, so re-running a workflow for unchanged data is
+    # answered by the LLM response cache (the prompt is built from these fields)
+    prompt = render_template(
+        PARSE_DATA_PROMPT,
+        name=emp.name,
+        email=emp.email,
+        role=emp.role,
+        department=emp.department,
+        start_date=emp.start_date_iso,
+        manager_email=emp.manager_email or "Not assigned",
+        buddy_email=emp.buddy_email or "Not assigned",
     )
+    validation_summary = await _generate(prompt, on_token=on_token, temperature=0)
 
-    validation_summary = await llm.generate_text(prompt=prompt)
-    return json.dumps({
+    return {
         "parsed_data": data,
         "validation": "passed",
         "ai_summary": validation_summary,
-    })
+    }
 
 
-async def _step_detect_jurisdiction(employee: Employee) -> str:
+async def _step_detect_jurisdiction(emp: EmployeeView) -> dict:
     """Step 2: Detect and confirm the employee's jurisdiction for document generation."""
-    jurisdiction = employee.jurisdiction or "US"
+    jurisdiction = emp.jurisdiction
     jurisdiction_names = {
         "US": "United States",
         "UK": "United Kingdom",
@@ -221,126 +321,192 @@ async def _step_detect_jurisdiction(employee: Employee) -> str:
     }
     name = jurisdiction_names.get(jurisdiction, jurisdiction)
 
-    return json.dumps({
+    return {
         "type": "jurisdiction_detection",
         "jurisdiction_code": jurisdiction,
         "jurisdiction_name": name,
         "summary": f"Employee jurisdiction set to {name} ({jurisdiction}). All legal documents will comply with {name} employment law.",
-    })
+    }
 
 
-async def _step_employment_contract(db: Session, employee: Employee) -> str:
+async def _step_employment_contract(db: Session, employee: Employee) -> dict:
     """Step 3: Generate employment contract using jurisdiction template + LLM + RAG."""
     doc = await generate_employment_contract(db, employee)
     # Create approval request for this document
     create_approval_request(db, employee.id, doc.id)
-    return json.dumps({
+    return {
         "type": "employment_contract",
         "document_id": doc.id,
         "content": doc.content,
         "jurisdiction": doc.jurisdiction,
         "status": "pending_approval",
-    })
+    }
 
 
-async def _step_nda(db: Session, employee: Employee) -> str:
+async def _step_nda(db: Session, employee: Employee) -> dict:
     """Step 4: Generate NDA using jurisdiction template + LLM + RAG."""
     doc = await generate_nda(db, employee)
     create_approval_request(db, employee.id, doc.id)
-    return json.dumps({
+    return {
         "type": "nda",
         "document_id": doc.id,
         "content": doc.content,
         "jurisdiction": doc.jurisdiction,
         "status": "pending_approval",
-    })
+    }
 
 
-async def _step_equity_agreement(db: Session, employee: Employee) -> str:
+async def _step_equity_agreement(db: Session, employee: Employee) -> dict:
     """Step 5: Generate equity agreement using LLM + RAG (if applicable)."""
     # Equity is typically for senior/engineering roles — generate for all but mark applicability
     doc = await generate_equity_agreement(db, employee)
     create_approval_request(db, employee.id, doc.id)
-    return json.dumps({
+    return {
         "type": "equity_agreement",
         "document_id": doc.id,
         "content": doc.content,
         "jurisdiction": doc.jurisdiction,
         "status": "pending_approval",
-    })
+    }
+
+
+# RAG queries for the steps that pull policy context directly (the legal
+# documents get theirs from the document generator)
+_STEP_POLICY_QUERIES = {
+    StepType.WELCOME_EMAIL: "onboarding welcome email company culture",
+    StepType.PLAN_30_60_90: "onboarding plan training milestones",
+}
+
+
+async def _step_policy_context(step_type: StepType) -> str:
+    """Joined policy context for a step; reused until the policy index changes.
+
+    Looked up in a worker thread: a cache miss runs the (blocking) batched
+    vector search, which shouldn't stall other workflows' steps.
+    """
+    try:
+        contexts = await asyncio.to_thread(_step_policy_contexts, rag.index_version)
+    except Exception as e:
+        # Falls back per call (uncached), so the next step retries the index
+        print(f"⚠️  RAG policy context lookup failed: {e}")
+        results = await asyncio.to_thread(rag.query_policies, _STEP_POLICY_QUERIES[step_type])
+        return "\n".join(r["text"] for r in results)
+    return contexts[step_type]
+
+
+def warm_policy_contexts(refresh: bool = False) -> None:
+    """Build the policy contexts used by workflow steps and legal documents.
+
+    Called at startup so the first workflow doesn't pay for the RAG queries,
+    and periodically with *refresh* because index_version only tracks policy
+    changes made in this process.
+    """
+    if refresh:
+        _step_policy_contexts.cache_clear()
+    try:
+        _step_policy_contexts(rag.index_version)
+    finally:
+        document_generator.warm_policy_contexts(refresh)
+
+
+@functools.lru_cache(maxsize=4)
+def _step_policy_contexts(index_version: int) -> dict[StepType, str]:
+    # One batched embed + search for every step's query; raises rather than
+    # caching mock context when the vector store is unavailable
+    batches = rag.query_policies_batch(list(_STEP_POLICY_QUERIES.values()), fallback=False)
+    return {
+        step_type: "\n".join(r["text"] for r in results)
+        for step_type, results in zip(_STEP_POLICY_QUERIES, batches)
+    }
 
 
-async def _step_welcome_email(employee: Employee) -> str:
+async def _step_welcome_email(emp: EmployeeView, on_token: Optional[Callable[[str], None]] = None) -> dict:
     """Step 2: Generate welcome email using LLM + RAG context."""
-    context_results = rag.query_policies("onboarding welcome email company culture")
-    context = "\n".join([r["text"] for r in context_results])
-
-    prompt = get_template("welcome_email").format(
-        name=employee.name,
-        role=employee.role,
-        department=employee.department,
-        start_date=employee.start_date.isoformat(),
-        manager_email=employee.manager_email or "TBD",
-        buddy_email=employee.buddy_email or "TBD",
+    context = await _step_policy_context(StepType.WELCOME_EMAIL)
+
+    prompt = render_template(
+        get_template("welcome_email"),
+        name=emp.name,
+        role=emp.role,
+        department=emp.department,
+        start_date=emp.start_date_iso,
+        manager_email=emp.manager_email or "TBD",
+        buddy_email=emp.buddy_email or "TBD",
     )
 
-    email_content = await llm.generate_text(prompt=prompt, context=context)
-    return json.dumps({"type": "welcome_email", "content": email_content})
+    email_content = await _generate(prompt, context, on_token)
+    return {"type": "welcome_email", "content": email_content}
 
 
-async def _step_offer_letter(db: Session, employee: Employee) -> str:
+async def _step_offer_letter(db: Session, employee: Employee) -> dict:
     """Step 6: Generate jurisdiction-aware offer letter using LLM + RAG."""
     doc = await generate_offer_letter_doc(db, employee)
     create_approval_request(db, employee.id, doc.id)
-    return json.dumps({
+    return {
         "type": "offer_letter",
         "document_id": doc.id,
         "content": doc.content,
         "jurisdiction": doc.jurisdiction,
         "status": "pending_approval",
-    })
+    }
 
 
-async def _step_30_60_90_plan(employee: Employee) -> str:
+async def _step_30_60_90_plan(emp: EmployeeView, on_token: Optional[Callable[[str], None]] = None) -> dict:
     """Step 4: Generate 30-60-90 day plan using LLM + RAG context."""
-    context_results = rag.query_policies("onboarding plan training milestones")
-    context = "\n".join([r["text"] for r in context_results])
-
-    prompt = get_template("plan_30_60_90").format(
-        name=employee.name,
-        role=employee.role,
-        department=employee.department,
-        start_date=employee.start_date.isoformat(),
-        manager_email=employee.manager_email or "TBD",
+    context = await _step_policy_context(StepType.PLAN_30_60_90)
+
+    prompt = render_template(
+        get_template("plan_30_60_90"),
+        name=emp.name,
+        role=emp.role,
+        department=emp.department,
+        start_date=emp.start_date_iso,
+        manager_email=emp.manager_email or "TBD",
     )
 
-    plan_content = await llm.generate_text(prompt=prompt, context=context)
-    return json.dumps({"type": "30_60_90_plan", "content": plan_content})
+    plan_content = await _generate(prompt, context, on_token)
+    return {"type": "30_60_90_plan", "content": plan_content}
 
 
-async def _step_schedule_events(employee: Employee) -> str:
+async def _step_schedule_events(emp: EmployeeView) -> dict:
     """Step 5: Schedule calendar events using the calendar service."""
-    events = schedule_onboarding_events(
-        employee_name=employee.name,
-        employee_email=employee.email,
-        start_date=employee.start_date,
-        manager_email=employee.manager_email,
-        buddy_email=employee.buddy_email,
+    events = await schedule_onboarding_events(
+        employee_name=emp.name,
+        employee_email=emp.email,
+        start_date=emp.start_date,
+        manager_email=emp.manager_email,
+        buddy_email=emp.buddy_email,
     )
-    return json.dumps({"type": "calendar_events", "events": events})
+    return {"type": "calendar_events", "events": events}
 
 
-async def _step_equipment_request(employee: Employee) -> str:
+async def _step_equipment_request(emp: EmployeeView, on_token: Optional[Callable[[str], None]] = None) -> dict:
     """Step 6: Generate equipment request using LLM."""
-    prompt = get_template("equipment_request").format(
-        name=employee.name,
-        role=employee.role,
-        department=employee.department,
-        start_date=employee.start_date.isoformat(),
+    prompt = render_template(
+        get_template("equipment_request"),
+        name=emp.name,
+        role=emp.role,
+        department=emp.department,
+        start_date=emp.start_date_iso,
     )
 
-    request_content = await llm.generate_text(prompt=prompt)
-    return json.dumps({"type": "equipment_request", "content": request_content})
+    request_content = await _generate(prompt, on_token=on_token)
+    return {"type": "equipment_request", "content": request_content}
+
+
+# Step type -> handler(db, employee, emp, on_token)
+_STEP_HANDLERS: dict[StepType, Callable[..., Awaitable[dict]]] = {
+    StepType.PARSE_DATA: lambda db, employee, emp, on_token: _step_parse_data(emp, on_token),
+    StepType.DETECT_JURISDICTION: lambda db, employee, emp, on_token: _step_detect_jurisdiction(emp),
+    StepType.EMPLOYMENT_CONTRACT: lambda db, employee, emp, on_token: _step_employment_contract(db, employee),
+    StepType.NDA: lambda db, employee, emp, on_token: _step_nda(db, employee),
+    StepType.EQUITY_AGREEMENT: lambda db, employee, emp, on_token: _step_equity_agreement(db, employee),
+    StepType.WELCOME_EMAIL: lambda db, employee, emp, on_token: _step_welcome_email(emp, on_token),
+    StepType.OFFER_LETTER: lambda db, employee, emp, on_token: _step_offer_letter(db, employee),
+    StepType.PLAN_30_60_90: lambda db, employee, emp, on_token: _step_30_60_90_plan(emp, on_token),
+    StepType.SCHEDULE_EVENTS: lambda db, employee, emp, on_token: _step_schedule_events(emp),
+    StepType.EQUIPMENT_REQUEST: lambda db, employee, emp, on_token: _step_equipment_request(emp, on_token),
+}
 
 
 # ─────────────────────────────────────────────────────────────
@@ -348,77 +514,128 @@ async def _step_equipment_request(employee: Employee) -> str:
 # ─────────────────────────────────────────────────────────────
 
 async def run_workflow(db: Session, workflow_id: int) -> OnboardingWorkflow:
-    """Execute all steps of a workflow sequentially."""
+    """Execute a workflow's steps, running independent steps concurrently."""
     workflow = get_workflow_by_id(db, workflow_id)
     if not workflow:
         raise ValueError(f"Workflow {workflow_id} not found")
 
     employee = workflow.employee
+    emp = EmployeeView.from_employee(employee)
 
-    # Mark workflow as running
+    # Mark workflow as running (committed with the first level's RUNNING
+    # transition; nothing awaits in between)
     workflow.status = WorkflowStatus.RUNNING
     workflow.started_at = datetime.utcnow()
     employee.status = EmployeeStatus.ONBOARDING
-    db.commit()
 
     try:
-        for step in workflow.steps:
-            # Skip already-completed steps (important for resume after approval)
-            if step.status == StepStatus.COMPLETED:
-                continue
-
-            # Mark step as running
-            step.status = StepStatus.RUNNING
-            step.started_at = datetime.utcnow()
+        # Already-completed steps are skipped (important for resume after approval)
+        for level in _execution_levels(workflow.steps):
+            # Mark the level's steps as running
+            started_at = datetime.utcnow()
+            _set_step_state(db, level, status=StepStatus.RUNNING, started_at=started_at)
             db.commit()
 
-            try:
-                result = await execute_step(db, step, employee)
-                step.status = StepStatus.COMPLETED
-                step.result = result
-                step.completed_at = datetime.utcnow()
-
-                # Approval gate: pause after last document step
-                if step.step_type == StepType.OFFER_LETTER:
-                    workflow.status = WorkflowStatus.AWAITING_APPROVAL
-                    db.commit()
-                    # In non-streaming mode, just mark it — external resume needed
-                    return workflow
-            except Exception as e:
-                step.status = StepStatus.FAILED
-                step.error_message = str(e)
-                step.completed_at = datetime.utcnow()
-                raise
-
-            db.commit()
-
-        # All steps completed
-        workflow.status = WorkflowStatus.COMPLETED
-        workflow.completed_at = datetime.utcnow()
-        employee.status = EmployeeStatus.COMPLETED
+            # Let every step in the level finish (and record its own status)
+            # before surfacing the first failure
+            outcomes = await asyncio.gather(
+                *(_run_step(db, step, employee, emp=emp) for step in level),
+                return_exceptions=True,
+            )
+            failure = next((o for o in outcomes if isinstance(o, BaseException)), None)
+            if failure is not None:
+                _fail_workflow(workflow, employee, str(failure))
+                break
+
+            # Approval gate: pause once the legal documents are generated
+            if any(step.step_type in APPROVAL_STEPS for step in level):
+                workflow.status = WorkflowStatus.AWAITING_APPROVAL
+                db.commit()
+                # In non-streaming mode, just mark it — external resume needed
+                return workflow
+        else:
+            # All steps completed
+            workflow.status = WorkflowStatus.COMPLETED
+            workflow.completed_at = datetime.utcnow()
+            employee.status = EmployeeStatus.COMPLETED
         db.commit()
 
     except Exception as e:
-        workflow.status = WorkflowStatus.FAILED
-        workflow.error_message = str(e)
-        workflow.completed_at = datetime.utcnow()
-        employee.status = EmployeeStatus.FAILED
+        # Errors outside a step (e.g. the database) still fail the workflow
+        _fail_workflow(workflow, employee, str(e))
         db.commit()
 
-    db.refresh(workflow)
+    # Everything written above is already on the objects (ORM updates
+    # synchronize loaded steps), so no refresh round-trip
     return workflow
 
 
+def _fail_workflow(workflow: OnboardingWorkflow, employee: Employee, error: str) -> None:
+    """Mark the workflow and its employee failed (caller commits)."""
+    workflow.status = WorkflowStatus.FAILED
+    workflow.error_message = error
+    workflow.completed_at = datetime.utcnow()
+    employee.status = EmployeeStatus.FAILED
+
+
+async def _run_step(
+    db: Session,
+    step: OnboardingStep,
+    employee: Employee,
+    on_token: Optional[Callable[[str], None]] = None,
+    emp: Optional[EmployeeView] = None,
+) -> dict:
+    """Execute one step and commit its outcome.
+
+    Committed right away: the UPDATE takes SQLite's write lock, which must
+    not stay held while sibling steps in the level are still awaiting.
+    """
+    try:
+        result = await execute_step(db, step, employee, on_token, emp)
+    except Exception as e:
+        _set_step_state(
+            db, [step],
+            status=StepStatus.FAILED,
+            error_message=str(e),
+            completed_at=datetime.utcnow(),
+        )
+        db.commit()
+        raise
+
+    _set_step_state(
+        db, [step],
+        status=StepStatus.COMPLETED,
+        result=result,
+        completed_at=datetime.utcnow(),
+    )
+    db.commit()
+    return result
+
+
+def _set_step_state(db: Session, steps: list[OnboardingStep], **values) -> None:
+    """Write a state transition for *steps* as one UPDATE (caller commits).
+
+    Skips the unit-of-work dirty tracking for these known column writes;
+    the loaded step objects are synchronized in place so callers can keep
+    reading step.status / step.completed_at.
+    """
+    db.execute(
+        update(OnboardingStep)
+        .where(OnboardingStep.id.in_([step.id for step in steps]))
+        .values(**values)
+    )
+
+
 # ─────────────────────────────────────────────────────────────
 # Streaming execution (for SSE)
 # ─────────────────────────────────────────────────────────────
 
-async def run_workflow_stream(db: Session, workflow_id: int) -> AsyncGenerator[str, None]:
+async def run_workflow_stream(db: Session, workflow_id: int) -> AsyncGenerator[bytes, None]:
     """
     Execute workflow and yield SSE events for real-time updates.
 
-    Yields JSON strings matching the frontend AgentEvent interface:
-      { type, message, timestamp, step_type?, step_status? }
+    Yields SSE frames ("event: <type>" + a JSON data line) matching the
+    frontend AgentEvent interface: { message, timestamp, step_type?, step_status? }
     """
     workflow = get_workflow_by_id(db, workflow_id)
     if not workflow:
@@ -426,6 +643,7 @@ async def run_workflow_stream(db: Session, workflow_id: int) -> AsyncGenerator[s
         return
 
     employee = workflow.employee
+    emp = EmployeeView.from_employee(employee)
 
     # Mark workflow as running
     workflow.status = WorkflowStatus.RUNNING
@@ -433,12 +651,12 @@ async def run_workflow_stream(db: Session, workflow_id: int) -> AsyncGenerator[s
     employee.status = EmployeeStatus.ONBOARDING
     db.commit()
 
-    yield _sse_event("init", f"Starting onboarding for {employee.name}")
-    yield _sse_event("think", f"Employee profile loaded — {employee.role} in {employee.department}, starting {employee.start_date}")
+    yield _sse_event("init", f"Starting onboarding for {emp.name}")
+    yield _sse_event("think", f"Employee profile loaded — {emp.role} in {emp.department}, starting {emp.start_date}")
     await asyncio.sleep(0.4)
-    yield _sse_event("think", f"Jurisdiction: {employee.jurisdiction or 'US'} — documents will comply with local employment law")
+    yield _sse_event("think", f"Jurisdiction: {emp.jurisdiction} — documents will comply with local employment law")
     await asyncio.sleep(0.3)
-    yield _sse_event("think", f"Manager: {employee.manager_email or 'unassigned'} · Buddy: {employee.buddy_email or 'unassigned'}")
+    yield _sse_event("think", f"Manager: {emp.manager_email or 'unassigned'} · Buddy: {emp.buddy_email or 'unassigned'}")
     await asyncio.sleep(0.3)
     yield _sse_event("active", f"Orchestrator initialized — executing {len(workflow.steps)}-step pipeline")
 
@@ -451,20 +669,20 @@ async def run_workflow_stream(db: Session, workflow_id: int) -> AsyncGenerator[s
             "Sending profile summary to LLM for completeness analysis…",
         ],
         "detect_jurisdiction": [
-            f"Detecting employment jurisdiction for {employee.name}…",
-            f"Jurisdiction set to: {employee.jurisdiction or 'US'}…",
+            f"Detecting employment jurisdiction for {emp.name}…",
+            f"Jurisdiction set to: {emp.jurisdiction}…",
             "Loading jurisdiction-specific legal templates and requirements…",
             "Verifying available document templates for this jurisdiction…",
         ],
         "employment_contract": [
-            f"Loading {employee.jurisdiction or 'US'} employment contract template…",
+            f"Loading {emp.jurisdiction} employment contract template…",
             "Querying RAG for company-specific contract terms and conditions…",
             "Injecting employee details into jurisdiction-compliant contract template…",
             "Generating employment contract with LLM — ensuring legal compliance…",
             "Creating approval request for HR review…",
         ],
         "nda": [
-            f"Loading {employee.jurisdiction or 'US'} NDA template…",
+            f"Loading {emp.jurisdiction} NDA template…",
             "Querying RAG for confidentiality and IP policies…",
             "Customizing NDA for role-specific confidentiality needs…",
             "Generating NDA with jurisdiction-appropriate legal language…",
@@ -472,16 +690,16 @@ async def run_workflow_stream(db: Session, workflow_id: int) -> AsyncGenerator[s
         ],
         "equity_agreement": [
             "Analyzing role eligibility for equity compensation…",
-            f"Preparing equity agreement under {employee.jurisdiction or 'US'} securities regulations…",
+            f"Preparing equity agreement under {emp.jurisdiction} securities regulations…",
             "Querying RAG for company equity plan details and vesting schedules…",
             "Generating equity agreement with standard vesting terms…",
             "Creating approval request for HR review…",
         ],
         "offer_letter": [
-            f"Loading {employee.jurisdiction or 'US'} offer letter template…",
+            f"Loading {emp.jurisdiction} offer letter template…",
             "Querying RAG for compensation and benefits policies…",
             "Personalizing offer letter with role-specific details…",
-            f"Generating formal offer letter compliant with {employee.jurisdiction or 'US'} law…",
+            f"Generating formal offer letter compliant with {emp.jurisdiction} law…",
             "Creating approval request for HR review…",
         ],
         "welcome_email": [
@@ -499,7 +717,7 @@ async def run_workflow_stream(db: Session, workflow_id: int) -> AsyncGenerator[s
         "schedule_events": [
             "Calculating first-week dates from start date…",
             "Preparing 3 calendar events: Orientation, Manager 1:1, Buddy Meetup…",
-            f"Resolving attendee emails — manager: {employee.manager_email or 'TBD'}, buddy: {employee.buddy_email or 'TBD'}…",
+            f"Resolving attendee emails — manager: {emp.manager_email or 'TBD'}, buddy: {emp.buddy_email or 'TBD'}…",
             "Scheduling events via calendar service…",
         ],
         "equipment_request": [
@@ -510,10 +728,91 @@ async def run_workflow_stream(db: Session, workflow_id: int) -> AsyncGenerator[s
         ],
     }
 
-    try:
-        for step in workflow.steps:
-            step_label = step.step_type.value.replace("_", " ").title()
+    # Concurrently running steps push their events here; the loop below
+    # yields them in arrival order. None marks a finished step.
+    events: asyncio.Queue = asyncio.Queue()
+
+    async def stream_step(step: OnboardingStep, started_at: datetime) -> Optional[str]:
+        step_type = step.step_type.value
+        step_label = step_type.replace("_", " ").title()
+        # Fields shared by every event this step emits
+        step_base = {"step_type": step_type}
+        events.put_nowait(_sse_event(
+            "task",
+            f"Step {step.step_order}: {step_label}",
+            base=step_base,
+            step_status="running",
+            ts=started_at,
+        ))
+
+        try:
+            # Emit detailed reasoning for this step
+            reasoning = _step_reasoning.get(step_type, [])
+            for msg in reasoning:
+                events.put_nowait(_sse_event(
+                    "think",
+                    msg,
+                    base=step_base,
+                ))
+                await asyncio.sleep(0.5)
+
+            # Free-text steps stream from the LLM: forward each delta as a
+            # "token" event so output appears from the first token on
+            streamed = False
+
+            def on_token(chunk: str) -> None:
+                nonlocal streamed
+                streamed = True
+                events.put_nowait(_sse_event("token", chunk, base=step_base))
+
+            result = await _run_step(db, step, employee, on_token, emp)
+            completed_at = step.completed_at
+
+            # Preview of generated content for steps that didn't stream
+            if not streamed:
+                preview = _preview(result.get("content") or result.get("ai_summary") or "")
+
+                if preview:
+                    events.put_nowait(_sse_event(
+                        "think",
+                        f"Output preview: {preview}…",
+                        base=step_base,
+                        ts=completed_at,
+                    ))
+
+            events.put_nowait(_sse_event(
+                "done",
+                f"\u2713 {step_label} complete",
+                base=step_base,
+                step_status="completed",
+                ts=completed_at,
+            ))
+
+            # step_update triggers frontend workflow refresh
+            events.put_nowait(_sse_event(
+                "step_update",
+                f"Step {step.step_order} completed",
+                base=step_base,
+                step_status="completed",
+                ts=completed_at,
+            ))
+
+        except Exception as e:
+            # Reported to the level loop, which fails the workflow
+            events.put_nowait(_sse_event(
+                "error",
+                f"\u2717 {step_label} failed: {str(e)}",
+                base=step_base,
+                step_status="failed",
+                ts=step.completed_at,
+            ))
+            return str(e)
+        finally:
+            events.put_nowait(None)
 
+    try:
+        # Already-completed steps are skipped (important for retry/resume flows)
+        for level in _execution_levels(workflow.steps):
             # ── Check if workflow was paused or awaiting approval ──
             db.refresh(workflow)
             if workflow.status in (WorkflowStatus.PAUSED, WorkflowStatus.AWAITING_APPROVAL):
@@ -524,100 +823,68 @@ async def run_workflow_stream(db: Session, workflow_id: int) -> AsyncGenerator[s
                 while workflow.status in (WorkflowStatus.PAUSED, WorkflowStatus.AWAITING_APPROVAL):
                     await asyncio.sleep(2)
                     db.refresh(workflow)
+                _reload_after_wait(db)
                 yield _sse_event("active", "Workflow resumed — all approvals received, continuing...")
 
-            # Skip already-completed steps (important for retry/resume flows)
-            if step.status == StepStatus.COMPLETED:
+            # A background resume may have finished some of these while we waited
+            level = [step for step in level if step.status != StepStatus.COMPLETED]
+            if not level:
                 continue
 
-            # Mark step as running
-            step.status = StepStatus.RUNNING
-            step.started_at = datetime.utcnow()
+            # Mark the level's steps as running
+            started_at = datetime.utcnow()
+            _set_step_state(db, level, status=StepStatus.RUNNING, started_at=started_at)
             db.commit()
 
-            yield _sse_event(
-                "task",
-                f"Step {step.step_order}: {step_label}",
-                step_type=step.step_type.value,
-                step_status="running",
+            level_task = asyncio.gather(
+                *(stream_step(step, started_at) for step in level),
+                return_exceptions=True,
             )
-
             try:
-                # Emit detailed reasoning for this step
-                reasoning = _step_reasoning.get(step.step_type.value, [])
-                for msg in reasoning:
-                    yield _sse_event(
-                        "think",
-                        msg,
-                        step_type=step.step_type.value,
-                    )
-                    await asyncio.sleep(0.5)
-
-                result = await execute_step(db, step, employee)
-
-                # Preview of generated content
-                try:
-                    parsed = json.loads(result) if result else {}
-                    content = parsed.get("content") or parsed.get("ai_summary") or ""
-                    preview = content[:120].replace("\n", " ").strip()
-                except (json.JSONDecodeError, AttributeError):
-                    preview = (result or "")[:120].replace("\n", " ").strip()
-
-                if preview:
-                    yield _sse_event(
-                        "think",
-                        f"Output preview: {preview}…",
-                        step_type=step.step_type.value,
-                    )
-
-                step.status = StepStatus.COMPLETED
-                step.result = result
-                step.completed_at = datetime.utcnow()
+                remaining = len(level)
+                while remaining:
+                    event = await events.get()
+                    if event is None:
+                        remaining -= 1
+                    else:
+                        yield event
+                outcomes = await level_task
+            finally:
+                if not level_task.done():
+                    # Client disconnected mid-level: stop the steps and put the
+                    # unfinished ones back to pending so a reconnect re-runs them
+                    level_task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await level_task
+                    db.rollback()
+                    unfinished = [step for step in level if step.status == StepStatus.RUNNING]
+                    if unfinished:
+                        _set_step_state(db, unfinished, status=StepStatus.PENDING, started_at=None)
+                        db.commit()
+
+            # A step's error message (or an unexpected exception from gather)
+            failure = next((o for o in outcomes if o is not None), None)
+            if failure is not None:
+                _fail_workflow(workflow, employee, str(failure))
                 db.commit()
+                yield _sse_event("error", f"Workflow failed: {failure}")
+                return
 
-                yield _sse_event(
-                    "done",
-                    f"\u2713 {step_label} complete",
-                    step_type=step.step_type.value,
-                    step_status="completed",
-                )
-
-                # step_update triggers frontend workflow refresh
-                yield _sse_event(
-                    "step_update",
-                    f"Step {step.step_order} completed",
-                    step_type=step.step_type.value,
-                    step_status="completed",
-                )
-
-                # ── Approval gate: pause after last document-generation step ──
-                if step.step_type == StepType.OFFER_LETTER:
-                    workflow.status = WorkflowStatus.AWAITING_APPROVAL
-                    db.commit()
-                    yield _sse_event(
-                        "approval_gate",
-                        "All legal documents generated — workflow paused for human approval. "
-                        "An HR admin must review and approve each document before onboarding continues.",
-                    )
-                    # Wait until all approvals are processed (approval service resumes workflow)
-                    while workflow.status == WorkflowStatus.AWAITING_APPROVAL:
-                        await asyncio.sleep(2)
-                        db.refresh(workflow)
-                    yield _sse_event("active", "✅ All documents approved — resuming remaining onboarding steps…")
-
-            except Exception as e:
-                step.status = StepStatus.FAILED
-                step.error_message = str(e)
-                step.completed_at = datetime.utcnow()
+            # ── Approval gate: pause once the legal documents are generated ──
+            if any(step.step_type in APPROVAL_STEPS for step in level):
+                workflow.status = WorkflowStatus.AWAITING_APPROVAL
                 db.commit()
-
                 yield _sse_event(
-                    "error",
-                    f"\u2717 {step_label} failed: {str(e)}",
-                    step_type=step.step_type.value,
-                    step_status="failed",
+                    "approval_gate",
+                    "All legal documents generated — workflow paused for human approval. "
+                    "An HR admin must review and approve each document before onboarding continues.",
                 )
-                raise
+                # Wait until all approvals are processed (approval service resumes workflow)
+                while workflow.status == WorkflowStatus.AWAITING_APPROVAL:
+                    await asyncio.sleep(2)
+                    db.refresh(workflow)
+                _reload_after_wait(db)
+                yield _sse_event("active", "✅ All documents approved — resuming remaining onboarding steps…")
 
         # All steps completed
         workflow.status = WorkflowStatus.COMPLETED
@@ -632,37 +899,112 @@ async def run_workflow_stream(db: Session, workflow_id: int) -> AsyncGenerator[s
 
         yield _sse_event(
             "done",
-            f"✅ Onboarding complete for {employee.name}{elapsed} — all {len(workflow.steps)} steps finished successfully",
+            f"✅ Onboarding complete for {emp.name}{elapsed} — all {len(workflow.steps)} steps finished successfully",
         )
 
     except Exception as e:
-        workflow.status = WorkflowStatus.FAILED
-        workflow.error_message = str(e)
-        workflow.completed_at = datetime.utcnow()
-        employee.status = EmployeeStatus.FAILED
+        _fail_workflow(workflow, employee, str(e))
         db.commit()
 
         yield _sse_event("error", f"Workflow failed: {str(e)}")
 
 
+# Frames produced within this window of the first one are sent together,
+# up to the byte cap (token bursts would otherwise be one write each)
+SSE_COALESCE_SECONDS = 0.01
+SSE_COALESCE_MAX_BYTES = 8192
+
+
+async def _next_frame(frames: AsyncIterator[bytes]) -> Optional[bytes]:
+    """Next frame from *frames*, or None once it is exhausted."""
+    try:
+        return await frames.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+async def coalesce_frames(
+    frames: AsyncGenerator[bytes, None],
+    max_wait: float = SSE_COALESCE_SECONDS,
+    max_bytes: int = SSE_COALESCE_MAX_BYTES,
+) -> AsyncGenerator[bytes, None]:
+    """Merge SSE frames arriving in quick succession into single writes.
+
+    Waits at most *max_wait* after the first frame of a batch, so latency
+    stays bounded. The pending read is never cancelled on timeout — it
+    carries over to the next batch — so *frames* isn't interrupted mid-step.
+    """
+    loop = asyncio.get_running_loop()
+    pending: Optional[asyncio.Future] = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(_next_frame(frames))
+            frame = await pending
+            pending = None
+            if frame is None:
+                return
+
+            batch = bytearray(frame)
+            deadline = loop.time() + max_wait
+            while len(batch) < max_bytes:
+                pending = asyncio.ensure_future(_next_frame(frames))
+                done, _ = await asyncio.wait((pending,), timeout=deadline - loop.time())
+                if not done:
+                    break
+                frame = pending.result()
+                pending = None
+                if frame is None:
+                    yield bytes(batch)
+                    return
+                batch += frame
+            yield bytes(batch)
+    finally:
+        # Client went away mid-stream: stop the read and close the source
+        if pending is not None:
+            pending.cancel()
+            await asyncio.wait((pending,))
+        await frames.aclose()
+
+
+def _reload_after_wait(db: Session) -> None:
+    """Expire loaded state after waiting on another session (approval/resume).
+
+    The stream's session keeps state across commits, so the step statuses a
+    background resume wrote meanwhile are only seen after this.
+    """
+    db.expire_all()
+
+
+# Shared empty mapping for events that carry no step fields
+_NO_FIELDS: dict = {}
+
+
+def _preview(text: str) -> str:
+    """First 120 characters of generated output, on one line."""
+    return text[:120].replace("\n", " ").strip()
+
+
 def _sse_event(
     event_type: str,
     message: str,
-    step_type: str | None = None,
-    step_status: str | None = None,
-) -> str:
+    base: dict | None = None,
+    ts: datetime | None = None,
+    **extra,
+) -> bytes:
     """
-    Format an SSE event matching the frontend AgentEvent interface.
-
-    Frontend expects: { type, message, timestamp, step_type?, step_status? }
+    Format a complete SSE frame matching the frontend AgentEvent interface.
+
+    The event type goes in the native `event:` field; the `data:` line
+    carries { message, timestamp, step_type?, step_status? }. For "token"
+    events the message is a text delta of the step's output.
+    *base* holds the fields shared by every event of one step (built once per
+    step); *extra* adds per-event fields such as step_status. Pass *ts* to
+    reuse a timestamp already taken for the same transition.
     """
-    event: dict = {
-        "type": event_type,
+    return b"event: %b\ndata: %b\n\n" % (event_type.encode(), orjson.dumps({
         "message": message,
-        "timestamp": datetime.utcnow().isoformat(),
-    }
-    if step_type:
-        event["step_type"] = step_type
-    if step_status:
-        event["step_status"] = step_status
-    return json.dumps(event)
+        "timestamp": (ts or datetime.utcnow()).isoformat(),
+        **(base or _NO_FIELDS),
+        **extra,
+    }))
@@ -58,7 +58,6 @@ def save_policy(db: Session, title: str, filename: str, file_content: bytes) ->
     )
     db.add(policy)
     db.commit()
-    db.refresh(policy)
     return policy
 
 
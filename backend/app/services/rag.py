@@ -17,6 +17,11 @@ CHROMA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file
 # Lazy-loaded ChromaDB client
 _chroma_client = None
 _collection = None
+_embedding_function = None
+
+# Bumped whenever the indexed policy chunks change, so result caches
+# built on top of query_policies() know to drop stale entries.
+index_version = 0
 
 
 def _get_collection():
@@ -27,7 +32,7 @@ def _get_collection():
       2. OpenAI (OPENAI_API_KEY) — fallback
       3. ChromaDB default sentence-transformer — offline fallback
     """
-    global _chroma_client, _collection
+    global _chroma_client, _collection, _embedding_function
 
     if _collection is not None:
         return _collection
@@ -74,6 +79,8 @@ def _get_collection():
         # Check for dimension mismatch and recreate collection if needed
         _check_and_fix_dimension_mismatch(_chroma_client, expected_dim)
 
+        _embedding_function = embedding_function
+
         if embedding_function:
             _collection = _chroma_client.get_or_create_collection(
                 name="policy_documents",
@@ -163,7 +170,7 @@ def embed_policy(policy_id: int, file_path: str, title: str) -> int:
 
     Returns the number of chunks embedded.
     """
-    global _collection
+    global _collection, index_version
 
     collection = _get_collection()
 
@@ -211,13 +218,36 @@ def embed_policy(policy_id: int, file_path: str, title: str) -> int:
         else:
             raise
 
+    index_version += 1
     return len(chunks)
 
 
-def query_policies(query: str, n_results: int = 5) -> list[dict]:
+def embed_query(query: str) -> list[float] | None:
+    """Embed a query with the collection's API embedding function.
+
+    Returns None when no API embedding provider is configured (default
+    sentence-transformer or mock mode) or the embedding call fails.
+    """
+    if _get_collection() is None or _embedding_function is None:
+        return None
+    try:
+        return list(_embedding_function([query])[0])
+    except Exception as e:
+        print(f"⚠️  RAG query embedding failed: {e}")
+        return None
+
+
+def query_policies(
+    query: str,
+    n_results: int = 5,
+    query_embedding: list[float] | None = None,
+) -> list[dict]:
     """
     Query the policy vector store for relevant context.
 
+    Pass *query_embedding* when the query has already been embedded (see
+    embed_query) to skip a second embedding call.
+
     Returns a list of dicts with { text, policy_id, title, score }.
     """
     collection = _get_collection()
@@ -226,13 +256,55 @@ def query_policies(query: str, n_results: int = 5) -> list[dict]:
         return _mock_query(query)
 
     try:
-        results = collection.query(query_texts=[query], n_results=n_results)
+        if query_embedding is not None:
+            results = collection.query(query_embeddings=[query_embedding], n_results=n_results)
+        else:
+            results = collection.query(query_texts=[query], n_results=n_results)
 
-        documents = results.get("documents", [[]])[0]
-        metadatas = results.get("metadatas", [[]])[0]
-        distances = results.get("distances", [[]])[0]
+        return _query_results(results)[0]
+    except Exception as e:
+        print(f"⚠️  RAG query failed: {e}")
+        return _mock_query(query)
+
+
+def query_policies_batch(
+    queries: list[str],
+    n_results: int = 5,
+    fallback: bool = True,
+) -> list[list[dict]]:
+    """
+    Query the policy vector store for several queries at once.
 
-        return [
+    All queries are embedded in one embedding call and searched in one
+    vector-store query. Returns one result list per query, in order.
+
+    With *fallback* off, an unavailable vector store or a failed query
+    raises instead of returning mock context, so callers that cache the
+    results don't keep the placeholder text.
+    """
+    collection = _get_collection()
+
+    if collection is None:
+        if not fallback:
+            raise RuntimeError("Policy vector store is unavailable")
+        return [_mock_query(q) for q in queries]
+
+    try:
+        if collection.count() == 0:
+            return [_mock_query(q) for q in queries]
+        results = collection.query(query_texts=queries, n_results=n_results)
+        return _query_results(results)
+    except Exception as e:
+        if not fallback:
+            raise
+        print(f"⚠️  RAG batch query failed: {e}")
+        return [_mock_query(q) for q in queries]
+
+
+def _query_results(results: dict) -> list[list[dict]]:
+    """Convert a Chroma query response into one list of { text, policy_id, title, score } per query."""
+    return [
+        [
             {
                 "text": doc,
                 "policy_id": meta.get("policy_id"),
@@ -241,9 +313,12 @@ def query_policies(query: str, n_results: int = 5) -> list[dict]:
             }
             for doc, meta, dist in zip(documents, metadatas, distances)
         ]
-    except Exception as e:
-        print(f"⚠️  RAG query failed: {e}")
-        return _mock_query(query)
+        for documents, metadatas, distances in zip(
+            results.get("documents") or [[]],
+            results.get("metadatas") or [[]],
+            results.get("distances") or [[]],
+        )
+    ]
 
 
 def _mock_query(query: str) -> list[dict]:
@@ -264,6 +339,8 @@ def _mock_query(query: str) -> list[dict]:
 
 def delete_policy_embeddings(policy_id: int) -> bool:
     """Remove all embeddings for a given policy."""
+    global index_version
+
     collection = _get_collection()
     if collection is None:
         return True
@@ -272,6 +349,7 @@ def delete_policy_embeddings(policy_id: int) -> bool:
         existing = collection.get(where={"policy_id": policy_id})
         if existing["ids"]:
             collection.delete(ids=existing["ids"])
+            index_version += 1
         return True
     except Exception:
         return False
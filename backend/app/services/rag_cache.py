@@ -0,0 +1,151 @@
+# app/services/rag_cache.py
+"""Semantic cache for RAG policy lookups.
+
+Paraphrased questions ("how many vacation days?" / "what's the PTO
+allowance?") embed to nearly the same vector, so a cosine-similarity match
+against previously answered queries lets us reuse their retrieved chunks
+and skip the vector search. The query is embedded once and that vector is
+reused for the Chroma search on a miss. Verbatim repeats are answered from
+an exact-match map before any embedding call is made.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+from app.services import rag
+
+
+class SemanticCache:
+    """In-process cache of RAG results keyed by query embedding similarity.
+
+    Embeddings are stored as rows of a normalized float32 matrix so a lookup
+    is a single matrix-vector product. Query strings seen before (up to
+    *max_exact* of them, LRU) skip the embedding call entirely. Entries expire
+    after *ttl* seconds and are dropped wholesale whenever the policy index
+    changes.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        ttl: float = 600.0,
+        max_entries: int = 1024,
+        max_exact: int = 256,
+    ):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_exact = max_exact
+        self._lock = threading.Lock()
+        self._matrix = None  # np.ndarray [N, D], rows L2-normalized
+        self._entries: list[tuple[int, float, list[dict]]] = []  # (n_results, expires_at, results)
+        self._exact: "OrderedDict[tuple[str, int], tuple[float, list[dict]]]" = OrderedDict()
+        self._index_version = rag.index_version
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._matrix = None
+            self._entries = []
+            self._exact.clear()
+            self._index_version = rag.index_version
+
+    def lookup_exact(self, query: str, n_results: int) -> Optional[list[dict]]:
+        """Return cached results for this exact query string, if any."""
+        if self._index_version != rag.index_version:
+            self.clear()
+
+        key = (query, n_results)
+        with self._lock:
+            entry = self._exact.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._exact[key]
+                return None
+            self._exact.move_to_end(key)
+            return entry[1]
+
+    def store_exact(self, query: str, n_results: int, results: list[dict]) -> None:
+        """Remember the results for this exact query string."""
+        with self._lock:
+            self._exact[(query, n_results)] = (time.monotonic() + self.ttl, results)
+            self._exact.move_to_end((query, n_results))
+            while len(self._exact) > self.max_exact:
+                self._exact.popitem(last=False)
+
+    def lookup(self, embedding, n_results: int) -> Optional[list[dict]]:
+        """Return cached results for a sufficiently similar query, if any."""
+        if self._index_version != rag.index_version:
+            self.clear()
+
+        with self._lock:
+            if self._matrix is None:
+                return None
+            query = _normalize(np.asarray(embedding, dtype=np.float32))
+            scores = self._matrix @ query
+            now = time.monotonic()
+            for idx in np.argsort(scores)[::-1]:
+                if scores[idx] < self.threshold:
+                    break
+                entry_n, expires_at, results = self._entries[idx]
+                if entry_n == n_results and expires_at > now:
+                    return results
+        return None
+
+    def store(self, embedding, n_results: int, results: list[dict]) -> None:
+        """Cache the results retrieved for a query embedding."""
+        row = _normalize(np.asarray(embedding, dtype=np.float32))[np.newaxis, :]
+        entry = (n_results, time.monotonic() + self.ttl, results)
+
+        with self._lock:
+            if self._matrix is None or self._matrix.shape[1] != row.shape[1]:
+                # First entry, or the embedding provider changed dimensions
+                self._matrix = row
+                self._entries = [entry]
+                return
+            self._matrix = np.vstack([self._matrix, row])
+            self._entries.append(entry)
+            if len(self._entries) > self.max_entries:
+                # Evict oldest entries first
+                overflow = len(self._entries) - self.max_entries
+                self._matrix = self._matrix[overflow:]
+                self._entries = self._entries[overflow:]
+
+    def get_or_compute(self, query: str, n_results: int = 5) -> list[dict]:
+        """Return policy chunks for *query*, from cache when the same or a similar query was seen."""
+        cached = self.lookup_exact(query, n_results)
+        if cached is not None:
+            return cached
+
+        embedding = rag.embed_query(query)
+        if embedding is None:
+            # No API embeddings (default model / mock mode) — only exact repeats are cached
+            results = rag.query_policies(query, n_results=n_results)
+        else:
+            results = self.lookup(embedding, n_results)
+            if results is None:
+                results = rag.query_policies(query, n_results=n_results, query_embedding=embedding)
+                self.store(embedding, n_results, results)
+
+        self.store_exact(query, n_results, results)
+        return results
+
+
+def _normalize(vector):
+    """L2-normalize a vector (zero vectors are returned unchanged)."""
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+# Shared cache for chat / policy Q&A lookups
+policy_cache = SemanticCache()
+
+
+def get_or_compute(query: str, n_results: int = 5) -> list[dict]:
+    """Query policies through the shared semantic cache."""
+    return policy_cache.get_or_compute(query, n_results=n_results)
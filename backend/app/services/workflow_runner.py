@@ -0,0 +1,100 @@
+# app/services/workflow_runner.py
+"""Background execution of onboarding workflows.
+
+By default workflows run as tasks on the API process's event loop. With
+WORKFLOW_PROCESS_WORKERS > 0 they are handed to a pool of worker processes
+instead, each driving its own event loop and DB session, so the CPU-bound
+parts of many concurrent workflows (JSON, prompt formatting, ORM
+bookkeeping) aren't serialized behind one GIL.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+
+from app.config import settings
+from app.database import SessionLocal
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+# Worker processes only: the one event loop every job in the process runs
+# on. Provider clients, the Redis client and the provider semaphores are
+# cached per process and bound to the loop they were first used on.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Strong references so in-loop runs aren't garbage-collected mid-flight
+_tasks: set[asyncio.Task] = set()
+
+
+async def _run(workflow_id: int) -> None:
+    """Run a workflow's outstanding steps with its own DB session."""
+    from app.services.orchestrator import run_workflow
+
+    # Session checks a connection out of the (per-process) engine pool and
+    # returns it on exit. Not expired on commit: the run commits after each
+    # step and would otherwise reload every step and the employee each time.
+    with SessionLocal(expire_on_commit=False) as db:
+        try:
+            await run_workflow(db, workflow_id)
+        except Exception as e:
+            print(f"⚠️  Background workflow {workflow_id} error: {e}")
+
+
+def _init_worker() -> None:
+    """Worker-process initializer: create the loop all of its jobs share."""
+    global _worker_loop
+
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+
+
+def _run_in_worker(workflow_id: int) -> None:
+    """Worker-process entry point: run one workflow on the worker's loop."""
+    _worker_loop.run_until_complete(_run(workflow_id))
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Return the shared worker pool, creating it on first use."""
+    global _executor
+
+    if _executor is None:
+        # spawn, not fork: children must not inherit the parent's DB
+        # connections, HTTP clients or event loop
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.WORKFLOW_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+    return _executor
+
+
+def _report_worker_error(future: Future) -> None:
+    """Log failures that happen outside run_workflow (e.g. a worker crash or SessionLocal())."""
+    if not future.cancelled() and future.exception() is not None:
+        print(f"⚠️  Workflow worker failed: {future.exception()}")
+
+
+def enqueue_workflow(workflow_id: int, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+    """Run a workflow's outstanding steps in the background.
+
+    Call from the application's event loop, or pass that *loop* when calling
+    from another thread (e.g. a sync route running in the threadpool).
+    """
+    if settings.WORKFLOW_PROCESS_WORKERS > 0:
+        _get_executor().submit(_run_in_worker, workflow_id).add_done_callback(_report_worker_error)
+    elif loop is not None:
+        asyncio.run_coroutine_threadsafe(_run(workflow_id), loop).add_done_callback(_report_worker_error)
+    else:
+        task = asyncio.get_running_loop().create_task(_run(workflow_id))
+        _tasks.add(task)
+        task.add_done_callback(_tasks.discard)
+
+
+def shutdown() -> None:
+    """Stop the worker pool, if one was started (call on app shutdown)."""
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -101,6 +101,8 @@ function getEventTypeColor(type: string) {
       return "text-green-400";
     case "think":
       return "text-purple-400";
+    case "token":
+      return "text-foreground whitespace-pre-wrap";
     case "active":
       return "text-cyan-400";
     case "error":
@@ -756,26 +758,19 @@ export default function OnboardingWorkflowPage() {
             <pre className="whitespace-pre-wrap text-sm font-sans leading-relaxed text-foreground">
                 {(() => {
                   if (!viewingStep?.result) return "";
-                  try {
-                    const parsed = JSON.parse(viewingStep.result);
-                    // Extract readable content from JSON
-                    if (parsed.content) return parsed.content;
-                    if (parsed.ai_summary) return parsed.ai_summary;
-                    if (parsed.events) {
-                      return parsed.events
-                        .map((e: { title: string; date: string; status: string }) =>
-                          `📅 ${e.title}\n   Date: ${e.date}\n   Status: ${e.status}`
-                        )
-                        .join("\n\n");
-                    }
-                    if (parsed.parsed_data && parsed.ai_summary) {
-                      return parsed.ai_summary;
-                    }
-                    // Fallback: pretty-print JSON
-                    return JSON.stringify(parsed, null, 2);
-                  } catch {
-                    return viewingStep.result;
+                  const result = viewingStep.result;
+                  // Extract readable content from the step payload
+                  if (result.content) return result.content;
+                  if (result.ai_summary) return result.ai_summary;
+                  if (result.events) {
+                    return result.events
+                      .map((e) =>
+                        `📅 ${e.title}\n   Date: ${e.date}\n   Status: ${e.status}`
+                      )
+                      .join("\n\n");
                   }
+                  // Fallback: pretty-print JSON
+                  return JSON.stringify(result, null, 2);
                 })()}
               </pre>
           </div>
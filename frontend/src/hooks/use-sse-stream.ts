@@ -3,6 +3,33 @@
 import { useState, useEffect, useCallback, useRef } from "react";
 import { AgentEvent } from "@/types";
 
+// The server sends each AgentEvent as a named SSE event (`event: <type>`)
+const AGENT_EVENT_TYPES: AgentEvent["type"][] = [
+  "init",
+  "task",
+  "done",
+  "think",
+  "token",
+  "active",
+  "error",
+  "step_update",
+  "approval_gate",
+];
+
+// Append a "token" delta to the step's streamed output entry, or start one.
+// Steps run concurrently, so the entry isn't necessarily the last event.
+function appendToken(prev: AgentEvent[], token: AgentEvent): AgentEvent[] {
+  for (let i = prev.length - 1; i >= 0; i--) {
+    const event = prev[i];
+    if (event.step_type !== token.step_type) continue;
+    if (event.type !== "token") break;
+    const next = prev.slice();
+    next[i] = { ...event, message: event.message + token.message };
+    return next;
+  }
+  return [...prev, token];
+}
+
 interface UseSSEStreamOptions {
   onEvent?: (event: AgentEvent) => void;
   onError?: (error: Error) => void;
@@ -34,10 +61,12 @@ export function useSSEStream(url: string | null, options: UseSSEStreamOptions =
       setError(null);
     };
 
-    eventSource.onmessage = (event) => {
+    const handleEvent = (event: Event) => {
+      // Connection failures also arrive as "error" events, but without data
+      if (!(event instanceof MessageEvent)) return;
       try {
-        const data = JSON.parse(event.data) as AgentEvent;
-        setEvents((prev) => [...prev, data]);
+        const data = { ...JSON.parse(event.data), type: event.type } as AgentEvent;
+        setEvents((prev) => (data.type === "token" ? appendToken(prev, data) : [...prev, data]));
         callbacksRef.current.onEvent?.(data);
 
         // Check for completion
@@ -49,7 +78,13 @@ export function useSSEStream(url: string | null, options: UseSSEStreamOptions =
       }
     };
 
-    eventSource.onerror = () => {
+    for (const type of AGENT_EVENT_TYPES) {
+      eventSource.addEventListener(type, handleEvent);
+    }
+
+    eventSource.onerror = (event) => {
+      // A workflow "error" event is a message, not a connection failure
+      if (event instanceof MessageEvent) return;
       const err = new Error("SSE connection error");
       setError(err);
       setIsConnected(false);
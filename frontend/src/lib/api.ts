@@ -54,11 +54,11 @@ export function clearToken() {
   }
 }
 
-// Base fetch with auth
-async function apiFetch<T>(
+// Base request with auth; throws on non-2xx responses
+async function apiRequest(
   endpoint: string,
   options: RequestInit = {}
-): Promise<T> {
+): Promise<Response> {
   const token = getToken();
   const headers: Record<string, string> = {
     ...((options.headers as Record<string, string>) || {}),
@@ -93,9 +93,34 @@ async function apiFetch<T>(
     throw error;
   }
 
+  return response;
+}
+
+// Base fetch with auth, returning the parsed JSON body
+async function apiFetch<T>(
+  endpoint: string,
+  options: RequestInit = {}
+): Promise<T> {
+  const response = await apiRequest(endpoint, options);
   return response.json();
 }
 
+// Fetch every page of a keyset-paginated list endpoint. The server sends
+// X-Next-Cursor / X-Next-Cursor-Id while more rows may follow.
+async function apiFetchAll<T>(endpoint: string): Promise<T[]> {
+  const items: T[] = [];
+  const separator = endpoint.includes("?") ? "&" : "?";
+  let url = endpoint;
+  for (;;) {
+    const response = await apiRequest(url);
+    items.push(...((await response.json()) as T[]));
+    const cursor = response.headers.get("X-Next-Cursor");
+    const cursorId = response.headers.get("X-Next-Cursor-Id");
+    if (!cursor || !cursorId) return items;
+    url = `${endpoint}${separator}cursor=${encodeURIComponent(cursor)}&cursor_id=${cursorId}`;
+  }
+}
+
 // Auth API
 export const authApi = {
   signup: (data: UserCreate): Promise<User> =>
@@ -139,7 +164,7 @@ export const authApi = {
 
 // Employee API
 export const employeeApi = {
-  list: (): Promise<Employee[]> => apiFetch("/api/employees/"),
+  list: (): Promise<Employee[]> => apiFetchAll("/api/employees/"),
 
   get: (id: number): Promise<Employee> => apiFetch(`/api/employees/${id}`),
 
@@ -280,7 +305,7 @@ export const documentApi = {
 // Approval API
 export const approvalApi = {
   list: (): Promise<ApprovalRequest[]> =>
-    apiFetch("/api/approvals"),
+    apiFetchAll("/api/approvals/"),
 
   getPendingCount: (): Promise<{ count: number }> =>
     apiFetch("/api/approvals/pending/count"),
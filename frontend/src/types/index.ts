@@ -94,12 +94,21 @@ export type StepStatus = "pending" | "running" | "completed" | "failed" | "skipp
 
 export type WorkflowStatus = "pending" | "running" | "paused" | "awaiting_approval" | "completed" | "failed";
 
+// Step output payload (fields depend on the step type)
+export interface StepResult {
+  type?: string;
+  content?: string;
+  ai_summary?: string;
+  events?: { title: string; date: string; status: string }[];
+  [key: string]: unknown;
+}
+
 export interface OnboardingStep {
   id: number;
   step_type: StepType;
   step_order: number;
   status: StepStatus;
-  result: string | null;
+  result: StepResult | null;
   error_message: string | null;
   started_at: string | null;
   completed_at: string | null;
@@ -247,7 +256,8 @@ export interface BulkUploadResponse {
 
 // SSE Event types for agent activity
 export interface AgentEvent {
-  type: "init" | "task" | "done" | "think" | "active" | "error" | "step_update" | "approval_gate";
+  type: "init" | "task" | "done" | "think" | "token" | "active" | "error" | "step_update" | "approval_gate";
+  // For "token" events, a delta of the step's generated text
   message: string;
   timestamp: string;
   step_type?: StepType;